@@ -169,7 +169,7 @@ def parent():
             self.on_rerender_spy = Mock()
             super().__init__(self.dummy)
 
-        def _reconcile(self):
+        def _on_child_rerender(self):
             self.on_rerender_spy()
 
         # dummy method to use as on_rerender or interval method
@@ -210,6 +210,20 @@ def render():
     return render
 
 
+@pytest.fixture
+def same_image():
+    # images handed out by the render cache are read-only, which Pillow's
+    # equality also compares, so compare what the images contain instead
+    def same_image(image_one, image_two):
+        return (image_one.mode, image_one.size, image_one.tobytes()) == (
+            image_two.mode,
+            image_two.size,
+            image_two.tobytes(),
+        )
+
+    return same_image
+
+
 @pytest.fixture
 def get_test_image_path():
     def get_test_image_path(image_name):
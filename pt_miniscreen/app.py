@@ -2,12 +2,15 @@ import logging
 import traceback
 from os import environ
 from threading import Timer
-from pt_miniscreen.utils import ButtonEvents
+from pt_miniscreen.utils import ButtonEvents, get_images_directory
 
 from pitop.system.pitop import Pitop
 
 
 from .core import App as BaseApp
+from .core.asset_store import AssetStore, add_asset_store
+from .core.display import SSD1306DisplaySink
+from .core.utils import preload_fonts
 from .root import RootComponent
 
 logger = logging.getLogger(__name__)
@@ -16,6 +19,10 @@ logger = logging.getLogger(__name__)
 class App(BaseApp):
     DIMMING_TIMEOUT = 20
     SCREENSAVER_TIMEOUT = 20
+    MAX_FPS = 30
+
+    # sizes of the fonts used by the menus
+    FONT_SIZES = (8, 9, 10, 12, 13, 14, 16, 20)
 
     def __init__(self, miniscreen=None):
         self.miniscreen = miniscreen
@@ -28,6 +35,12 @@ class App(BaseApp):
 
         logger.debug("Initialising app...")
 
+        # load fonts up front so opening a menu doesn't have to load them
+        preload_fonts(self.FONT_SIZES)
+
+        # index the images so icons are decoded once and kept for the app's life
+        add_asset_store(AssetStore(get_images_directory()))
+
         # display should be `miniscreen.display_image` but that method attempts to
         # import opencv when it's called. We can catch the raised error but cannot
         # prevent the module search. This produces overhead when display is called
@@ -35,6 +48,8 @@ class App(BaseApp):
         # since the module was not found so the search happens every import attempt
         super().__init__(
             display=self.miniscreen.device.display,
+            display_sink=SSD1306DisplaySink(self.miniscreen.device),
+            max_fps=self.MAX_FPS,
             size=self.miniscreen.size,
             Root=RootComponent,
         )
@@ -126,6 +141,7 @@ class App(BaseApp):
 
         self.brighten()
         self.restart_dimming_timer()
+        self.invalidate_display()
         self.display()
 
     def display(self):
@@ -71,7 +71,7 @@ class ActionPage(Component, Actionable):
         self.state.update({"action_state": self._calculate_action_state()})
 
     def on_state_change(self, previous_state):
-        if self.state["action_state"] != previous_state["action_state"]:
+        if "action_state" in previous_state:
             self.status_icon_component.state.update(
                 {"image_path": image_paths[self.state["action_state"]]}
             )
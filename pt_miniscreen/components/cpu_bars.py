@@ -1,25 +1,36 @@
 import logging
 
+from operator import attrgetter
+
 import PIL.ImageDraw
-from psutil import cpu_percent
 
 from pt_miniscreen.core.component import Component
+from pt_miniscreen.system_metrics import SYSTEM_METRICS, get_system_metrics_sampler
 
 logger = logging.getLogger(__name__)
 
 
 class CPUBars(Component):
     def __init__(self, **kwargs):
-        percentages = cpu_percent(percpu=True)
-        super().__init__(**kwargs, initial_state={"percentages": percentages})
-        self.create_interval(self.update_percentages)
-
-    def update_percentages(self):
-        percentages = cpu_percent(interval=0.5, percpu=True)
+        # start from the last sample, the subscription delivers a new one
+        sample = get_system_metrics_sampler().last_sample
+        super().__init__(
+            **kwargs,
+            initial_state={
+                "percentages": sample.cpu_percentages if sample is not None else None
+            },
+        )
+        self.subscribe(
+            SYSTEM_METRICS,
+            self.update_percentages,
+            select=attrgetter("cpu_percentages"),
+        )
+
+    def update_percentages(self, percentages):
         self.state.update({"percentages": percentages})
 
     def render(self, image):
-        percentages = self.state["percentages"]
+        percentages = self.state["percentages"] or []
         space_between_bars = 4
         num_bars = len(percentages)
         width_cpu = image.width / num_bars if num_bars > 0 else 1
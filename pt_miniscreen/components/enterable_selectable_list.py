@@ -13,12 +13,15 @@ class EnterableSelectableList(SelectableList, Navigable, Enterable, HasGutterIco
         self,
         Rows,
         num_visible_rows=5,
+        virtual=True,
         **kwargs,
     ) -> None:
+        # only the visible rows are created so long lists of projects are cheap
         SelectableList.__init__(
             self,
             Rows=Rows,
             num_visible_rows=num_visible_rows,
+            virtual=virtual,
             **kwargs,
         )
 
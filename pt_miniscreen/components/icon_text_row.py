@@ -13,6 +13,8 @@ class IconTextRow(Row):
         self,
         text="",
         get_text=None,
+        text_provider=None,
+        select_text=None,
         font_size=10,
         icon_path=None,
         icon_column_width=15,
@@ -33,6 +35,8 @@ class IconTextRow(Row):
                     MarqueeText,
                     text=text,
                     get_text=get_text,
+                    text_provider=text_provider,
+                    select_text=select_text,
                     font_size=font_size,
                     vertical_align=text_vertical_align,
                 ),
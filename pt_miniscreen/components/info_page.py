@@ -31,6 +31,9 @@ class InfoPage(Component):
         )
         self.list = self.create_child(List, Rows=Rows, row_gap=3)
 
+    def layout_key(self):
+        return self.title.state["font"].size
+
     def render(self, image):
         padding_top = 1
         padding_bottom = 3
@@ -21,7 +21,7 @@ class ProgressBar(Component):
 
         if callable(progress):
             self._get_progress = progress
-            self.create_interval(self.update_progress)
+            self.create_interval(self.update_progress, blocking=True)
 
     def update_progress(self):
         self.state.update({"progress": self._get_progress()})
@@ -30,10 +30,10 @@ class RightGutter(Component):
         self.lower_icon = self.create_child(Image, image_path=lower_icon_path)
 
     def on_state_change(self, previous_state):
-        if self.state["upper_icon_path"] != previous_state["upper_icon_path"]:
+        if "upper_icon_path" in previous_state:
             self.upper_icon.state.update({"image_path": self.state["upper_icon_path"]})
 
-        if self.state["lower_icon_path"] != previous_state["lower_icon_path"]:
+        if "lower_icon_path" in previous_state:
             self.lower_icon.state.update({"image_path": self.state["lower_icon_path"]})
 
     def render(self, image):
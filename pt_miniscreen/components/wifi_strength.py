@@ -2,6 +2,7 @@ import PIL.ImageDraw
 from pitop.common.sys_info import get_network_strength
 
 from pt_miniscreen.core.component import Component
+from pt_miniscreen.core.providers import register_provider
 
 
 def get_wifi_strength():
@@ -10,12 +11,13 @@ def get_wifi_strength():
 
 class WifiStrength(Component):
     def __init__(self, **kwargs):
-        super().__init__(**kwargs, initial_state={"wifi_strength": get_wifi_strength()})
+        register_provider("wifi_strength", get_wifi_strength)
+        super().__init__(**kwargs, initial_state={"wifi_strength": 0})
 
-        self.create_interval(self.update_wifi_strength)
+        self.subscribe("wifi_strength", self.update_wifi_strength)
 
-    def update_wifi_strength(self):
-        self.state.update({"wifi_strength": get_wifi_strength()})
+    def update_wifi_strength(self, wifi_strength):
+        self.state.update({"wifi_strength": wifi_strength})
 
     def render(self, image):
         wifi_strength = self.state["wifi_strength"]
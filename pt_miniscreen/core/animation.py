@@ -0,0 +1,173 @@
+import logging
+import threading
+from collections import deque, namedtuple
+from math import ceil, floor
+from time import perf_counter, sleep
+
+logger = logging.getLogger(__name__)
+
+# used when no render scheduler is ticking the clock
+DEFAULT_FRAME_INTERVAL = 1 / 60
+DEFAULT_HISTORY_LENGTH = 50
+
+
+def linear(progress):
+    return progress
+
+
+def ease_in(progress):
+    return progress * progress
+
+
+def ease_out(progress):
+    return 1 - (1 - progress) * (1 - progress)
+
+
+def ease_in_out(progress):
+    if progress < 0.5:
+        return 2 * progress * progress
+
+    return 1 - 2 * (1 - progress) * (1 - progress)
+
+
+EASINGS = {
+    "linear": linear,
+    "ease_in": ease_in,
+    "ease_out": ease_out,
+    "ease_in_out": ease_in_out,
+}
+
+TransitionStats = namedtuple(
+    "TransitionStats",
+    ["distance", "duration", "easing", "elapsed", "frames", "fps", "dropped_frames"],
+)
+
+
+class AnimationClock:
+    """Clock that steps transitions in time with the frames being displayed.
+
+    The render scheduler ticks the clock after every frame it displays, each
+    transition waits for the next tick before taking a step so steps are not
+    produced faster than they can be shown. Steps are calculated from the time
+    elapsed since the transition started, so frames that take longer than
+    their budget are dropped by taking a larger step and transitions finish on
+    time. Without a scheduler the clock waits a fixed frame interval instead.
+    """
+
+    def __init__(
+        self,
+        frame_interval=DEFAULT_FRAME_INTERVAL,
+        history_length=DEFAULT_HISTORY_LENGTH,
+    ):
+        self.default_frame_interval = frame_interval
+        self._condition = threading.Condition()
+        self._ticks = 0
+        self._drivers = []
+        self._history = deque(maxlen=history_length)
+
+    @property
+    def frame_interval(self):
+        with self._condition:
+            if self._drivers:
+                return self._drivers[-1]
+
+            return self.default_frame_interval
+
+    @property
+    def is_driven(self):
+        with self._condition:
+            return len(self._drivers) > 0
+
+    @property
+    def transition_stats(self):
+        with self._condition:
+            return list(self._history)
+
+    def attach(self, frame_interval):
+        with self._condition:
+            self._drivers.append(frame_interval)
+
+    def detach(self, frame_interval):
+        with self._condition:
+            if frame_interval in self._drivers:
+                self._drivers.remove(frame_interval)
+
+            # transitions waiting for a tick continue without one
+            self._condition.notify_all()
+
+    def tick(self):
+        with self._condition:
+            self._ticks += 1
+            self._condition.notify_all()
+
+    def wait_for_tick(self, timeout):
+        with self._condition:
+            if not self._drivers:
+                driven = False
+            else:
+                driven = True
+                ticks = self._ticks
+                self._condition.wait_for(lambda: self._ticks != ticks, timeout)
+
+        if not driven:
+            sleep(timeout)
+
+    def transition(self, distance, duration, easing="linear"):
+        """Yield steps that add up to `distance` over `duration` seconds."""
+        if distance <= 0:
+            return
+
+        ease = EASINGS[easing] if isinstance(easing, str) else easing
+        start_time = perf_counter()
+        travelled = 0
+        frames = 0
+
+        while travelled < distance:
+            frame_interval = self.frame_interval
+            remaining_time = duration - (perf_counter() - start_time)
+            if remaining_time > 0:
+                self.wait_for_tick(min(frame_interval, remaining_time))
+
+            elapsed_time = perf_counter() - start_time
+            progress = min(elapsed_time / duration, 1) if duration > 0 else 1
+
+            # the last pixel is only travelled once the duration has passed
+            target = (
+                distance
+                if progress >= 1
+                else min(floor(distance * ease(progress)), distance - 1)
+            )
+            step = target - travelled
+
+            # easing can make steps smaller than a pixel
+            if step <= 0:
+                continue
+
+            frames += 1
+            yield step
+
+            travelled = travelled + step
+
+        elapsed_time = perf_counter() - start_time
+        expected_frames = max(ceil(duration / self.frame_interval), 1)
+        stats = TransitionStats(
+            distance=distance,
+            duration=duration,
+            easing=getattr(ease, "__name__", repr(ease)),
+            elapsed=elapsed_time,
+            frames=frames,
+            fps=frames / elapsed_time if elapsed_time > 0 else None,
+            dropped_frames=max(min(expected_frames, distance) - frames, 0),
+        )
+
+        with self._condition:
+            self._history.append(stats)
+
+        logger.debug(f"transition took {elapsed_time} seconds: {stats}")
+
+
+_animation_clock = AnimationClock()
+
+
+def get_animation_clock():
+    return _animation_clock
@@ -1,24 +1,77 @@
 import datetime
 import logging
+import signal
+import threading
 from os import environ
 from pathlib import Path
-from threading import Event
+from threading import Event, Lock
 
 from PIL import Image
 
+from .display import FullFrameDisplaySink, get_changed_regions
+from .frame import Frame
+from .profiler import (
+    DEFAULT_EXPORT_INTERVAL,
+    ProfileExporter,
+    enable_render_profiler,
+)
+from .scheduler import RenderScheduler
+
 logger = logging.getLogger(__name__)
 
 
 class App:
-    def __init__(self, display=None, Root=None, size=(128, 64), image_mode="1"):
+    def __init__(
+        self,
+        display=None,
+        Root=None,
+        size=(128, 64),
+        image_mode="1",
+        display_sink=None,
+        max_fps=None,
+    ):
         assert display is not None
         assert Root is not None
         self._display = display
+        self._display_sink = display_sink or FullFrameDisplaySink(display)
+        self._displayed_frame = None
+        self._display_lock = Lock()
         self.Root = Root
 
+        # rerenders are displayed on the thread that caused them unless a max
+        # fps is set, then they are coalesced and displayed on a render thread
+        self._render_scheduler = (
+            RenderScheduler(
+                self._display_scheduled_frame, max_fps=max_fps, on_error=self.stop
+            )
+            if max_fps is not None
+            else None
+        )
+
         self.image_mode = image_mode
         self.size = size
 
+        # debug: profile renders, the tree of render times is logged when
+        # the process receives SIGUSR1 and summaries are exported to a file
+        self._profiler = None
+        self._profile_exporter = None
+        self._log_profile_event = Event()
+        self._previous_sigusr1_handler = None
+        if environ.get("PT_MINISCREEN_PROFILE", "0") == "1":
+            self._profiler = enable_render_profiler()
+
+            profile_file = environ.get("PT_MINISCREEN_PROFILE_FILE")
+            if profile_file:
+                self._profile_exporter = ProfileExporter(
+                    self._profiler,
+                    profile_file,
+                    interval=float(
+                        environ.get(
+                            "PT_MINISCREEN_PROFILE_INTERVAL", DEFAULT_EXPORT_INTERVAL
+                        )
+                    ),
+                )
+
         self._stop_event = Event()
         self.saved_cache_frame_no = 0
         self.timestamp = (
@@ -28,25 +81,111 @@ class App:
             .replace(":", "-")
         )
 
+    @property
+    def render_stats(self):
+        if self._render_scheduler is None:
+            return None
+
+        return self._render_scheduler.stats
+
     def start(self):
-        self.root = self.Root(on_rerender=self.display)
+        self.root = self.Root(on_rerender=self._on_root_rerender)
         self.root._set_active(True)
+        if self._render_scheduler is not None:
+            self._render_scheduler.start()
+
+        if self._profiler is not None:
+            self._start_profiling()
+
         self.display()
 
     def stop(self, error=None):
+        if self._render_scheduler is not None:
+            self._render_scheduler.stop()
+
+        if self._profile_exporter is not None:
+            self._profile_exporter.stop()
+
         if self.root:
             self.root._cleanup()
             self.root = None
-        self._stop_error = error
+
+        # keep the error of a render that failed while the app was stopping
+        if error is not None or not self._stop_event.is_set():
+            self._stop_error = error
         self._stop_event.set()
 
+        if self._previous_sigusr1_handler is not None:
+            self._stop_profile_signal()
+
     def wait_for_stop(self) -> None:
         self._stop_event.wait()
         error = getattr(self, "_stop_error", None)
         if isinstance(error, Exception):
             raise error
 
+    def _start_profiling(self):
+        if self._profile_exporter is not None:
+            self._profile_exporter.start()
+
+        # signal handlers can only be set from the main thread
+        if threading.current_thread() is threading.main_thread():
+            threading.Thread(
+                target=self._run_profile_logger, name="ProfileLogger", daemon=True
+            ).start()
+            self._previous_sigusr1_handler = (
+                signal.getsignal(signal.SIGUSR1) or signal.SIG_DFL
+            )
+            signal.signal(signal.SIGUSR1, self._on_sigusr1)
+
+    def _stop_profile_signal(self):
+        # restore the handler first so setting the event can't be interrupted
+        # by a signal that sets it again
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGUSR1, self._previous_sigusr1_handler)
+            self._previous_sigusr1_handler = None
+
+        self._log_profile_event.set()
+
+    def _on_sigusr1(self, *_):
+        # the handler runs on the main thread between any two instructions,
+        # possibly while it holds the profiler lock, so only wake the logger
+        self._log_profile_event.set()
+
+    def _run_profile_logger(self):
+        while True:
+            self._log_profile_event.wait()
+            self._log_profile_event.clear()
+            if self._stop_event.is_set() or getattr(self, "root", None) is None:
+                return
+
+            self.log_render_profile()
+
+    def log_render_profile(self):
+        if self._profiler is None or getattr(self, "root", None) is None:
+            return
+
+        logger.info(f"Render profile:\n{self._profiler.format_tree(self.root)}")
+        if self._profile_exporter is not None:
+            self._profile_exporter.export()
+
+    def _on_root_rerender(self):
+        if self._render_scheduler is not None:
+            self._render_scheduler.invalidate()
+            return
+
+        self.display()
+
+    def _display_scheduled_frame(self):
+        # the app may have been stopped since the frame was scheduled
+        if getattr(self, "root", None) is not None:
+            self.display()
+
     def display(self):
+        with self._display_lock:
+            self._render_and_display()
+
+    def _render_and_display(self):
         image = self.root.render(Image.new(self.image_mode, self.size))
 
         # debug: print displayed image in terminal
@@ -62,5 +201,18 @@ class App:
             image.save(path / f"{str(self.saved_cache_frame_no).zfill(4)}.png")
             self.saved_cache_frame_no += 1
 
+        # only send the regions that changed since the last displayed frame
+        frame = Frame.from_image(image) if isinstance(image, Image.Image) else None
+        regions = get_changed_regions(self._displayed_frame, frame)
+        if regions == []:
+            logger.debug("Display unchanged")
+            return
+
         logger.debug("Update display")
-        self._display(image)
+        self._display_sink.display(image, regions)
+        self._displayed_frame = frame
+
+    def invalidate_display(self):
+        # the next image displayed is sent in full, used when something other
+        # than the app may have changed what the display is showing
+        self._displayed_frame = None
@@ -0,0 +1,99 @@
+import logging
+import threading
+from os import path, walk
+
+from PIL.Image import BICUBIC
+
+from .image_cache import decode_frames, get_frames_bytes, get_image_frame_cache
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = (".png", ".gif", ".bmp")
+
+
+class AssetStore:
+    """Index of the images in a directory whose decoded frames are kept forever.
+
+    The directory is indexed when the store is created but files are only
+    decoded the first time they are used. Assets are a small fixed set of
+    icons so decoded frames are never evicted, once an asset is loaded
+    swapping to it is a dictionary lookup.
+    """
+
+    def __init__(self, directory):
+        self.directory = path.abspath(directory)
+        self._index = {}
+        self._entries = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+        for root, _, file_names in walk(self.directory):
+            for file_name in file_names:
+                if file_name.lower().endswith(IMAGE_EXTENSIONS):
+                    file_path = path.join(root, file_name)
+                    name = path.relpath(file_path, self.directory)
+                    self._index[file_path] = name
+
+        logger.debug(f"Indexed {len(self._index)} assets in {self.directory}")
+
+    def __contains__(self, file_path):
+        return file_path in self._index
+
+    @property
+    def names(self):
+        return sorted(self._index.values())
+
+    @property
+    def stats(self):
+        with self._lock:
+            return {
+                "assets": len(self._index),
+                "entries": len(self._entries),
+                "bytes": sum(map(get_frames_bytes, self._entries.values())),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def get(self, file_path, size=None, resampling=BICUBIC, mode="1"):
+        if file_path not in self._index:
+            raise KeyError(f"{file_path} is not an asset in {self.directory}")
+
+        key = (file_path, tuple(size) if size else None, resampling, mode)
+
+        with self._lock:
+            image_frames = self._entries.get(key)
+            if image_frames is not None:
+                self.hits += 1
+                return image_frames
+
+            self.misses += 1
+
+        image_frames = decode_frames(
+            file_path, size=size, resampling=resampling, mode=mode
+        )
+
+        with self._lock:
+            return self._entries.setdefault(key, image_frames)
+
+
+_asset_stores = {}
+_asset_stores_lock = threading.Lock()
+
+
+def add_asset_store(asset_store):
+    with _asset_stores_lock:
+        _asset_stores[asset_store.directory] = asset_store
+
+
+def get_image_frames(file_path, size=None, resampling=BICUBIC, mode="1"):
+    """Get the decoded frames of an image, from an asset store if it has it."""
+    with _asset_stores_lock:
+        asset_stores = list(_asset_stores.values())
+
+    for asset_store in asset_stores:
+        if file_path in asset_store:
+            return asset_store.get(file_path, size, resampling, mode)
+
+    return get_image_frame_cache().get(file_path, size, resampling, mode)
@@ -1,12 +1,17 @@
 import logging
 import threading
-from time import sleep, time
+from contextlib import contextmanager
+from time import monotonic, perf_counter
 from typing import Any, Dict
 from weakref import WeakMethod, ref
 
 from PIL import Image
 
-from .utils import is_same_image
+from .frame import Frame
+from .profiler import get_render_profiler
+from .providers import get_provider_registry
+from .timer_wheel import ActiveEvent, get_timer_wheel
+from .utils import Layer, boxes_overlap, record_layers
 
 logger = logging.getLogger(__name__)
 
@@ -23,17 +28,41 @@ class StateAccessException(Exception):
     pass
 
 
-# Inherit from Timer so that Interval shares the same API
-class Interval(threading.Timer):
+# Intervals share the timer wheel rather than running a thread each, they keep
+# the same API as threading.Timer
+class Interval:
     def __init__(
         self,
-        *args,
+        interval,
+        function,
+        args=None,
+        kwargs=None,
         active_event=None,
-        **kwargs,
+        name=None,
+        blocking=False,
     ):
-        super().__init__(*args, **kwargs)
-        self.get_active_event = ref(active_event)
-        self.daemon = True  # Intervals shouldn't keep the process alive
+        self.interval = interval
+        self.function = function
+        self.args = args if args is not None else []
+        self.kwargs = kwargs if kwargs is not None else {}
+        self.name = name or getattr(function, "__qualname__", repr(function))
+        self.blocking = blocking
+        self.finished = threading.Event()
+        self.get_active_event = (
+            ref(active_event) if active_event is not None else lambda: None
+        )
+
+        # runs aim at absolute deadlines so slow callbacks don't cause drift
+        self._deadline = None
+
+        # metrics used to find slow or lagging intervals
+        self.runs = 0
+        self.last_run_duration = None
+        self.max_lag = 0
+        self.missed_deadlines = 0
+
+    def __repr__(self):
+        return f"<Interval {self.name} every {self.interval}s>"
 
     @property
     def function(self):
@@ -46,81 +75,213 @@ class Interval(threading.Timer):
         # would result in memory leaks.
         self._get_function = WeakMethod(next_value)
 
-    # override run to execute function every `interval` seconds
-    def run(self):
-        execution_time = 0
+    @property
+    def metrics(self):
+        return {
+            "name": self.name,
+            "interval": self.interval,
+            "runs": self.runs,
+            "last_run_duration": self.last_run_duration,
+            "max_lag": self.max_lag,
+            "missed_deadlines": self.missed_deadlines,
+        }
+
+    def start(self):
+        self._wait_for_active()
+
+    def cancel(self):
+        self.finished.set()
+
+        active_event = self.get_active_event()
+        if isinstance(active_event, ActiveEvent):
+            active_event.remove_callback(self._resume)
+
+    def fire(self):
+        # stop interval if cancel called or if parent has been cleaned up
+        function = self.function
+        if self.finished.is_set() or function is None:
+            return
 
-        while True:
-            # wait for active event to be set before continuing
-            active_event = self.get_active_event()
-            if isinstance(active_event, threading.Event):
-                active_event.wait()
+        start_time = monotonic()
+        function(*self.args, **self.kwargs)
+        end_time = monotonic()
 
-            # take execution time into account when waiting to produce a more
-            # accurate interval time
-            wait_time = self.interval - execution_time
-            if wait_time < 0:
-                logger.warning(f"Interval lagging by {-wait_time}s")
+        # don't keep the parent alive while waiting for the next run
+        del function
 
-            sleep(max(wait_time, 0))
+        self.runs += 1
+        self.last_run_duration = end_time - start_time
+        self.max_lag = max(self.max_lag, start_time - self._deadline)
 
-            # stop interval if cancel called or if parent has been cleaned up
-            if self.finished.is_set() or self.function is None:
-                return
+        # skip deadlines that passed while running rather than running late
+        next_deadline = self._deadline + self.interval
+        if next_deadline < end_time:
+            missed_deadlines = int((end_time - next_deadline) // self.interval) + 1
+            next_deadline += missed_deadlines * self.interval
+            self.missed_deadlines += missed_deadlines
+            logger.warning(f"{self} missed {missed_deadlines} deadlines")
+
+        self._wait_for_active(next_deadline)
+
+    def _schedule(self, deadline):
+        self._deadline = deadline
+        get_timer_wheel(self.blocking).schedule(self, deadline)
 
-            start_time = time()
-            self.function(*self.args, **self.kwargs)
-            execution_time = start_time - time()
+    def _resume(self):
+        self._schedule(monotonic() + self.interval)
+
+    def _wait_for_active(self, next_deadline=None):
+        if self.finished.is_set():
+            return
+
+        # paused intervals start waiting again when the active event is set
+        active_event = self.get_active_event()
+        if isinstance(active_event, ActiveEvent) and active_event.call_when_set(
+            self._resume
+        ):
+            return
+
+        if next_deadline is None:
+            self._resume()
+        else:
+            self._schedule(next_deadline)
 
 
 class State(dict):
+    """Dictionary that notifies the component that owns it when it changes.
+
+    Each update that changes a value increments `version`, and the component
+    is passed the previous values of only the keys that changed. Keys added by
+    an update have a previous value of None. Updates made inside `transaction`
+    are combined so the component is notified once when it ends.
+    """
+
     def __repr__(self) -> str:
-        return dict.__repr__(self.copy())
+        with self._lock:
+            return dict.__repr__(self)
 
     def __eq__(self, other) -> bool:
-        return dict.__eq__(self.copy(), other)
+        with self._lock:
+            return dict.__eq__(self, other)
 
     def __init__(self, initial_state, on_state_update):
         # Use a WeakMethod to store on_state_update so that State does not
         # produce a circular reference with the Component that created it which
         # would result in memory leaks.
         self._get_on_state_update = WeakMethod(on_state_update)
+        self._lock = threading.RLock()
+        self._transaction_changes = None
+        self.version = 0
         super().__init__(initial_state)
 
-    def update(self, *args, **kwargs):
-        previous_state = self.copy()
-        super().update(*args, **kwargs)
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.version += 1
+
+    def _apply(self, updates):
+        changes = {}
+        for key, value in updates.items():
+            previous_value = dict.get(self, key)
+
+            # check identity first so large values like lists of rows are only
+            # compared when they are replaced
+            if key in self and (previous_value is value or previous_value == value):
+                continue
+
+            changes[key] = previous_value
+            dict.__setitem__(self, key, value)
+
+        if changes:
+            self.version += 1
+
+        return changes
+
+    def _notify(self, changes):
+        if not changes:
+            return
+
         on_state_update = self._get_on_state_update()
         if callable(on_state_update):
-            on_state_update(previous_state)
+            on_state_update(changes)
+
+    def update(self, *args, **kwargs):
+        with self._lock:
+            changes = self._apply(dict(*args, **kwargs))
+
+            # keep the earliest previous value of each key in a transaction
+            if self._transaction_changes is not None:
+                for key, previous_value in changes.items():
+                    self._transaction_changes.setdefault(key, previous_value)
+                return
+
+        self._notify(changes)
+
+    @contextmanager
+    def transaction(self):
+        """Combine the updates made in the block into a single state change.
+
+        Updates from other threads wait until the transaction has ended.
+        """
+        self._lock.acquire()
+        outermost = self._transaction_changes is None
+        if outermost:
+            self._transaction_changes = {}
+
+        try:
+            yield self
+        finally:
+            changes = None
+            if outermost:
+                changes = self._transaction_changes
+                self._transaction_changes = None
+
+            self._lock.release()
+            self._notify(changes)
 
 
-# Always create and return copies to prevent accidentally mutating the cache
+# Store frames rather than images so the cache can hand out its contents
+# without copying them. Images returned from the cache are the read-only images
+# shared by its frames, renders are given a copy of the input to draw on.
 class RenderCache:
     def __init__(self):
-        self._input = {"copy": lambda: None}
-        self._output = {"copy": lambda: None}
+        self.input_frame = None
+        self.output_frame = None
 
     @property
     def input(self):
-        return self._input.copy()
+        return None if self.input_frame is None else self.input_frame.image
 
     @input.setter
     def input(self, next_input):
-        self._input = next_input.copy()
+        self.input_frame = Frame.from_image(next_input)
+
+    def copy_input(self):
+        return None if self.input_frame is None else self.input_frame.to_image()
 
     @property
     def output(self):
-        return self._output.copy()
+        return None if self.output_frame is None else self.output_frame.image
 
     @output.setter
     def output(self, next_output):
-        self._output = next_output.copy()
+        self.output_frame = Frame.from_image(next_output)
+
+    def is_input(self, image) -> bool:
+        return self.input_frame is not None and self.input_frame.matches(image)
+
+    def is_output(self, image) -> bool:
+        return self.output_frame is not None and self.output_frame.matches(image)
 
 
 class Component:
     default_state: Dict[Any, Any] = {}
 
+    # set by components whose output only depends on their state, size and
+    # children, their renders given a blank image are cached by state version
+    # rather than by comparing the image with the last one passed to render
+    pure_render = False
+
     def __del__(self):
         logger.debug(f"Garbage collect {self}")
         self._cleanup()
@@ -133,6 +294,7 @@ class Component:
 
         self._children = []
         self._intervals = []
+        self._subscriptions = []
         self._render_cache = RenderCache()
         self._get_on_rerender = WeakMethod(on_rerender)
         self._state = State(
@@ -142,7 +304,30 @@ class Component:
         self._reconciliation_lock = threading.Lock()
         self._reconciliation_queued = False
 
-        self.active_event = threading.Event()
+        # held while rendering or reconciling, renders happen on the render
+        # thread and reconciles on the thread that updated state, without it
+        # a state update during a render could be overwritten by its output
+        self._render_lock = threading.RLock()
+
+        # layers applied to the input image in the last full render, used to
+        # composite only the children that rerendered since then
+        self._layers = None
+        self._layout_key = None
+        self._needs_full_render = True
+        self._needs_composite = False
+
+        # children rerendered since the last render, the component is rendered
+        # again by the next top-down render pass
+        self._dirty = False
+        self._dirty_lock = threading.Lock()
+
+        # incremented whenever the output changes, pure components remember
+        # the versions of their children along with the key of their last render
+        self._render_version = 0
+        self._render_key = None
+        self._children_versions = None
+
+        self.active_event = ActiveEvent()
         self.mounted = False
         self.rendered = False
         self.width = None
@@ -166,6 +351,12 @@ class Component:
 
             self._intervals = []
 
+        if hasattr(self, "_subscriptions"):
+            for subscription in self._subscriptions:
+                subscription.unsubscribe()
+
+            self._subscriptions = []
+
         if hasattr(self, "_children"):
             for child in self._children:
                 child._cleanup()
@@ -177,10 +368,13 @@ class Component:
             self.active_event.set()
 
     def _set_active(self, active):
-        if active:
-            self.active_event.set()
-        else:
-            self.active_event.clear()
+        # components with many children that stay paused are set inactive on
+        # every render, only touch the event when the active state changes
+        if active != self.active_event.is_set():
+            if active:
+                self.active_event.set()
+            else:
+                self.active_event.clear()
 
         # also set children to have the correct active state
         for child in self._children:
@@ -192,7 +386,22 @@ class Component:
         for child in self._children:
             child.rendered = False
 
-        output = self._original_render(image)
+        # children rendered below are composited into the new output
+        for child in self._children:
+            child._needs_composite = False
+
+        self._needs_full_render = False
+        self._layout_key = self.layout_key()
+        profiler = get_render_profiler()
+        start_time = perf_counter() if profiler is not None else None
+        with record_layers(image) as recording:
+            output = self._original_render(image)
+
+        if profiler is not None:
+            profiler.record_render(self, perf_counter() - start_time)
+
+        # layers can only be reused if they produced the returned image
+        self._layers = recording["layers"] if output is image else None
 
         # set children that were rendered to active, otherwise pause them
         # if self is not rendered all children should be paused
@@ -207,6 +416,10 @@ class Component:
                 "Image passed to render must have non-zero height and width"
             )
 
+        with self._render_lock:
+            return self._render_with_cache(image)
+
+    def _render_with_cache(self, image):
         # set size of component to input image for use in calculations
         self.size = image.size
         self.width = image.width
@@ -215,13 +428,35 @@ class Component:
         # mark component as rendered
         self.rendered = True
 
-        # return cached output if input is the same
-        if is_same_image(image, self._render_cache.input):
-            return self._render_cache.output
+        # clear dirty before rendering so children that rerender during the
+        # render mark it dirty again for the next pass
+        dirty = self._clear_dirty()
+
+        render_key = self._get_render_key(image)
+        if render_key is not None:
+            is_input = render_key == self._render_key
+            dirty = dirty or self._children_versions != self._get_children_versions()
+        else:
+            is_input = self._render_cache.is_input(image)
+
+        # return cached output if input is the same and no children rerendered
+        if is_input:
+            if not dirty:
+                profiler = get_render_profiler()
+                if profiler is not None:
+                    profiler.record_cache_hit(self)
 
-        logger.debug(f"{self} rendering")
-        self._render_cache.input = image
-        output = self._internal_render(self._render_cache.input)
+                return self._render_cache.output
+
+            logger.debug(f"{self} rendering rerendered children")
+            output = self._composite_rerendered_children()
+            if output is None:
+                output = self._internal_render(self._render_cache.copy_input())
+        else:
+            logger.debug(f"{self} rendering")
+            self._render_key = render_key
+            self._render_cache.input = image
+            output = self._internal_render(self._render_cache.copy_input())
 
         if not isinstance(output, Image.Image):
             raise RenderException(
@@ -234,18 +469,104 @@ class Component:
             )
 
         self._render_cache.output = output
+        self._render_version += 1
+        if render_key is not None:
+            self._children_versions = self._get_children_versions()
 
         # mark the component as mounted once the render cache is populated
         self.mounted = True
 
         return output
 
+    def _get_render_key(self, image):
+        # the output of a pure component given a blank image can only change
+        # when one of these does, so the image itself doesn't need comparing
+        if not self.pure_render or image.getbbox() is not None:
+            return None
+
+        return (self._state.version, image.size, image.mode)
+
+    def _get_children_versions(self):
+        return tuple(child._render_version for child in self._children)
+
+    def _composite_rerendered_children(self):
+        if (
+            self._needs_full_render
+            or self._layers is None
+            or self._layout_key is None
+            or self._layout_key != self.layout_key()
+        ):
+            return None
+
+        rerendered_children = [
+            child for child in self._children if child._needs_composite
+        ]
+        if len(rerendered_children) == 0:
+            return None
+
+        rerendered_layers = []
+        for child in rerendered_children:
+            child_layers = [
+                layer
+                for layer in self._layers
+                if isinstance(layer, Layer)
+                and getattr(layer.render, "__self__", None) is child
+            ]
+
+            # children rendered outside of a layer need a full render
+            if len(child_layers) != 1:
+                return None
+
+            rerendered_layers += child_layers
+
+        # other layers that overlap a rerendered layer would need to be
+        # reapplied in order, fall back to a full render instead
+        for rerendered_layer in rerendered_layers:
+            for other_layer in self._layers:
+                if other_layer is not rerendered_layer and boxes_overlap(
+                    rerendered_layer.bounding_box,
+                    getattr(other_layer, "bounding_box", (0, 0) + self.size),
+                ):
+                    return None
+
+        logger.debug(f"{self} compositing {rerendered_children}")
+        image = self._render_cache.output_frame.to_image()
+        for child, rerendered_layer in zip(rerendered_children, rerendered_layers):
+            child._needs_composite = False
+            rerendered_layer.reapply(image)
+
+        return image
+
+    def _clear_dirty(self):
+        with self._dirty_lock:
+            dirty = self._dirty
+            self._dirty = False
+
+        return dirty
+
+    def _on_child_rerender(self):
+        # mark the path to the root as dirty rather than rendering it, so
+        # children that rerender at once cause a single top-down render pass.
+        # Components that are still in their first render are marked as well,
+        # a child can rerender before its parent's render has returned and the
+        # root has to render again to display it.
+        with self._dirty_lock:
+            self._dirty = True
+
+        self._needs_composite = True
+
+        on_rerender = self._get_on_rerender()
+        if callable(on_rerender):
+            on_rerender()
+
     def _on_state_update(self, previous_state):
-        if self.state != previous_state:
-            self.on_state_change(previous_state)
+        # state only notifies the component of updates that changed it
+        self._needs_full_render = True
+        self.on_state_change(previous_state)
 
-            if self.mounted:
-                self._reconcile()
+        # reconcile even if not mounted yet, the first render may be running
+        # on another thread and its output would be missing this update
+        self._reconcile()
 
     def _reconcile(self):
         if self._reconciliation_queued:
@@ -263,18 +584,39 @@ class Component:
             if not callable(on_rerender):
                 return
 
-            # do nothing if component has never been rendered
-            if not self.mounted:
-                return
-
-            render_output = self._internal_render(self._render_cache.input)
-
-            # do nothing if render output is unchanged
-            if is_same_image(render_output, self._render_cache.output):
-                return
-
-            # cache the new output and notify parent about the rerender
-            self._render_cache.output = render_output
+            with self._render_lock:
+                # do nothing if component has never been rendered
+                if not self.mounted:
+                    return
+
+                # only composite the children that rerendered when possible
+                state_version = self._state.version
+                render_output = self._composite_rerendered_children()
+                if render_output is None:
+                    render_output = self._internal_render(
+                        self._render_cache.copy_input()
+                    )
+
+                # the output is up to date with state so far even if unchanged
+                if self._render_key is not None:
+                    self._render_key = (state_version, *self._render_key[1:])
+                    self._children_versions = self._get_children_versions()
+
+                # do nothing if render output is unchanged
+                changed = not self._render_cache.is_output(render_output)
+                profiler = get_render_profiler()
+                if profiler is not None:
+                    profiler.record_reconcile(self, changed)
+
+                if not changed:
+                    return
+
+                # cache the new output
+                self._render_cache.output = render_output
+                self._render_version += 1
+                self._needs_composite = True
+
+            # notify parent about the rerender outside of the render lock
             on_rerender()
 
         finally:
@@ -288,6 +630,16 @@ class Component:
     def on_state_change(self, previous_state):
         pass
 
+    def layout_key(self):
+        """Describe the layers returned by render besides state and size.
+
+        Components that render their children with layers can return a value
+        here to let rerendered children be composited into the last output
+        without rendering the component again, as long as state and the
+        returned value are unchanged. The default of None always renders.
+        """
+        return None
+
     # external API
     @property
     def state(self):
@@ -300,12 +652,18 @@ class Component:
         )
 
     def create_child(self, ChildComponent, **kwargs):
-        child = ChildComponent(**kwargs, on_rerender=self._reconcile)
+        child = ChildComponent(**kwargs, on_rerender=self._on_child_rerender)
         self._children.append(child)
         return child
 
-    def create_interval(self, callback, timeout=1):
-        interval = Interval(timeout, callback, active_event=self.active_event)
+    def create_interval(self, callback, timeout=1, name=None, blocking=False):
+        interval = Interval(
+            timeout,
+            callback,
+            active_event=self.active_event,
+            name=name,
+            blocking=blocking,
+        )
         interval.start()
         self._intervals.append(interval)
         return interval
@@ -318,6 +676,28 @@ class Component:
         child._cleanup()
         self._children.remove(child)
 
+    def subscribe(self, key, callback, select=None):
+        """Call `callback` with the value of a registered provider when it changes.
+
+        Providers only fetch while a subscribed component is active. Pass a
+        `select` function to only be called when part of the value changes.
+        """
+        subscription = get_provider_registry().subscribe(
+            key, callback, active_event=self.active_event, select=select
+        )
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def get_interval_metrics(self):
+        """Get metrics for the intervals of this component and its children."""
+        metrics = [
+            {"component": self, **interval.metrics} for interval in self._intervals
+        ]
+        for child in self._children:
+            metrics += child.get_interval_metrics()
+
+        return metrics
+
     def remove_interval(self, interval):
         if interval not in self._intervals:
             logger.warning(f"{self} tried to remove interval it doesn't own {interval}")
@@ -8,6 +8,8 @@ logger = logging.getLogger(__name__)
 
 
 class ArrowNavigationIndicator(Component):
+    pure_render = True
+
     def __init__(
         self,
         upper_arrow_padding=(0, 0),
@@ -2,15 +2,18 @@ import logging
 from threading import Event, Thread
 from time import sleep
 
-from PIL.Image import open as open_image, BICUBIC
+from PIL.Image import BICUBIC
 
 from ..component import Component
+from ..asset_store import get_image_frames
 from ..utils import offset_to_center
 
 logger = logging.getLogger(__name__)
 
 
 class Image(Component):
+    pure_render = True
+
     def __init__(
         self,
         image_path=None,
@@ -22,9 +25,11 @@ class Image(Component):
         initial_state={},
         **kwargs,
     ):
-        self._image = open_image(image_path) if image_path else None
         self.stop_animating_event = Event()
 
+        # mode of the images this is rendered on, frames are converted to it
+        self._mode = "1"
+
         super().__init__(
             **kwargs,
             initial_state={
@@ -41,18 +46,37 @@ class Image(Component):
             },
         )
 
-        if self._image and self._image.is_animated:
+        if self._is_animated:
             self._start_animating()
 
     @property
-    def image(self):
-        if not self._image:
+    def _frames(self):
+        image_path = self.state["image_path"]
+        if not image_path:
             return None
 
-        if self.state["resize"] and self.size:
-            return self._image.resize(self.size, self.state["resize_resampling"])
+        return get_image_frames(
+            image_path,
+            size=self.size if self.state["resize"] and self.size else None,
+            resampling=self.state["resize_resampling"],
+            mode=self._mode,
+        )
 
-        return self._image.copy()
+    @property
+    def _is_animated(self):
+        frames = self._frames
+        return frames is not None and len(frames.frames) > 1
+
+    @property
+    def image(self):
+        frames = self._frames
+        if frames is None:
+            return None
+
+        # frames are shared, this is their read-only image which is only read
+        # when it is pasted into the image being rendered
+        frame = min(self.state["frame"], len(frames.frames) - 1)
+        return frames.frames[frame].image
 
     @image.setter
     def image(self, _):
@@ -74,12 +98,13 @@ class Image(Component):
         ).start()
 
     def _animate(self, stop_event):
-        if not self._image.is_animated:
+        if not self._is_animated:
             logger.debug("image is not animated, unable to start animating")
             return
 
         while True:
-            sleep(self._image.info["duration"] / 1000)
+            durations = self._frames.durations
+            sleep(durations[self.state["frame"]] / 1000)
 
             self.active_event.wait()
 
@@ -87,22 +112,21 @@ class Image(Component):
                 return
 
             next_frame = self.state["frame"] + 1
-            if self.state["loop"] and next_frame >= self._image.n_frames:
+            if self.state["loop"] and next_frame >= len(durations):
                 next_frame = 0
 
-            try:
-                self._image.seek(next_frame)
-                self.state.update({"frame": next_frame})
-            except EOFError:
-                # bail if image has no more frames
+            # bail if image has no more frames
+            if next_frame >= len(durations):
                 stop_event.set()
                 return
 
+            self.state.update({"frame": next_frame})
+
     def on_state_change(self, previous_state):
         # on loop change
         loop = self.state["loop"]
-        if self.state["loop"] != previous_state["loop"]:
-            if loop and self._image.is_animated:
+        if "loop" in previous_state:
+            if loop and self._is_animated:
                 self._start_animating()
 
             if not loop and self.stop_animating_event:
@@ -110,50 +134,52 @@ class Image(Component):
 
         # on image_path change
         image_path = self.state["image_path"]
-        if image_path != previous_state["image_path"]:
+        if "image_path" in previous_state:
             if self.stop_animating_event:
                 self.stop_animating_event.set()
 
             # bail if image_path is now None
             if image_path is None:
-                self._image = None
                 return
 
-            # update self.image
-            self._image = open_image(image_path)
-
             # reset frame state if needed
             if self.state["frame"] != 0:
                 self.state.update({"frame": 0})
 
             # start animating image if it is animated
-            if self._image.is_animated:
+            if self._is_animated:
                 self._start_animating()
 
-    def _get_x_pos(self, container_width):
+    def _get_x_pos(self, container_width, image_width):
         if self.state["align"] == "center":
-            return offset_to_center(container_width, self.image.width)
+            return offset_to_center(container_width, image_width)
 
         if self.state["align"] == "right":
-            return container_width - self.image.width
+            return container_width - image_width
 
         return 0
 
-    def _get_y_pos(self, container_height):
+    def _get_y_pos(self, container_height, image_height):
         if self.state["vertical_align"] == "center":
-            return offset_to_center(container_height, self.image.height)
+            return offset_to_center(container_height, image_height)
 
         if self.state["vertical_align"] == "bottom":
-            return container_height - self.image.height
+            return container_height - image_height
 
         return 0
 
-    def _get_pos(self, container_size):
-        return (self._get_x_pos(container_size[0]), self._get_y_pos(container_size[1]))
+    def _get_pos(self, container_size, image_size):
+        return (
+            self._get_x_pos(container_size[0], image_size[0]),
+            self._get_y_pos(container_size[1], image_size[1]),
+        )
 
     def render(self, image):
-        if not self._image:
+        self._mode = image.mode
+
+        frame = self.image
+        if frame is None:
             return image
 
-        image.paste(self.image, self._get_pos(image.size))
+        image.paste(frame, self._get_pos(image.size, frame.size))
         return image
@@ -1,15 +1,27 @@
 import logging
 import threading
+from collections import deque
+from contextlib import contextmanager
+from functools import partial
+from itertools import islice
 from math import ceil
 
 from PIL import Image, ImageDraw
 
 from ..component import Component
-from ..utils import apply_layers, layer, rectangle, transition
+from ..utils import apply_layers, invert, layer, rectangle, transition
 
 logger = logging.getLogger(__name__)
 
 
+def get_row_binding(Row):
+    """Return the class, args and kwargs a row is created with."""
+    if isinstance(Row, partial):
+        return Row.func, Row.args, Row.keywords
+
+    return Row, (), {}
+
+
 class List(Component):
     def cleanup(self):
         if hasattr(self, "_cleanup_transition"):
@@ -56,14 +68,23 @@ class List(Component):
         )
 
         self._virtual = virtual
-        self._rows_snapshot = None
         self._cleanup_transition = threading.Event()
 
+        # strip of the rows needed for a render, reused until rows change
+        self._rows_strip = None
+        self._rows_strip_key = None
+        self._rows_version = 0
+        self._scrollbar_geometry = None
+
+        # rows scrolled out of view in virtual lists that can be rebound to
+        # other rows, at most one per visible row is kept
+        self._row_pool = []
+
         # setup initial rows
         num_rows = self.state["num_visible_rows"] if virtual else len(Rows)
         start_index = self.state["top_row_index"] if virtual else 0
         end_index = start_index + num_rows
-        self.rows = [self.create_child(Row) for Row in Rows[start_index:end_index]]
+        self.rows = self._create_rows(Rows[start_index:end_index])
 
     @property
     def visible_scrollbar(self):
@@ -90,36 +111,93 @@ class List(Component):
     def can_scroll_up(self, distance=1):
         return self.state["top_row_index"] + 1 > distance
 
-    @property
-    def visible_rows(self):
+    def _get_visible_range(self):
+        # virtual lists only hold the visible rows and the rows being scrolled
+        # to, rows scrolled down to are appended after the visible rows
         if not self._virtual:
-            top_row_index = self.state["top_row_index"]
-            bottom_row_index = top_row_index + self.state["num_visible_rows"]
-            return self.rows[top_row_index:bottom_row_index]
+            start_index = self.state["top_row_index"]
+        elif self.state["active_transition"] == "DOWN":
+            start_index = self.state["transition_distance"]
+        else:
+            start_index = 0
 
-        if self.state["active_transition"] == "UP":
-            return self.rows[: self.state["num_visible_rows"]]
+        return start_index, start_index + self.state["num_visible_rows"]
 
-        if self.state["active_transition"] == "DOWN":
-            distance = self.state["transition_distance"]
-            return self.rows[distance:]
+    @property
+    def visible_rows(self):
+        # virtual lists only hold the visible rows when not scrolling
+        if self._virtual and self.state["active_transition"] is None:
+            return self.rows
 
-        return self.rows
+        start_index, end_index = self._get_visible_range()
+        if self._virtual:
+            return list(islice(self.rows, start_index, end_index))
+
+        return self.rows[start_index:end_index]
 
     @property
     def invisible_rows(self):
-        return list(filter(lambda row: row not in self.visible_rows, self.rows))
+        start_index, end_index = self._get_visible_range()
+        if self._virtual:
+            return list(islice(self.rows, start_index)) + list(
+                islice(self.rows, end_index, None)
+            )
+
+        return self.rows[:start_index] + self.rows[end_index:]
 
     def update_rows(self, rows):
-        self.rows = [
-            self.create_child(Row) for Row in rows[0 : self.state["num_visible_rows"]]
-        ]
+        for row in self.rows:
+            self._release_row(row)
+
+        self.rows = self._create_rows(rows[0 : self.state["num_visible_rows"]])
         self.state.update({"Rows": rows, "top_row_index": 0})
 
+    def _create_rows(self, Rows):
+        # virtual lists keep their rows in a deque so rows can be added and
+        # removed at either end while scrolling in constant time
+        rows = [self._create_row(Row) for Row in Rows]
+        return deque(rows) if self._virtual else rows
+
+    def _create_row(self, Row):
+        # rows that implement `bind` are rebound to new row data rather than
+        # creating a component, when they were created from the same class
+        RowClass, args, kwargs = get_row_binding(Row)
+        for row in self._row_pool:
+            if type(row) is RowClass:
+                self._row_pool.remove(row)
+                row.bind(*args, **kwargs)
+                return row
+
+        return self.create_child(Row)
+
+    def _release_row(self, row):
+        if (
+            callable(getattr(row, "bind", None))
+            and len(self._row_pool) < self.state["num_visible_rows"]
+        ):
+            self._row_pool.append(row)
+            return
+
+        self.remove_child(row)
+
     def _remove_invisible_rows(self):
-        for row in self.invisible_rows:
-            self.rows.remove(row)
-            self.remove_child(row)
+        start_index, _ = self._get_visible_range()
+        self._remove_rows_outside_window(start_index)
+
+    def _remove_rows_outside_window(self, start_index):
+        for _ in range(start_index):
+            self._release_row(self.rows.popleft())
+
+        while len(self.rows) > self.state["num_visible_rows"]:
+            self._release_row(self.rows.pop())
+
+    @contextmanager
+    def _updating_rows(self):
+        # rows are indexed using state, hold the render lock so a render can't
+        # happen between removing rows and updating state. The transaction ends
+        # after the lock is released so state isn't notified while holding it
+        with self.state.transaction(), self._render_lock:
+            yield
 
     def _scroll_transition(self, distance):
         # only animate transition if list has been rendered before
@@ -136,17 +214,18 @@ class List(Component):
                 progress_step = step / scroll_distance
                 self.state.update({"transition_progress": progress + progress_step})
 
-        if self._virtual:
-            self._remove_invisible_rows()
+        with self._updating_rows():
+            if self._virtual:
+                self._remove_invisible_rows()
 
-        self._rows_snapshot = None
-        self.state.update(
-            {
-                "active_transition": None,
-                "transition_progress": 0,
-                "transition_distance": 0,
-            }
-        )
+            self._rows_strip = None
+            self.state.update(
+                {
+                    "active_transition": None,
+                    "transition_progress": 0,
+                    "transition_distance": 0,
+                }
+            )
 
     def scroll_to(self, direction, distance=1, animate=True):
         if self.state["active_transition"] is not None:
@@ -169,7 +248,7 @@ class List(Component):
                 for i in range(distance):
                     row_index = self.state["top_row_index"] - (i + 1)
                     Row = self.state["Rows"][row_index]
-                    self.rows.insert(0, self.create_child(Row))
+                    self.rows.appendleft(self._create_row(Row))
 
         elif direction == "DOWN":
             if not self.can_scroll_down(distance):
@@ -186,20 +265,16 @@ class List(Component):
                     Row = self.state["Rows"][
                         row_index + self.state["num_visible_rows"] - 1
                     ]
-                    self.rows.append(self.create_child(Row))
+                    self.rows.append(self._create_row(Row))
 
         if not animate:
-            # remove rows that are no longer visible if virtual
-            if self._virtual:
-                if direction == "UP":
-                    self.rows = self.rows[: self.state["num_visible_rows"]]
-
-                if direction == "DOWN":
-                    self.rows = self.rows[distance:]
-
-                self._remove_invisible_rows()
+            with self._updating_rows():
+                # remove rows that are no longer visible if virtual
+                if self._virtual:
+                    start_index = distance if direction == "DOWN" else 0
+                    self._remove_rows_outside_window(start_index)
 
-            self.state.update({"top_row_index": next_top_row_index})
+                self.state.update({"top_row_index": next_top_row_index})
             return
 
         self.state.update(
@@ -259,31 +334,55 @@ class List(Component):
 
         return bar_y
 
-    def _render_scrollbar(self, image):
-        Rows = self.state["Rows"]
-        horizontal_padding = self.state["scrollbar_horizontal_padding"]
-        vertical_padding = self.state["scrollbar_vertical_padding"]
-        bar_min_height = vertical_padding * 2
-        bar_height = max(
-            int(image.height * self.state["num_visible_rows"] / len(Rows)),
-            bar_min_height,
+    def _get_scrollbar_geometry(self, size):
+        key = (
+            size,
+            len(self.state["Rows"]),
+            self.state["num_visible_rows"],
+            self.state["scrollbar_horizontal_padding"],
+            self.state["scrollbar_vertical_padding"],
         )
+
+        # geometry only changes with the list, not on every transition step
+        if self._scrollbar_geometry is None or self._scrollbar_geometry[0] != key:
+            horizontal_padding = self.state["scrollbar_horizontal_padding"]
+            vertical_padding = self.state["scrollbar_vertical_padding"]
+            bar_min_height = vertical_padding * 2
+            bar_height = max(
+                int(size[1] * self.state["num_visible_rows"] / key[1]),
+                bar_min_height,
+            )
+            self._scrollbar_geometry = (
+                key,
+                (
+                    horizontal_padding,
+                    vertical_padding,
+                    size[0] - horizontal_padding,
+                    bar_height - vertical_padding,
+                ),
+            )
+
+        return self._scrollbar_geometry[1]
+
+    def _render_scrollbar(self, image):
+        left, top, right, bottom = self._get_scrollbar_geometry(image.size)
         bar_y = self._get_scrollbar_y()
 
         ImageDraw.Draw(image).rectangle(
-            (
-                horizontal_padding,
-                bar_y + vertical_padding,
-                image.size[0] - horizontal_padding,
-                bar_y + bar_height - vertical_padding,
-            ),
-            fill="white",
+            (left, bar_y + top, right, bar_y + bottom), fill="white"
         )
         return image
 
+    def _get_highlighted_row(self):
+        # the highlighted row is inverted when rows are composited so that the
+        # row's own render output stays cached when the highlight moves
+        return None
+
     def _get_rows_needed_for_render(self):
+        # return a snapshot since the transition thread adds and removes rows
+        # while the list renders, iterating the deque itself would raise
         if self._virtual:
-            return self.rows
+            return tuple(self.rows)
 
         start_index = self.state["top_row_index"]
         end_index = start_index + self.state["num_visible_rows"]
@@ -294,20 +393,19 @@ class List(Component):
         if self.state["active_transition"] == "UP":
             end_index += self.state["transition_distance"]
 
-        return self.rows[start_index:end_index]
+        return tuple(self.rows[start_index:end_index])
 
-    def _render_rows(self, image):
+    def _render_rows(self, image, rows):
         # bail if there are no rows to render
-        num_rows = len(self.rows)
+        num_rows = len(rows)
         if num_rows == 0:
             return image
 
         row_gap = self.state["row_gap"]
         row_height = self._get_row_height()
         rows_height = self._get_rows_height(num_rows)
-        rows = self._get_rows_needed_for_render()
 
-        return apply_layers(
+        rows_image = apply_layers(
             Image.new("1", size=(image.width, rows_height)),
             [
                 layer(
@@ -319,6 +417,13 @@ class List(Component):
             ],
         )
 
+        highlighted_row = self._get_highlighted_row()
+        if highlighted_row is None or highlighted_row not in rows:
+            return rows_image
+
+        row_top = (row_height + row_gap) * rows.index(highlighted_row)
+        return invert(rows_image, (0, row_top, image.width, row_top + row_height))
+
     def _render_rows_window(self, image):
         transition = self.state["active_transition"]
 
@@ -337,16 +442,40 @@ class List(Component):
         window_height = self._get_rows_height(num_rows=self.state["num_visible_rows"])
         window_bottom = window_top + window_height
 
-        # initialise snapshot if needed
-        use_snap = transition and self.state["use_snapshot_when_scrolling"]
-        if transition and use_snap and not self._rows_snapshot:
-            self._rows_snapshot = self._render_rows(image)
+        # return rows cropped to be the size as the input image
+        rows_strip = self._get_rows_strip(image)
+        return rows_strip.crop((0, window_top, image.width, window_bottom))
 
-        # either use snapshot if it exists or render the rows
-        rows_image = self._rows_snapshot or self._render_rows(image)
+    def _get_rows_strip(self, image):
+        transition = self.state["active_transition"]
+        rows = self._get_rows_needed_for_render()
+        key = (
+            image.width,
+            self.height,
+            self.state["top_row_index"],
+            transition,
+            self.state["transition_distance"],
+            self.state["row_gap"],
+            tuple(map(id, rows)),
+        )
 
-        # return rows cropped to be the size as the input image
-        return rows_image.crop((0, window_top, image.width, window_bottom))
+        # snapshots are kept for the whole transition, otherwise rows that
+        # rerender and the highlighted row are drawn into a new strip
+        if not (transition and self.state["use_snapshot_when_scrolling"]):
+            key += (self._rows_version, id(self._get_highlighted_row()))
+
+        # the strip holds every row needed for the transition, so steps that
+        # only move the window crop the same strip
+        if self._rows_strip is None or self._rows_strip_key != key:
+            self._rows_strip = self._render_rows(image, rows)
+            self._rows_strip_key = key
+
+        return self._rows_strip
+
+    def _on_child_rerender(self):
+        # rows are drawn into a new strip on the next render
+        self._rows_version += 1
+        super()._on_child_rerender()
 
     def render(self, image):
         scrollbar_width = self.state["scrollbar_width"] if self.visible_scrollbar else 0
@@ -3,6 +3,7 @@ from threading import Event, Thread
 from time import sleep
 
 from ..utils import carousel
+from ..text_cache import get_text_size
 from .text import Text
 
 logger = logging.getLogger(__name__)
@@ -40,7 +41,7 @@ class MarqueeText(Text):
 
     @property
     def needs_scrolling(self) -> bool:
-        text_size = self.get_text_size(self.state["text"], self.state["font"])
+        text_size = get_text_size(self.state["text"], self.state["font"])
         return self.width is not None and self.width < text_size[0]
 
     @property
@@ -63,7 +64,7 @@ class MarqueeText(Text):
         self._start_scrolling()
 
     def _scroll(self, stop_event):
-        text_size = self.get_text_size(self.state["text"], self.state["font"])
+        text_size = get_text_size(self.state["text"], self.state["font"])
         scroll_len = max(text_size[0] - self.width, 0)
 
         sleep(self.state["bounce_pause_time"])
@@ -83,10 +84,7 @@ class MarqueeText(Text):
 
     def on_state_change(self, prev_state):
         # restart scrolling to recreate carousel with new text size if needed
-        if (
-            self.state["text"] != prev_state["text"]
-            or self.state["font"] != prev_state["font"]
-        ):
+        if "text" in prev_state or "font" in prev_state:
             if self.needs_scrolling:
                 self._restart_scrolling()
 
@@ -97,14 +95,18 @@ class MarqueeText(Text):
         if self.scrolling and not self.needs_scrolling:
             self._stop_scroll_event.set()
 
-        text_size = self.get_text_size(self.state["text"], self.state["font"])
+        text = self.state["text"]
+        font = self.state["font"]
+        text_size = get_text_size(text, font)
         offset = self.state["offset"] if self.needs_scrolling else DEFAULT_OFFSET_VALUE
 
-        # crop a section of the provided image to write on top of
-        crop = image.crop((offset, 0, text_size[0], image.height))
-
-        image.paste(
-            super().render(crop),
-            (offset, 0),
+        # text is aligned within the section from the offset to the end of the
+        # text, drawing the cached raster there means scrolling by a step never
+        # rasterises the text again
+        xy = (
+            offset + self._calculate_text_x(text, font, text_size[0] - offset),
+            self._calculate_text_y(text, font, image.height),
         )
+
+        self._draw_text(image, text, xy)
         return image
@@ -11,6 +11,8 @@ def isint(value):
 
 
 class Row(Component):
+    pure_render = True
+
     def __init__(self, column_widths=[], Columns=[], initial_state={}, **kwargs):
         assert len(column_widths) == len(Columns)
 
@@ -1,7 +1,5 @@
 import logging
 
-from PIL import ImageOps
-
 from .list import List
 
 logger = logging.getLogger(__name__)
@@ -21,13 +19,6 @@ class SelectableList(List):
             },
         )
 
-        self._selected_row_unmodified_render = None
-        if len(self.rows) != 0:
-            self._selected_row_unmodified_render = self.selected_row.render
-            self.selected_row.render = lambda image: ImageOps.invert(
-                self._selected_row_unmodified_render(image).convert("L")
-            ).convert("1")
-
     @property
     def selected_row(self):
         return self._get_row_at_index(self.state["selected_index"])
@@ -55,17 +46,19 @@ class SelectableList(List):
             )
             return
 
-        offset = index - self.state["top_row_index"]
-        if offset < 0:
-            self.scroll_to(direction="UP", distance=-offset, animate=animate_scroll)
-        elif offset >= self.state["num_visible_rows"]:
-            self.scroll_to(
-                direction="DOWN",
-                distance=1 + offset - self.state["num_visible_rows"],
-                animate=animate_scroll,
-            )
+        # scroll and select with a single rerender
+        with self.state.transaction():
+            offset = index - self.state["top_row_index"]
+            if offset < 0:
+                self.scroll_to(direction="UP", distance=-offset, animate=animate_scroll)
+            elif offset >= self.state["num_visible_rows"]:
+                self.scroll_to(
+                    direction="DOWN",
+                    distance=1 + offset - self.state["num_visible_rows"],
+                    animate=animate_scroll,
+                )
 
-        self.state.update({"selected_index": index})
+            self.state.update({"selected_index": index})
 
     def select_next_row(self, animate_scroll=True):
         self.select_row(self.state["selected_index"] + 1, animate_scroll=animate_scroll)
@@ -88,25 +81,9 @@ class SelectableList(List):
         return self.rows[index - self.state["top_row_index"]]
 
     def update_rows(self, rows):
-        self.rows = [
-            self.create_child(Row) for Row in rows[0 : self.state["num_visible_rows"]]
-        ]
-        self.state.update({"Rows": rows, "top_row_index": 0, "selected_index": 0})
-
-    def on_state_change(self, previous_state):
-        selected_row = None
-        if previous_state["Rows"] != self.state["Rows"] and len(self.rows) > 0:
-            # Handle dynamic changes in state Rows; if rows changed, reset selection to the first
-            selected_row = self.rows[0]
-        elif previous_state["selected_index"] != self.state["selected_index"]:
-            selected_row = self.selected_row
-            previous_row = self._get_row_at_index(previous_state["selected_index"])
-            previous_row.render = self._selected_row_unmodified_render
-
-        if selected_row:
-            self._selected_row_unmodified_render = selected_row.render
-            selected_row.render = lambda image: ImageOps.invert(
-                self._selected_row_unmodified_render(image).convert("L")
-            ).convert("1")
-
-        return super().on_state_change(previous_state)
+        with self.state.transaction():
+            super().update_rows(rows)
+            self.state.update({"selected_index": 0})
+
+    def _get_highlighted_row(self):
+        return self.selected_row
@@ -185,12 +185,14 @@ class Stack(Component):
             )
             return image
 
-        # render background layer and paste foreground offset to the right by x_position
+        # render background layer with the same image as the foreground so
+        # each step of a transition reuses their cached output, which is shared
+        # so it is pasted into the image along with the offset foreground
         background_component = self.state["stack"][-2]
-        background_layer = background_component.render(image)
-        background_layer.paste(
+        image.paste(background_component.render(image))
+        image.paste(
             cropped_foreground_layer,
             (image.size[0] - cropped_foreground_layer.size[0], 0),
         )
 
-        return background_layer
+        return image
@@ -1,10 +1,11 @@
 import logging
-from functools import lru_cache
-
-import PIL.Image
-import PIL.ImageDraw
-import PIL.ImageFont
 
+from pt_miniscreen.core.text_cache import (
+    create_wrapped_text,
+    draw_text_raster,
+    get_text_raster_cache,
+    get_text_size,
+)
 from pt_miniscreen.core.utils import get_font
 
 from .. import Component
@@ -12,46 +13,16 @@ from .. import Component
 logger = logging.getLogger(__name__)
 
 
-def get_text_size(text, font):
-    draw = PIL.ImageDraw.Draw(PIL.Image.new("1", (0, 0), color="black"))
-    bounding_box = draw.textbbox(
-        (0, 0),
-        text=text,
-        font=font,
-    )
-    return (
-        bounding_box[2] - bounding_box[0],
-        bounding_box[3] - bounding_box[1],
-    )
-
-
-def create_wrapped_text(text, font, max_width):
-    words = text.split(" ")
-    words.reverse()  # reverse words to avoid costly list operations later
-    lines = [words.pop()]  # setup first line to equal first word
-
-    while len(words) > 0:
-        word = words.pop()
-
-        # try adding word to the current line and move onto next word if it fits
-        line = f"{lines[-1]} {word}"
-        if get_text_size(line, font)[0] < max_width:
-            lines[-1] = line
-            continue
-
-        # word doesn't fit on current line so use it to create next line
-        lines.append(word)
-
-    return "\n".join(lines)
-
-
 class Text(Component):
+    pure_render = True
     size = (0, 0)
 
     def __init__(
         self,
         text="",
         get_text=None,
+        text_provider=None,
+        select_text=None,
         font=None,
         font_size=20,
         fill=1,
@@ -82,19 +53,29 @@ class Text(Component):
             },
         )
 
-        # Memoize expensive methods
-        self.get_text_size = lru_cache(get_text_size)
-        self.create_wrapped_text = lru_cache(create_wrapped_text)
-
-        # start polling text if get_text is callable
+        # start polling text if get_text is callable, it may block so it runs
+        # apart from animation intervals
         if callable(self._get_text):
-            self.create_interval(self._update_text, get_text_interval)
+            self.create_interval(
+                self._update_text,
+                get_text_interval,
+                name=getattr(get_text, "__qualname__", None),
+                blocking=True,
+            )
+
+        # subscribe to shared values rather than polling them, select_text
+        # picks the text out of providers whose values aren't text
+        if text_provider is not None:
+            self.subscribe(text_provider, self._set_text, select=select_text)
+
+    def _set_text(self, text):
+        self.state.update({"text": text})
 
     def _update_text(self):
         self.state.update({"text": self._get_text()})
 
     def _calculate_text_x(self, text, font, width):
-        text_size = self.get_text_size(text, font)
+        text_size = get_text_size(text, font)
 
         if self.state["align"] == "center":
             return int((width - text_size[0]) / 2)
@@ -105,7 +86,7 @@ class Text(Component):
         return 0
 
     def _calculate_text_y(self, text, font, height):
-        text_size = self.get_text_size(text, font)
+        text_size = get_text_size(text, font)
 
         if self.state["vertical_align"] == "center":
             return int((height - text_size[1]) / 2)
@@ -119,29 +100,31 @@ class Text(Component):
     def text(self):
         return self.state["text"]
 
+    def _draw_text(self, image, text, xy):
+        # multiline doesn't support anchor so pass none if any newlines found
+        anchor = "lt" if "\n" not in text else None
+
+        # draw a cached raster of the text rather than rasterising it again
+        raster = get_text_raster_cache().get(
+            text,
+            self.state["font"],
+            spacing=self.state["spacing"],
+            align=self.state["align"],
+            anchor=anchor,
+        )
+        draw_text_raster(image, raster, xy, fill=self.state["fill"])
+
     def render(self, image):
         font = self.state["font"]
 
         text = self.state["text"]
         if self.state["wrap"]:
-            text = self.create_wrapped_text(text, font, image.width)
+            text = create_wrapped_text(text, font, image.width)
 
         xy = (
             self._calculate_text_x(text, font, image.width),
             self._calculate_text_y(text, font, image.height),
         )
 
-        # multiline doesn't support anchor so pass none if any newlines found
-        anchor = "lt" if "\n" not in text else None
-
-        PIL.ImageDraw.Draw(image).text(
-            text=text,
-            xy=xy,
-            font=font,
-            fill=self.state["fill"],
-            spacing=self.state["spacing"],
-            align=self.state["align"],
-            anchor=anchor,
-        )
-
+        self._draw_text(image, text, xy)
         return image
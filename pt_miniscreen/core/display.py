@@ -0,0 +1,188 @@
+import logging
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+# SSD1306 memory is split into pages of 8 rows, each byte sent to the display
+# holds a column of 8 pixels within a page.
+PAGE_HEIGHT = 8
+COLUMN_ADDRESS_COMMAND = 0x21
+PAGE_ADDRESS_COMMAND = 0x22
+
+
+def get_changed_regions(previous_frame, next_frame):
+    """Get the regions of the display that differ between two frames.
+
+    Returns a list of (first_page, last_page, first_column, last_column)
+    tuples, where consecutive changed pages are merged into a single region.
+    None is returned when the frames can't be compared and the full frame must
+    be displayed instead.
+    """
+    if (
+        previous_frame is None
+        or next_frame is None
+        or previous_frame.mode != "1"
+        or previous_frame.mode != next_frame.mode
+        or previous_frame.size != next_frame.size
+    ):
+        return None
+
+    if previous_frame.data == next_frame.data:
+        return []
+
+    width, height = next_frame.size
+    row_length = (width + 7) // 8
+    row_bits = row_length * 8
+
+    regions = []
+    for page_top in range(0, height, PAGE_HEIGHT):
+        left = None
+        right = None
+
+        for y in range(page_top, min(page_top + PAGE_HEIGHT, height)):
+            start = y * row_length
+            end = start + row_length
+            previous_row = previous_frame.data[start:end]
+            next_row = next_frame.data[start:end]
+            if previous_row == next_row:
+                continue
+
+            # rows are packed most significant bit first, so the highest set
+            # bit of the difference is the left-most changed pixel
+            difference = int.from_bytes(previous_row, "big") ^ int.from_bytes(
+                next_row, "big"
+            )
+            row_left = row_bits - difference.bit_length()
+            row_right = row_bits - (difference & -difference).bit_length()
+            left = row_left if left is None else min(left, row_left)
+            right = row_right if right is None else max(right, row_right)
+
+        if left is None:
+            continue
+
+        page = page_top // PAGE_HEIGHT
+        right = min(right, width - 1)
+
+        # merge with the previous region if the pages are consecutive
+        if regions and regions[-1][1] == page - 1:
+            first_page, _, first_left, first_right = regions[-1]
+            regions[-1] = (
+                first_page,
+                page,
+                min(first_left, left),
+                max(first_right, right),
+            )
+            continue
+
+        regions.append((page, page, left, right))
+
+    return regions
+
+
+class DisplaySink:
+    """Sends images to a display.
+
+    `regions` is the list of changed regions returned by get_changed_regions,
+    or None when the full image must be sent.
+    """
+
+    def display(self, image, regions=None):
+        raise NotImplementedError("DisplaySink subclasses must implement display")
+
+
+class FullFrameDisplaySink(DisplaySink):
+    def __init__(self, display):
+        self._display = display
+
+    def display(self, image, regions=None):
+        self._display(image)
+
+
+def get_ssd1306_class():
+    try:
+        from luma.oled.device import ssd1306
+    except ImportError:
+        # luma is installed by the pi-top SDK, without it there is no device
+        return None
+
+    return ssd1306
+
+
+def pack_pages(image):
+    """Pack a "1" mode image into SSD1306 page bytes.
+
+    The image height must be a multiple of the page height. Bytes are returned
+    page by page, with a byte for each column holding its 8 pixels least
+    significant bit first.
+    """
+    pages = image.height // PAGE_HEIGHT
+
+    # rotating clockwise turns each column into a row of packed bytes, with the
+    # top of the column in the least significant bit of the last byte
+    data = image.transpose(Image.ROTATE_270).tobytes()
+    return b"".join(data[pages - 1 - page :: pages] for page in range(pages))
+
+
+class SSD1306DisplaySink(DisplaySink):
+    """Sends only the changed regions of an image to an SSD1306 device.
+
+    Falls back to displaying the full image when the device is not a luma
+    SSD1306 that writes images as they are, or when the changed regions cover
+    most of the display and a full frame is cheaper to send.
+    """
+
+    # fraction of the display that can change before the full frame is sent
+    MAX_PARTIAL_UPDATE_AREA = 0.5
+
+    def __init__(self, device):
+        self._device = device
+
+    @property
+    def supports_partial_updates(self):
+        ssd1306 = get_ssd1306_class()
+        return (
+            ssd1306 is not None
+            and isinstance(self._device, ssd1306)
+            and callable(getattr(self._device, "command", None))
+            and callable(getattr(self._device, "data", None))
+            and isinstance(getattr(self._device, "_colstart", None), int)
+            and getattr(self._device, "rotate", 0) == 0
+        )
+
+    def display(self, image, regions=None):
+        if (
+            regions is None
+            or image.mode != "1"
+            or image.size != getattr(self._device, "size", image.size)
+            or image.height % PAGE_HEIGHT != 0
+            or self._get_area(regions)
+            > self.MAX_PARTIAL_UPDATE_AREA * image.width * image.height
+            or not self.supports_partial_updates
+        ):
+            self._device.display(image)
+            return
+
+        for region in regions:
+            self._display_region(image, *region)
+
+    def _get_area(self, regions):
+        return sum(
+            (last_page - first_page + 1) * PAGE_HEIGHT * (right - left + 1)
+            for first_page, last_page, left, right in regions
+        )
+
+    def _display_region(self, image, first_page, last_page, left, right):
+        column_offset = self._device._colstart
+        top = first_page * PAGE_HEIGHT
+        bottom = (last_page + 1) * PAGE_HEIGHT
+
+        self._device.command(
+            COLUMN_ADDRESS_COMMAND,
+            left + column_offset,
+            right + column_offset,
+            PAGE_ADDRESS_COMMAND,
+            first_page,
+            last_page,
+        )
+        self._device.data(list(pack_pages(image.crop((left, top, right + 1, bottom)))))
@@ -0,0 +1,94 @@
+from typing import Optional
+
+from PIL import Image
+
+
+class Frame:
+    """Immutable snapshot of the pixels of a Pillow image.
+
+    Frames can be shared freely since they can't be changed. The `image`
+    property returns a read-only Pillow image of the frame that is created the
+    first time it is needed and shared by every caller, callers that draw on it
+    must copy it first. `to_image` returns a new image that can be drawn on.
+    """
+
+    __slots__ = ("mode", "size", "data", "_image")
+
+    mode: str
+    size: tuple
+    data: bytes
+    _image: Optional[Image.Image]
+
+    def __init__(self, mode, size, data):
+        object.__setattr__(self, "mode", mode)
+        object.__setattr__(self, "size", tuple(size))
+        object.__setattr__(self, "data", bytes(data))
+        object.__setattr__(self, "_image", None)
+
+    @classmethod
+    def from_image(cls, image):
+        return cls(image.mode, image.size, image.tobytes())
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Frame is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Frame is immutable")
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+
+        if not isinstance(other, Frame):
+            return NotImplemented
+
+        return (
+            self.mode == other.mode
+            and self.size == other.size
+            and self.data == other.data
+        )
+
+    def __hash__(self):
+        # bytes cache their own hash so this is only expensive the first time
+        return hash((self.mode, self.size, self.data))
+
+    def __repr__(self):
+        return f"<Frame mode={self.mode} size={self.size}>"
+
+    @property
+    def width(self):
+        return self.size[0]
+
+    @property
+    def height(self):
+        return self.size[1]
+
+    @property
+    def image(self):
+        image = self._image
+
+        # Pillow copies a read-only image in place before drawing on it, if a
+        # caller drew on the shared image without copying it create a new one
+        if image is None or not image.readonly:
+            image = self.to_image()
+            image.readonly = 1
+            object.__setattr__(self, "_image", image)
+
+        return image
+
+    def to_image(self):
+        return Image.frombytes(self.mode, self.size, self.data)
+
+    def matches(self, image) -> bool:
+        # the shared image can't have changed while it is still read-only
+        if image is not None and image is self._image and image.readonly:
+            return True
+
+        try:
+            return (
+                self.mode == image.mode
+                and self.size == image.size
+                and self.data == image.tobytes()
+            )
+        except Exception:
+            return False
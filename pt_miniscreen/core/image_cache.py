@@ -0,0 +1,119 @@
+import logging
+import threading
+from collections import OrderedDict, namedtuple
+
+from PIL.Image import BICUBIC, open as open_image
+
+from .frame import Frame
+
+logger = logging.getLogger(__name__)
+
+# the bootsplash is the largest animation at 39 frames of 1KiB each
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+
+ImageFrames = namedtuple("ImageFrames", ["frames", "durations"])
+
+
+def convert_for_paste(image, mode):
+    # make the same conversion as Image.paste so cached frames paste the same
+    if image.mode == mode or (mode == "RGB" and image.mode in ("LA", "RGBA", "RGBa")):
+        return image
+
+    return image.convert(mode)
+
+
+def decode_frames(path, size=None, resampling=BICUBIC, mode="1"):
+    """Decode every frame of an image, resized to `size` and converted to `mode`.
+
+    Returns immutable frames and the duration of each frame in milliseconds.
+    """
+    frames = []
+    durations = []
+
+    with open_image(path) as source:
+        for index in range(getattr(source, "n_frames", 1)):
+            source.seek(index)
+
+            frame = source.resize(size, resampling) if size else source.copy()
+            frames.append(Frame.from_image(convert_for_paste(frame, mode)))
+            durations.append(source.info.get("duration", 0))
+
+    return ImageFrames(tuple(frames), tuple(durations))
+
+
+def get_frames_bytes(image_frames):
+    return sum(len(frame.data) for frame in image_frames.frames)
+
+
+class ImageFrameCache:
+    """Least recently used cache of decoded image frames with a byte budget.
+
+    Frames are decoded, resized and converted once for each combination of
+    path, size, resampling and mode, so components showing the same image
+    share them rather than decoding it again for every frame they draw.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def get(self, path, size=None, resampling=BICUBIC, mode="1"):
+        key = (path, tuple(size) if size else None, resampling, mode)
+
+        with self._lock:
+            image_frames = self._entries.get(key)
+            if image_frames is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return image_frames
+
+            self.misses += 1
+
+        image_frames = decode_frames(path, size=size, resampling=resampling, mode=mode)
+
+        frames_bytes = get_frames_bytes(image_frames)
+        if frames_bytes > self.max_bytes:
+            logger.debug(f"Frames of {path} too large to cache: {frames_bytes} bytes")
+            return image_frames
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = image_frames
+                self._bytes += frames_bytes
+
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= get_frames_bytes(evicted)
+                self.evictions += 1
+
+        return image_frames
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+_image_frame_cache = ImageFrameCache()
+
+
+def get_image_frame_cache():
+    return _image_frame_cache
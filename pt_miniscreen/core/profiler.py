@@ -0,0 +1,193 @@
+import json
+import logging
+import threading
+from time import time
+from weakref import WeakKeyDictionary
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXPORT_INTERVAL = 60
+
+
+class RenderStats:
+    __slots__ = (
+        "renders",
+        "cache_hits",
+        "total_time",
+        "max_time",
+        "reconciles",
+        "unchanged_reconciles",
+    )
+
+    def __init__(self):
+        self.renders = 0
+        self.cache_hits = 0
+        self.total_time = 0
+        self.max_time = 0
+        self.reconciles = 0
+        self.unchanged_reconciles = 0
+
+    @property
+    def cache_hit_ratio(self):
+        calls = self.renders + self.cache_hits
+        return self.cache_hits / calls if calls else None
+
+    def as_dict(self):
+        return {
+            "renders": self.renders,
+            "cache_hits": self.cache_hits,
+            "cache_hit_ratio": self.cache_hit_ratio,
+            "total_time": self.total_time,
+            "max_time": self.max_time,
+            "reconciles": self.reconciles,
+            "unchanged_reconciles": self.unchanged_reconciles,
+        }
+
+
+def get_component_name(component):
+    return type(component).__name__
+
+
+class RenderProfiler:
+    """Records how often and for how long each component renders.
+
+    Stats are kept for every component instance while it is alive and summed
+    for each component class. Render times include the time spent rendering
+    children, so a component's time is the total of the subtree it renders.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._component_stats = WeakKeyDictionary()
+        self._class_stats = {}
+        self.started_at = time()
+
+    def _get_stats(self, component):
+        stats = self._component_stats.get(component)
+        if stats is None:
+            stats = self._component_stats[component] = RenderStats()
+
+        name = get_component_name(component)
+        class_stats = self._class_stats.get(name)
+        if class_stats is None:
+            class_stats = self._class_stats[name] = RenderStats()
+
+        return stats, class_stats
+
+    def record_render(self, component, duration):
+        with self._lock:
+            for stats in self._get_stats(component):
+                stats.renders += 1
+                stats.total_time += duration
+                stats.max_time = max(stats.max_time, duration)
+
+    def record_cache_hit(self, component):
+        with self._lock:
+            for stats in self._get_stats(component):
+                stats.cache_hits += 1
+
+    def record_reconcile(self, component, changed):
+        with self._lock:
+            for stats in self._get_stats(component):
+                stats.reconciles += 1
+                if not changed:
+                    stats.unchanged_reconciles += 1
+
+    def get_stats(self, component):
+        with self._lock:
+            stats = self._component_stats.get(component)
+            return stats.as_dict() if stats is not None else None
+
+    @property
+    def class_stats(self):
+        with self._lock:
+            return {name: stats.as_dict() for name, stats in self._class_stats.items()}
+
+    def summary(self):
+        return {
+            "time": time(),
+            "started_at": self.started_at,
+            "classes": self.class_stats,
+        }
+
+    def format_tree(self, root):
+        """Describe the render stats of `root` and its children as a tree."""
+        lines = []
+
+        def add_lines(component, depth):
+            stats = self.get_stats(component)
+            description = "not rendered"
+            if stats is not None:
+                hit_ratio = stats["cache_hit_ratio"]
+                description = (
+                    f"renders={stats['renders']} "
+                    f"total={stats['total_time'] * 1000:.1f}ms "
+                    f"max={stats['max_time'] * 1000:.1f}ms "
+                    f"hits={'-' if hit_ratio is None else f'{hit_ratio:.0%}'} "
+                    f"reconciles={stats['reconciles']} "
+                    f"unchanged={stats['unchanged_reconciles']}"
+                )
+
+            lines.append(f"{'  ' * depth}{get_component_name(component)} {description}")
+            for child in getattr(component, "_children", []):
+                add_lines(child, depth + 1)
+
+        add_lines(root, 0)
+        return "\n".join(lines)
+
+    def export(self, file_path):
+        # summaries are appended as json lines so builds can be compared
+        with open(file_path, "a") as file:
+            file.write(json.dumps(self.summary()) + "\n")
+
+
+class ProfileExporter:
+    """Appends a summary of the profiler to a file every `interval` seconds."""
+
+    def __init__(self, profiler, file_path, interval=DEFAULT_EXPORT_INTERVAL):
+        self.profiler = profiler
+        self.file_path = file_path
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        self.export()
+
+    def export(self):
+        try:
+            self.profiler.export(self.file_path)
+        except Exception as e:
+            logger.error(f"Unable to export render profile to {self.file_path}: {e}")
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self.export()
+
+
+_render_profiler = None
+
+
+def get_render_profiler():
+    return _render_profiler
+
+
+def enable_render_profiler():
+    global _render_profiler
+
+    if _render_profiler is None:
+        _render_profiler = RenderProfiler()
+
+    return _render_profiler
+
+
+def disable_render_profiler():
+    global _render_profiler
+
+    _render_profiler = None
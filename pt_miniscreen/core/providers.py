@@ -0,0 +1,347 @@
+import logging
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from time import monotonic
+from weakref import WeakMethod, ref
+
+from .timer_wheel import ActiveEvent, TimerWheel
+
+logger = logging.getLogger(__name__)
+
+
+class UnknownProviderException(Exception):
+    pass
+
+
+class Subscription:
+    def __init__(self, provider, callback, active_event=None, select=None):
+        self.provider = provider
+        self.select = select
+
+        # Use weak references so that subscriptions don't keep the Component
+        # that subscribed alive, the same as intervals.
+        self._get_callback = WeakMethod(callback)
+        self._get_active_event = (
+            ref(active_event) if active_event is not None else lambda: None
+        )
+        self._has_value = False
+        self._value = None
+
+    @property
+    def callback(self):
+        return self._get_callback()
+
+    @property
+    def is_active(self):
+        active_event = self._get_active_event()
+        return active_event is None or active_event.is_set()
+
+    def call_when_active(self, callback) -> bool:
+        # returns False if callback can't be delayed until becoming active
+        active_event = self._get_active_event()
+        return isinstance(active_event, ActiveEvent) and active_event.call_when_set(
+            callback
+        )
+
+    def deliver(self, value):
+        if self.select is not None:
+            value = self.select(value)
+
+        # only call the callback when the value it last received changes
+        if self._has_value and self._value == value:
+            return
+
+        callback = self.callback
+        if callable(callback):
+            self._has_value = True
+            self._value = value
+            callback(value)
+
+    def unsubscribe(self):
+        self.provider.unsubscribe(self)
+
+
+class Provider:
+    """Fetches a value every `period` seconds while it has active subscribers.
+
+    The first fetch happens as soon as a subscriber is active, unless the
+    cached value was fetched less than a period ago. The last fetched value is
+    cached and shared by every subscriber, so a value shown by many components
+    is only fetched once per period. When a `timeout` is given fetches run on
+    their own thread, a worker only waits `timeout` seconds for them and a
+    fetch that takes longer delivers its value when it finishes. No other
+    fetch is started until it has.
+    """
+
+    def __init__(
+        self, key, fetch, timer_wheel, period=1, timeout=None, initial_value=None
+    ):
+        self.key = key
+        self.fetch = fetch
+        self.period = period
+        self.timeout = timeout
+        self.value = initial_value
+        self.last_updated = None
+
+        self._timer_wheel = timer_wheel
+        self._lock = threading.Lock()
+        self._subscriptions = []
+        self._scheduled = False
+        self._deadline = None
+        self._pending_fetch = None
+
+        # metrics used to find slow providers
+        self.fetches = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.last_fetch_duration = None
+
+    def __repr__(self):
+        return f"<Provider {self.key} every {self.period}s>"
+
+    @property
+    def has_fresh_value(self):
+        return (
+            self.last_updated is not None
+            and monotonic() - self.last_updated < self.period
+        )
+
+    @property
+    def metrics(self):
+        return {
+            "key": self.key,
+            "period": self.period,
+            "subscribers": len(self._subscriptions),
+            "fetches": self.fetches,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "last_fetch_duration": self.last_fetch_duration,
+        }
+
+    def subscribe(self, callback, active_event=None, select=None):
+        subscription = Subscription(self, callback, active_event, select)
+        with self._lock:
+            self._subscriptions.append(subscription)
+
+        # new subscribers don't have to wait for a recently fetched value
+        if self.has_fresh_value:
+            subscription.deliver(self.value)
+
+        with self._lock:
+            is_scheduled = self._scheduled
+
+        if not is_scheduled:
+            self._wait_for_active_subscriber([subscription])
+
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def publish(self, value):
+        """Cache `value` and deliver it to subscribers without fetching.
+
+        Used by providers whose values are pushed by events as well as polled.
+        """
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+
+        self.value = value
+        self.last_updated = monotonic()
+
+        for subscription in subscriptions:
+            subscription.deliver(value)
+
+    def fire(self):
+        with self._lock:
+            self._subscriptions = [
+                subscription
+                for subscription in self._subscriptions
+                if subscription.callback is not None
+            ]
+            subscriptions = list(self._subscriptions)
+            is_active = any(subscription.is_active for subscription in subscriptions)
+
+            # stop fetching when nothing is subscribed or active
+            if not is_active:
+                self._scheduled = False
+
+        if len(subscriptions) == 0:
+            return
+
+        # wait for a subscriber to be active before fetching again
+        if not is_active:
+            self._wait_for_active_subscriber(subscriptions)
+            return
+
+        self._update(subscriptions)
+
+        # aim at absolute deadlines, skipping any that were missed
+        next_deadline = self._deadline + self.period
+        now = monotonic()
+        if next_deadline < now:
+            next_deadline += ((now - next_deadline) // self.period + 1) * self.period
+
+        self._deadline = next_deadline
+        self._timer_wheel.schedule(self, next_deadline)
+
+    def _wait_for_active_subscriber(self, subscriptions):
+        for subscription in subscriptions:
+            if not subscription.call_when_active(self._resume):
+                self._resume()
+
+    def _resume(self):
+        with self._lock:
+            if self._scheduled or len(self._subscriptions) == 0:
+                return
+
+            # fetch straight away unless the cached value is still fresh
+            self._scheduled = True
+            self._deadline = (
+                self.last_updated + self.period if self.has_fresh_value else monotonic()
+            )
+
+        self._timer_wheel.schedule(self, self._deadline)
+
+    def _fetch(self):
+        start_time = monotonic()
+        try:
+            return self.fetch()
+        finally:
+            self.fetches += 1
+            self.last_fetch_duration = monotonic() - start_time
+
+    def _fetch_in_thread(self):
+        future = Future()
+
+        def run():
+            try:
+                future.set_result(self._fetch())
+            except Exception as e:
+                future.set_exception(e)
+
+        # daemon threads so a fetch that never returns can't block exiting
+        threading.Thread(target=run, name=f"fetch {self.key}", daemon=True).start()
+        return future
+
+    def _update(self, subscriptions):
+        if self.timeout is None:
+            try:
+                value = self._fetch()
+            except Exception as e:
+                self._on_fetch_error(e)
+                return
+
+            self.publish(value)
+            return
+
+        with self._lock:
+            # skip this period while a fetch that timed out is still running
+            if self._pending_fetch is not None and not self._pending_fetch.done():
+                logger.debug(f"{self} previous fetch still running, skipping")
+                return
+
+            future = self._pending_fetch = self._fetch_in_thread()
+
+        try:
+            value = future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            logger.warning(
+                f"{self} fetch took longer than {self.timeout}s, "
+                "its value is delivered when it finishes"
+            )
+            self.timeouts += 1
+            future.add_done_callback(self._on_late_fetch)
+            return
+        except Exception as e:
+            self._on_fetch_error(e)
+            return
+
+        self.publish(value)
+
+    def _on_late_fetch(self, future):
+        try:
+            value = future.result()
+        except Exception as e:
+            self._on_fetch_error(e)
+            return
+
+        self.publish(value)
+
+    def _on_fetch_error(self, error):
+        logger.error(f"{self} failed to fetch: {error}")
+        self.errors += 1
+
+
+class ProviderRegistry:
+    """Shares values that are slow to fetch between components.
+
+    Providers are registered with a key and fetch on a pool of worker threads
+    separate from the intervals, so blocking calls can't delay animations.
+    Providers with a timeout fetch on a thread of their own so a slow fetch
+    can't keep a worker busy either.
+    """
+
+    def __init__(self, workers=4):
+        self._providers = {}
+        self._lock = threading.Lock()
+        self._timer_wheel = TimerWheel(workers=workers)
+
+    def __contains__(self, key):
+        return key in self._providers
+
+    def register(self, key, fetch, period=1, timeout=None, initial_value=None):
+        with self._lock:
+            provider = self._providers.get(key)
+            if provider is not None:
+                logger.debug(f"Updating provider {key}")
+                provider.fetch = fetch
+                provider.period = period
+                provider.timeout = timeout
+                return provider
+
+            provider = Provider(
+                key,
+                fetch,
+                self._timer_wheel,
+                period=period,
+                timeout=timeout,
+                initial_value=initial_value,
+            )
+            self._providers[key] = provider
+            return provider
+
+    def get(self, key):
+        try:
+            return self._providers[key]
+        except KeyError:
+            raise UnknownProviderException(f"No provider registered for {key}")
+
+    def subscribe(self, key, callback, active_event=None, select=None):
+        return self.get(key).subscribe(callback, active_event, select)
+
+    def get_metrics(self):
+        return [provider.metrics for provider in self._providers.values()]
+
+
+_provider_registry = None
+_provider_registry_lock = threading.Lock()
+
+
+def get_provider_registry():
+    global _provider_registry
+
+    with _provider_registry_lock:
+        if _provider_registry is None:
+            _provider_registry = ProviderRegistry()
+
+        return _provider_registry
+
+
+def register_provider(key, fetch, period=1, timeout=None, initial_value=None):
+    return get_provider_registry().register(
+        key, fetch, period=period, timeout=timeout, initial_value=initial_value
+    )
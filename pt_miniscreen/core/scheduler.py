@@ -0,0 +1,149 @@
+import logging
+import threading
+from time import perf_counter, sleep
+
+from .animation import get_animation_clock
+
+logger = logging.getLogger(__name__)
+
+
+class RenderScheduler:
+    """Runs renders on a single thread at no more than `max_fps`.
+
+    Invalidations from any thread only mark a render as pending, all of the
+    invalidations that arrive before the next tick are coalesced into a single
+    render. The animation clock is ticked after each render so transitions
+    step once per displayed frame. Errors raised by render are passed to
+    `on_error` when it is given, otherwise they are logged.
+    """
+
+    def __init__(self, render, max_fps=30, animation_clock=None, on_error=None):
+        assert max_fps > 0
+
+        self._render = render
+        self._on_error = on_error
+        self.frame_interval = 1 / max_fps
+        self._animation_clock = animation_clock or get_animation_clock()
+
+        self._lock = threading.Lock()
+        self._pending = False
+        self._running = False
+        self._pending_event = threading.Event()
+        self._thread = None
+        self._last_render_time = None
+
+        self.frames_rendered = 0
+        self.invalidations_coalesced = 0
+        self.dropped_ticks = 0
+
+    @property
+    def stats(self):
+        with self._lock:
+            return {
+                "frames_rendered": self.frames_rendered,
+                "invalidations_coalesced": self.invalidations_coalesced,
+                "dropped_ticks": self.dropped_ticks,
+            }
+
+    @property
+    def is_running(self):
+        return self._running
+
+    def start(self):
+        if self._running:
+            return
+
+        # ticks start from when the scheduler starts
+        self._last_render_time = perf_counter()
+        self._running = True
+        self._animation_clock.attach(self.frame_interval)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        was_running = self._running
+        if was_running:
+            self._animation_clock.detach(self.frame_interval)
+
+        self._running = False
+        self._pending_event.set()
+
+        # the render thread can stop the scheduler when rendering fails
+        thread = self._thread
+        stopped_by_render_thread = thread is threading.current_thread()
+        if thread is not None and not stopped_by_render_thread:
+            thread.join()
+
+        self._thread = None
+
+        # render the last invalidation so the final frame is displayed
+        if was_running and not stopped_by_render_thread:
+            self._render_pending()
+
+    def _render_pending(self):
+        with self._lock:
+            pending = self._pending
+            self._pending_event.clear()
+            self._pending = False
+
+        if not pending:
+            return
+
+        self._render_frame()
+        with self._lock:
+            self.frames_rendered += 1
+
+    def _render_frame(self):
+        try:
+            self._render()
+        except Exception as e:
+            logger.error(f"Error rendering scheduled frame: {e}")
+            if self._on_error is not None:
+                self._on_error(e)
+
+    def invalidate(self):
+        with self._lock:
+            if self._pending:
+                self.invalidations_coalesced += 1
+                return
+
+            self._pending = True
+
+        self._pending_event.set()
+
+    def _wait_for_next_tick(self):
+        if self._last_render_time is None:
+            return
+
+        remaining_time = self._last_render_time + self.frame_interval - perf_counter()
+        if remaining_time > 0:
+            sleep(remaining_time)
+
+    def _run(self):
+        while self._running:
+            self._pending_event.wait()
+            if not self._running:
+                return
+
+            self._wait_for_next_tick()
+
+            with self._lock:
+                self._pending_event.clear()
+                self._pending = False
+
+            start_time = perf_counter()
+            self._render_frame()
+            end_time = perf_counter()
+            self._last_render_time = start_time
+
+            # ticks that passed while rendering could not be used for a frame
+            render_time = end_time - start_time
+            with self._lock:
+                self.frames_rendered += 1
+                self.dropped_ticks += int(render_time // self.frame_interval)
+
+            # on_error may have stopped the scheduler
+            if not self._running:
+                return
+
+            self._animation_clock.tick()
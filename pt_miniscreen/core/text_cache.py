@@ -0,0 +1,287 @@
+import logging
+import threading
+from collections import OrderedDict, namedtuple
+from math import ceil, floor
+from weakref import WeakKeyDictionary, ref
+
+import PIL.Image
+import PIL.ImageDraw
+
+logger = logging.getLogger(__name__)
+
+# a full 128x64 frame is 1KiB so this holds plenty of long marquee strips
+DEFAULT_MAX_BYTES = 256 * 1024
+DEFAULT_MAX_MEASUREMENTS = 4096
+
+TextRaster = namedtuple("TextRaster", ["mask", "origin"])
+
+
+def get_mask_bytes(mask):
+    return (mask.width + 7) // 8 * mask.height
+
+
+def rasterise_text(text, font, spacing=0, align="left", anchor=None):
+    """Draw text on a 1 bit mask large enough to hold all of it.
+
+    Returns the mask and the position within it that text was drawn at.
+    Drawing the mask at a position minus its origin produces the same pixels
+    as drawing the text at that position.
+    """
+    options = {
+        "text": text,
+        "font": font,
+        "spacing": spacing,
+        "align": align,
+        "anchor": anchor,
+    }
+
+    draw = PIL.ImageDraw.Draw(PIL.Image.new("1", (0, 0), color="black"))
+    bounding_box = draw.textbbox((0, 0), **options)
+
+    # glyphs can be drawn before the anchor so move them into the mask
+    origin = (max(-floor(bounding_box[0]), 0), max(-floor(bounding_box[1]), 0))
+    size = (
+        max(ceil(bounding_box[2]) + origin[0], 0),
+        max(ceil(bounding_box[3]) + origin[1], 0),
+    )
+
+    mask = PIL.Image.new("1", size)
+    PIL.ImageDraw.Draw(mask).text(origin, fill=1, **options)
+    return TextRaster(mask, origin)
+
+
+def draw_text_raster(image, raster, xy, fill=1):
+    PIL.ImageDraw.Draw(image).bitmap(
+        (xy[0] - raster.origin[0], xy[1] - raster.origin[1]), raster.mask, fill=fill
+    )
+
+
+class TextRasterCache:
+    """Least recently used cache of rasterised text with a byte budget.
+
+    Rasters are masks so the same raster is used for every fill colour. Text
+    that is drawn often, such as scrolling marquee text, is only rasterised
+    once while it stays in the cache.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._rasters = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._rasters),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def get(self, text, font, spacing=0, align="left", anchor=None):
+        key = (text, font, spacing, align, anchor)
+
+        with self._lock:
+            raster = self._rasters.get(key)
+            if raster is not None:
+                self._rasters.move_to_end(key)
+                self.hits += 1
+                return raster
+
+            self.misses += 1
+
+        raster = rasterise_text(text, font, spacing=spacing, align=align, anchor=anchor)
+
+        raster_bytes = get_mask_bytes(raster.mask)
+        if raster_bytes > self.max_bytes:
+            logger.debug(f"Text raster too large to cache: {raster_bytes} bytes")
+            return raster
+
+        with self._lock:
+            if key not in self._rasters:
+                self._rasters[key] = raster
+                self._bytes += raster_bytes
+
+            while self._bytes > self.max_bytes:
+                _, evicted = self._rasters.popitem(last=False)
+                self._bytes -= get_mask_bytes(evicted.mask)
+                self.evictions += 1
+
+        return raster
+
+    def clear(self):
+        with self._lock:
+            self._rasters.clear()
+            self._bytes = 0
+
+
+def measure_text(draw, text, font):
+    bounding_box = draw.textbbox((0, 0), text=text, font=font)
+    return (
+        bounding_box[2] - bounding_box[0],
+        bounding_box[3] - bounding_box[1],
+    )
+
+
+class TextMeasurementCache:
+    """Bounded cache of text sizes and wrapped text shared by every component.
+
+    Entries are keyed by the id of the font so fonts aren't kept alive by the
+    cache, each entry holds a weak reference to its font so an entry for a
+    font that has been garbage collected is never returned for a new font
+    that reuses the id.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_MEASUREMENTS):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._advances = WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._draw = PIL.ImageDraw.Draw(PIL.Image.new("1", (0, 0), color="black"))
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _get(self, key, font, measure):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0]() is font:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+            self.misses += 1
+
+        value = measure()
+
+        with self._lock:
+            self._entries[key] = (ref(font), value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return value
+
+    def get_text_size(self, text, font):
+        return self._get(
+            ("size", id(font), text),
+            font,
+            lambda: measure_text(self._draw, text, font),
+        )
+
+    def create_wrapped_text(self, text, font, max_width):
+        return self._get(
+            ("wrap", id(font), text, max_width),
+            font,
+            lambda: self._wrap_text(text, font, max_width),
+        )
+
+    def _get_advance(self, font, text):
+        with self._lock:
+            advances = self._advances.setdefault(font, {})
+
+        total = 0
+        for character in text:
+            advance = advances.get(character)
+            if advance is None:
+                # newlines can't be measured, the line is measured later anyway
+                advance = advances[character] = (
+                    self._draw.textlength(character, font=font)
+                    if character != "\n"
+                    else 0
+                )
+
+            total += advance
+
+        return total
+
+    def _fits(self, words, font, max_width):
+        line = " ".join(words)
+        return measure_text(self._draw, line, font)[0] < max_width
+
+    def _wrap_text(self, text, font, max_width):
+        words = text.split(" ")
+        space_advance = self._get_advance(font, " ")
+        lines = []
+        start = 0
+
+        while start < len(words):
+            # estimate how many words fit using the advance of each glyph
+            end = start + 1
+            width = self._get_advance(font, words[start])
+            while end < len(words):
+                width += space_advance + self._get_advance(font, words[end])
+                if width >= max_width:
+                    break
+
+                end += 1
+
+            # measure the line to correct the estimate, the first word is
+            # always used even if it doesn't fit
+            while end > start + 1:
+                if self._fits(words[start:end], font, max_width):
+                    break
+
+                end -= 1
+
+            while end < len(words):
+                if not self._fits(words[start : end + 1], font, max_width):
+                    break
+
+                end += 1
+
+            lines.append(" ".join(words[start:end]))
+            start = end
+
+        return "\n".join(lines)
+
+
+_text_measurement_cache = TextMeasurementCache()
+
+
+def get_text_measurement_cache():
+    return _text_measurement_cache
+
+
+def get_text_size(text, font):
+    return _text_measurement_cache.get_text_size(text, font)
+
+
+def create_wrapped_text(text, font, max_width):
+    return _text_measurement_cache.create_wrapped_text(text, font, max_width)
+
+
+_text_raster_cache = None
+_text_raster_cache_lock = threading.Lock()
+
+
+def get_text_raster_cache():
+    global _text_raster_cache
+
+    with _text_raster_cache_lock:
+        if _text_raster_cache is None:
+            _text_raster_cache = TextRasterCache()
+
+        return _text_raster_cache
@@ -0,0 +1,143 @@
+import heapq
+import logging
+import threading
+from itertools import count
+from queue import SimpleQueue
+from time import monotonic
+
+logger = logging.getLogger(__name__)
+
+
+class ActiveEvent(threading.Event):
+    """Event that can run callbacks the next time it is set.
+
+    Timers use this to stop running while their component is paused without
+    holding a thread that waits for the event.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._callbacks_lock = threading.Lock()
+        self._callbacks = []
+
+    def call_when_set(self, callback) -> bool:
+        """Call `callback` the next time the event is set.
+
+        Returns False without storing the callback if the event is already set.
+        """
+        with self._callbacks_lock:
+            if self.is_set():
+                return False
+
+            if callback not in self._callbacks:
+                self._callbacks.append(callback)
+
+            return True
+
+    def remove_callback(self, callback):
+        with self._callbacks_lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def set(self):
+        with self._callbacks_lock:
+            super().set()
+            callbacks = self._callbacks
+            self._callbacks = []
+
+        for callback in callbacks:
+            callback()
+
+
+class TimerWheel:
+    """Runs scheduled callbacks from one scheduler thread and a few workers.
+
+    Timers are kept in a heap ordered by deadline. When a deadline is reached
+    the scheduler hands the timer to a worker thread so that slow callbacks
+    don't delay other timers.
+    """
+
+    def __init__(self, workers=4):
+        self._workers = workers
+        self._heap = []
+        self._sequence = count()
+        self._condition = threading.Condition()
+        self._queue = SimpleQueue()
+        self._started = False
+
+    def _start(self):
+        self._started = True
+
+        # threads are daemons so that timers don't keep the process alive
+        threading.Thread(
+            target=self._run_scheduler, name="TimerWheel", daemon=True
+        ).start()
+        for index in range(self._workers):
+            threading.Thread(
+                target=self._run_worker, name=f"TimerWheel-{index}", daemon=True
+            ).start()
+
+    @property
+    def scheduled(self):
+        with self._condition:
+            return len(self._heap)
+
+    def schedule(self, timer, deadline):
+        """Call `timer.fire()` on a worker thread once `deadline` is reached.
+
+        `deadline` is a time.monotonic timestamp.
+        """
+        with self._condition:
+            if not self._started:
+                self._start()
+
+            heapq.heappush(self._heap, (deadline, next(self._sequence), timer))
+            self._condition.notify()
+
+    def _run_scheduler(self):
+        while True:
+            with self._condition:
+                while True:
+                    if len(self._heap) == 0:
+                        self._condition.wait()
+                        continue
+
+                    wait_time = self._heap[0][0] - monotonic()
+                    if wait_time > 0:
+                        self._condition.wait(wait_time)
+                        continue
+
+                    _, _, timer = heapq.heappop(self._heap)
+                    break
+
+            self._queue.put(timer)
+
+            # drop the reference so cancelled timers can be garbage collected
+            timer = None
+
+    def _run_worker(self):
+        while True:
+            timer = self._queue.get()
+            try:
+                timer.fire()
+            except Exception as e:
+                logger.error(f"Error running timer {timer}: {e}")
+
+            timer = None
+
+
+_timer_wheels = {}
+_timer_wheel_lock = threading.Lock()
+
+
+def get_timer_wheel(blocking=False):
+    """Get the shared timer wheel.
+
+    Timers that may block, such as those polling the system, get a wheel of
+    their own so they can't occupy the workers that run animations.
+    """
+    with _timer_wheel_lock:
+        if blocking not in _timer_wheels:
+            _timer_wheels[blocking] = TimerWheel()
+
+        return _timer_wheels[blocking]
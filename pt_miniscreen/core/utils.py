@@ -1,30 +1,90 @@
+import threading
+from contextlib import contextmanager
 from itertools import cycle
 from logging import getLogger
-from math import ceil, floor
-from time import sleep, time
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageChops, ImageDraw, ImageFont
+
+from .animation import get_animation_clock
 
 logger = getLogger(__name__)
 
 # rendering
 
+# stack of layer recordings for the renders in progress on each thread
+_layer_recordings = threading.local()
+
+
+@contextmanager
+def record_layers(image):
+    """Record the layers applied directly to `image` while rendering.
+
+    Yields a dictionary that has it's "layers" key set to the last list of
+    layers applied to `image`, or None if apply_layers was not called with it.
+    """
+    recording = {"image": image, "layers": None}
+    recordings = getattr(_layer_recordings, "stack", None)
+    if recordings is None:
+        recordings = _layer_recordings.stack = []
+
+    recordings.append(recording)
+    try:
+        yield recording
+    finally:
+        recordings.pop()
+
 
 def apply_layers(image, layers):
+    layers = list(layers)
     for layer in layers:
         layer(image)
 
+    # let the component being rendered know how it's image was composed
+    recordings = getattr(_layer_recordings, "stack", None)
+    if recordings and recordings[-1]["image"] is image:
+        recordings[-1]["layers"] = layers
+
     return image
 
 
-def layer(render, size, pos=(0, 0), transparent=True):
-    bounding_box = (pos[0], pos[1], pos[0] + size[0], pos[1] + size[1])
-    return lambda image: image.paste(
-        render(image.crop(bounding_box) if transparent else Image.new("1", size)),
-        pos,
+def boxes_overlap(box_one, box_two):
+    return (
+        box_one[0] < box_two[2]
+        and box_two[0] < box_one[2]
+        and box_one[1] < box_two[3]
+        and box_two[1] < box_one[3]
     )
 
 
+class Layer:
+    def __init__(self, render, size, pos=(0, 0), transparent=True):
+        self.render = render
+        self.size = size
+        self.pos = pos
+        self.transparent = transparent
+        self.bounding_box = (pos[0], pos[1], pos[0] + size[0], pos[1] + size[1])
+
+        # image passed to render when the layer was last applied
+        self.input = None
+
+    def __call__(self, image):
+        self.input = (
+            image.crop(self.bounding_box)
+            if self.transparent
+            else Image.new("1", self.size)
+        )
+        image.paste(self.render(self.input), self.pos)
+
+    def reapply(self, image):
+        # paste the current output for the input the layer was last applied
+        # with, renders are cached so this is cheap when the input is the same
+        image.paste(self.render(self.input), self.pos)
+
+
+def layer(render, size, pos=(0, 0), transparent=True):
+    return Layer(render, size, pos, transparent)
+
+
 # render methods
 
 
@@ -88,77 +148,136 @@ def offset_to_center(container, element, rounding_function=int):
 # text
 
 
+class FontRegistry:
+    """Loads each font face at each size once and shares it.
+
+    Loading a font opens and parses the font file, fonts are immutable once
+    loaded so every component can share the same instance.
+    """
+
+    def __init__(self):
+        self._fonts = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def stats(self):
+        with self._lock:
+            return {
+                "fonts": len(self._fonts),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def get(self, face, size):
+        key = (face, size)
+
+        with self._lock:
+            font = self._fonts.get(key)
+            if font is not None:
+                self.hits += 1
+                return font
+
+            self.misses += 1
+
+        font = ImageFont.truetype(face, size=size)
+
+        with self._lock:
+            return self._fonts.setdefault(key, font)
+
+
+_font_registry = FontRegistry()
+
+
+def get_font_registry():
+    return _font_registry
+
+
 def get_mono_font(size, bold=False, italics=False):
     if bold and not italics:
-        return ImageFont.truetype("VeraMoBd.ttf", size=size)
+        return _font_registry.get("VeraMoBd.ttf", size)
 
     if not bold and italics:
-        return ImageFont.truetype("VeraMoIt.ttf", size=size)
+        return _font_registry.get("VeraMoIt.ttf", size)
 
     if bold and italics:
-        return ImageFont.truetype("VeraMoBI.ttf", size=size)
+        return _font_registry.get("VeraMoBI.ttf", size)
 
-    return ImageFont.truetype("VeraMono.ttf", size=size)
+    return _font_registry.get("VeraMono.ttf", size)
 
 
 def get_font(size, bold=False, italics=False):
     if size >= 12:
         if bold and not italics:
-            return ImageFont.truetype("Roboto-Bold.ttf", size=size)
+            return _font_registry.get("Roboto-Bold.ttf", size)
 
         if not bold and italics:
-            return ImageFont.truetype("Roboto-Italic.ttf", size=size)
+            return _font_registry.get("Roboto-Italic.ttf", size)
 
         if bold and italics:
-            return ImageFont.truetype("Roboto-BoldItalic.ttf", size=size)
+            return _font_registry.get("Roboto-BoldItalic.ttf", size)
 
-        return ImageFont.truetype("Roboto-Regular.ttf", size=size)
+        return _font_registry.get("Roboto-Regular.ttf", size)
 
     return get_mono_font(size, bold, italics)
 
 
+def preload_fonts(sizes, bold=False, italics=False):
+    """Load fonts before they are first used, such as while the app starts."""
+    for size in sizes:
+        try:
+            get_font(size, bold, italics)
+        except Exception as e:
+            logger.warning(f"Unable to preload font of size {size}: {e}")
+
+
 # image
 
 
+def get_image_bytes(image):
+    # mode and size are included so images with the same raw data but a
+    # different shape are not considered equal
+    return (image.mode, image.size, image.tobytes())
+
+
 def is_same_image(image_one, image_two) -> bool:
+    # an image is always the same as itself, avoid reading it's pixels
+    if image_one is image_two and image_one is not None:
+        return True
+
     try:
-        return list(image_one.getdata()) == list(image_two.getdata())
+        return get_image_bytes(image_one) == get_image_bytes(image_two)
     except Exception:
         return False
 
 
-# generators
-
-
-def transition(distance, duration, base_step=1):
-    steps = ceil(distance / base_step)
-    step_duration = duration / steps
-    start_time = time()
-    travelled = 0
-
-    while travelled < distance:
-        current_time = time()
-        elapsed_time = current_time - start_time
-        expected_time = duration * travelled / distance
-        lag_time = max(elapsed_time - expected_time, 0)
+def invert(image, box=None):
+    """Invert the pixels of a 1 bit image, or only those within `box`.
 
-        # correct for lag time by increasing the size of the step
-        corrected_step = base_step + floor(lag_time / step_duration)
+    Images are kept in mode "1" rather than converted to greyscale and back,
+    other modes are converted to "1" first. A new image is returned.
+    """
+    if image.mode != "1":
+        image = image.convert("1")
 
-        # clamp step so it does not cause us to travel more than distance
-        clamped_step = min(corrected_step, distance - travelled)
+    if box is None:
+        return ImageChops.logical_xor(image, Image.new("1", image.size, 1))
 
-        # calculate lag that has not been accounted for in the corrected step
-        remaining_lag = lag_time % step_duration
+    region = image.crop(box)
+    inverted = image.copy()
+    inverted.paste(
+        ImageChops.logical_xor(region, Image.new("1", region.size, 1)), box[:2]
+    )
+    return inverted
 
-        # correct for remaining lag in wait time
-        sleep(max(step_duration - remaining_lag, 0))
 
-        yield clamped_step
+# generators
 
-        travelled = travelled + clamped_step
 
-    logger.debug(f"transition took {time() - start_time} seconds")
+def transition(distance, duration, easing="linear"):
+    # transitions share the animation clock so steps follow displayed frames
+    return get_animation_clock().transition(distance, duration, easing=easing)
 
 
 def carousel(end, start=0, step=1):
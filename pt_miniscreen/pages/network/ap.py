@@ -1,36 +1,33 @@
 from functools import partial
-from typing import Any, Dict
 
 from pitop.common.sys_info import get_ap_mode_status
 
 from pt_miniscreen.components.icon_text_row import IconTextRow
 from pt_miniscreen.components.info_page import InfoPage
+from pt_miniscreen.core.providers import register_provider
 from pt_miniscreen.utils import get_image_file_path
 
 
-class APPageRow(IconTextRow):
-    previous_ap_status: Dict[Any, Any] = {}
+def get_status():
+    return get_ap_mode_status()
 
-    def __init__(self, icon_path, attribute, default_text="", **kwargs):
-        self._attribute = attribute
-        self._default_text = default_text
-        initial_text = self.previous_ap_status.get(attribute, default_text)
 
+class APPageRow(IconTextRow):
+    def __init__(self, icon_path, attribute, default_text="", **kwargs):
+        # every row shows part of the same status, which is only fetched once
         super().__init__(
             **kwargs,
-            text=initial_text,
-            get_text=self.get_text,
+            text=default_text,
+            text_provider="ap_mode_status",
+            select_text=lambda status: status.get(attribute, default_text),
             icon_path=icon_path,
         )
 
-    def get_text(self):
-        status = get_ap_mode_status()
-        self.__class__.previous_ap_status = status
-        return status.get(self._attribute, self._default_text)
-
 
 class APPage(InfoPage):
     def __init__(self, **kwargs):
+        register_provider("ap_mode_status", get_status)
+
         super().__init__(
             **kwargs,
             title="Wi-Fi Hotspot",
@@ -4,11 +4,18 @@ from pitop.common.sys_info import get_internal_ip
 
 from pt_miniscreen.components.icon_text_row import IconTextRow, Row
 from pt_miniscreen.components.info_page import InfoPage
+from pt_miniscreen.core.providers import register_provider
 from pt_miniscreen.utils import get_image_file_path
 
 
+def get_ip_address():
+    return get_internal_ip(iface="eth0")
+
+
 class EthernetPage(InfoPage):
     def __init__(self, **kwargs):
+        register_provider("ethernet_ip_address", get_ip_address)
+
         super().__init__(
             **kwargs,
             title="Ethernet",
@@ -17,8 +24,7 @@ class EthernetPage(InfoPage):
                 partial(
                     IconTextRow,
                     icon_path=get_image_file_path("sys_info/networking/home-small.png"),
-                    text=get_internal_ip(iface="eth0"),
-                    get_text=lambda: get_internal_ip(iface="eth0"),
+                    text_provider="ethernet_ip_address",
                 ),
                 Row,  # empty row
             ]
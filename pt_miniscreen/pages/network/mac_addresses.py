@@ -4,6 +4,7 @@ from psutil import net_if_addrs, AF_LINK
 
 from pt_miniscreen.components.info_page import InfoPage
 from pt_miniscreen.core.components.marquee_text import MarqueeText
+from pt_miniscreen.core.providers import register_provider
 
 
 iface_name_lookup = {
@@ -33,9 +34,22 @@ def iface_mac_address(iface_name: str) -> str:
     return txt
 
 
+def get_mac_addresses():
+    return {
+        iface_name: iface_mac_address(iface_name) for iface_name in iface_name_lookup
+    }
+
+
 class MacAddressesPage(InfoPage):
     def __init__(self, **kwargs):
-        Row = partial(MarqueeText, font_size=10, vertical_align="center")
+        register_provider("mac_addresses", get_mac_addresses)
+
+        Row = partial(
+            MarqueeText,
+            font_size=10,
+            vertical_align="center",
+            text_provider="mac_addresses",
+        )
 
         super().__init__(
             **kwargs,
@@ -43,18 +57,15 @@ class MacAddressesPage(InfoPage):
             Rows=[
                 partial(
                     Row,
-                    text=iface_mac_address("wlan0"),
-                    get_text=lambda: iface_mac_address("wlan0"),
+                    select_text=lambda mac_addresses: mac_addresses["wlan0"],
                 ),
                 partial(
                     Row,
-                    text=iface_mac_address("eth0"),
-                    get_text=lambda: iface_mac_address("eth0"),
+                    select_text=lambda mac_addresses: mac_addresses["eth0"],
                 ),
                 partial(
                     Row,
-                    text=iface_mac_address("wlan_ap0"),
-                    get_text=lambda: iface_mac_address("wlan_ap0"),
+                    select_text=lambda mac_addresses: mac_addresses["wlan_ap0"],
                 ),
             ],
         )
@@ -5,6 +5,7 @@ from pitop.common.sys_info import get_internal_ip
 
 from pt_miniscreen.components.icon_text_row import IconTextRow, Row
 from pt_miniscreen.components.info_page import InfoPage
+from pt_miniscreen.core.providers import register_provider
 from pt_miniscreen.utils import get_image_file_path
 
 
@@ -21,6 +22,8 @@ def get_ip_address():
 
 class USBPage(InfoPage):
     def __init__(self, **kwargs):
+        register_provider("usb_ip_address", get_ip_address)
+
         super().__init__(
             **kwargs,
             title="USB",
@@ -29,8 +32,7 @@ class USBPage(InfoPage):
                 partial(
                     IconTextRow,
                     icon_path=get_image_file_path("sys_info/networking/home-small.png"),
-                    text=get_ip_address(),
-                    get_text=get_ip_address,
+                    text_provider="usb_ip_address",
                 ),
                 Row,  # empty row
             ]
@@ -7,6 +7,7 @@ from pt_miniscreen.components.icon_text_row import IconTextRow, Row
 from pt_miniscreen.components.info_page import InfoPage
 from pt_miniscreen.components.wifi_strength import WifiStrength
 from pt_miniscreen.core.components.image import Image
+from pt_miniscreen.core.providers import register_provider
 from pt_miniscreen.utils import get_image_file_path
 
 
@@ -30,8 +31,15 @@ def get_ip_address():
         return ip
 
 
+def register_providers():
+    register_provider("wifi_ssid", get_ssid)
+    register_provider("wifi_ip_address", get_ip_address)
+
+
 class WifiPage(InfoPage):
     def __init__(self, **kwargs):
+        register_providers()
+
         super().__init__(
             **kwargs,
             title="Wi-Fi",
@@ -52,14 +60,12 @@ class WifiPage(InfoPage):
                 ),
                 partial(
                     IconTextRow,
-                    text=get_ssid(),
-                    get_text=get_ssid,
+                    text_provider="wifi_ssid",
                     icon_path=get_image_file_path("sys_info/networking/wifi-small.png"),
                 ),
                 partial(
                     IconTextRow,
-                    text=get_ip_address(),
-                    get_text=get_ip_address,
+                    text_provider="wifi_ip_address",
                     icon_path=get_image_file_path("sys_info/networking/home-small.png"),
                 ),
             ]
@@ -5,6 +5,7 @@ from pt_miniscreen.core.component import Component
 from pt_miniscreen.components.mixins import Poppable
 from pt_miniscreen.core.components.text import Text
 from pt_miniscreen.core.components.image import Image
+from pt_miniscreen.core.providers import register_provider
 from pt_miniscreen.utils import get_image_file_path
 from pt_miniscreen.core.utils import apply_layers, layer, offset_to_center
 
@@ -31,13 +32,25 @@ def _stop_systemd_service(service_name: str) -> None:
         logging.error(f"Error stopping service {service_name}: {e}")
 
 
+def get_pairing_text():
+    try:
+        if get_bluetooth_server_name is None:
+            return "further-link not installed"
+        return f"On Further, connect to {get_bluetooth_server_name()}"
+    except Exception as e:
+        logging.warning(f"Failed to get bluetooth server name: {e}")
+        return "Error"
+
+
 class BluetoothPairingPage(Component, Poppable):
     def __init__(self, **kwargs):
+        register_provider("bluetooth_pairing_text", get_pairing_text)
+
         super().__init__(**kwargs)
         self.text = self.create_child(
             Text,
             text="\nLoading ...\n",
-            get_text=self.get_text,
+            text_provider="bluetooth_pairing_text",
             font_size=10,
         )
         self.image = self.create_child(
@@ -52,15 +65,6 @@ class BluetoothPairingPage(Component, Poppable):
     def cleanup(self):
         _stop_systemd_service("further-link-bluetooth-pairing.service")
 
-    def get_text(self):
-        try:
-            if get_bluetooth_server_name is None:
-                return "further-link not installed"
-            return f"On Further, connect to {get_bluetooth_server_name()}"
-        except Exception as e:
-            logging.warning(f"Failed to get bluetooth server name: {e}")
-            return "Error"
-
     def render(self, image):
         FONT_SIZE = 10
         TEXT_POS = (
@@ -2,13 +2,14 @@ from functools import partial
 import logging
 from math import ceil
 
-from pitop.battery import Battery
 from pitop.common.sys_info import get_pi_top_ip
 
 from pt_miniscreen.core import Component
 from pt_miniscreen.core.components.image import Image
 from pt_miniscreen.core.components.text import Text
+from pt_miniscreen.core.providers import register_provider
 from pt_miniscreen.core.utils import apply_layers, layer, rectangle
+from pt_miniscreen.system_metrics import BATTERY_STATE, get_system_metrics_sampler
 from pt_miniscreen.utils import get_image_file_path
 from pt_miniscreen.components.mixins import Enterable, HasGutterIcons
 from pt_miniscreen.core.components.marquee_text import MarqueeText
@@ -32,31 +33,28 @@ IP_TEXT_LEFT = BATTERY_LEFT
 
 ROW_SPACING = 10
 
-# battery lives to the end of the process so we must create it globally to avoid
-# memory leaks
-battery = Battery()
 
+def cable_connected(battery_state):
+    return battery_state.is_charging or battery_state.is_full
 
-def cable_connected():
-    return battery.is_charging or battery.is_full
 
+def get_capacity_text(battery_state):
+    capacity = battery_state.capacity
+    return "Unknown" if capacity is None else f"{capacity}%"
 
-def get_capacity_text():
-    return "Unknown" if battery.capacity is None else f"{battery.capacity}%"
 
-
-def get_capacity_size():
-    if cable_connected():
+def get_capacity_size(battery_state):
+    if cable_connected(battery_state):
         return (0, 0)
 
-    capacity_width = ceil(MAX_CAPACITY_SIZE[0] * battery.capacity / 100)
+    capacity_width = ceil(MAX_CAPACITY_SIZE[0] * battery_state.capacity / 100)
     return (capacity_width, MAX_CAPACITY_SIZE[1])
 
 
-def get_battery_image_path():
+def get_battery_image_path(battery_state):
     return get_image_file_path(
         "sys_info/battery_shell_charging.png"
-        if cable_connected()
+        if cable_connected(battery_state)
         else "sys_info/battery_shell_empty.png"
     )
 
@@ -85,35 +83,34 @@ def package_is_installed(package_name: str) -> bool:
 
 class OverviewPageBase(Component):
     def __init__(self, **kwargs):
-        super().__init__(**kwargs, initial_state={"capacity_size": get_capacity_size()})
+        register_provider("pi_top_ip", get_ip, period=3)
+
+        battery_state = get_system_metrics_sampler().battery_state
+        super().__init__(
+            **kwargs, initial_state={"capacity_size": get_capacity_size(battery_state)}
+        )
 
         self.battery_image = self.create_child(
             Image,
-            image_path=get_battery_image_path(),
+            image_path=get_battery_image_path(battery_state),
         )
 
         self.capacity_text = self.create_child(
             Text,
-            text=get_capacity_text(),
+            text=get_capacity_text(battery_state),
             font_size=CAPACITY_FONT_SIZE,
             vertical_align="center",
         )
 
         self.ip_text = self.create_child(
             MarqueeText,
-            text=get_ip(),
-            get_text=get_ip,
-            get_text_interval=3,
+            text_provider="pi_top_ip",
             font_size=IP_FONT_SIZE,
             align="center",
             vertical_align="bottom",
         )
 
-        # setup battery callbacks
-        battery.on_capacity_change = lambda _: self.update_battery_properties()
-        battery.when_charging = self.update_battery_properties
-        battery.when_full = self.update_battery_properties
-        battery.when_discharging = self.update_battery_properties
+        self.subscribe(BATTERY_STATE, self.update_battery_properties)
 
     @property
     def enterable_component(self):
@@ -122,16 +119,15 @@ class OverviewPageBase(Component):
     def bottom_gutter_icon(self):
         return get_image_file_path("gutter/bluetooth.png")
 
-    def cleanup(self):
-        battery.on_capacity_change = None
-        battery.when_charging = None
-        battery.when_full = None
-        battery.when_discharging = None
+    def update_battery_properties(self, battery_state):
+        self.capacity_text.state.update({"text": get_capacity_text(battery_state)})
+        self.battery_image.state.update(
+            {"image_path": get_battery_image_path(battery_state)}
+        )
+        self.state.update({"capacity_size": get_capacity_size(battery_state)})
 
-    def update_battery_properties(self):
-        self.capacity_text.state.update({"text": get_capacity_text()})
-        self.battery_image.state.update({"image_path": get_battery_image_path()})
-        self.state.update({"capacity_size": get_capacity_size()})
+    def layout_key(self):
+        return ()
 
     def render(self, image):
         BATTERY_OFFSET = -10  # offset from the vertical center of the page
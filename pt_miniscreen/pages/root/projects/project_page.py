@@ -35,7 +35,7 @@ class ProjectPage(Component, Poppable, BlocksMiniscreenButtons):
         return True
 
     def on_state_change(self, previous_state):
-        if self.state["project_state"] != previous_state["project_state"]:
+        if "project_state" in previous_state:
             self.text.state.update({"text": self.displayed_text})
 
     def set_user_controls_miniscreen(self, user_using_miniscreen):
@@ -115,6 +115,11 @@ class Row(Component, Enterable):
             vertical_align="center",
         )
 
+    def bind(self, title, enterable_component):
+        # lists reuse rows that are scrolled out of view for other projects
+        self._component = enterable_component
+        self.text.state.update({"text": title})
+
     @property
     def enterable_component(self):
         return self._component
@@ -8,6 +8,12 @@ from pitop.common.common_ids import FirmwareDeviceID
 from pitop.common.sys_info import get_pi_top_ip
 from pt_miniscreen.components.info_page import InfoPage
 from pt_miniscreen.core.components.marquee_text import MarqueeText
+from pt_miniscreen.core.providers import register_provider
+
+# listing upgradable packages is slow so only check for updates every 10
+# minutes, with a timeout longer than the command's own
+SYSTEM_UPDATES_PERIOD = 600
+SYSTEM_UPDATES_TIMEOUT = 15
 
 
 def get_ip_url():
@@ -79,16 +85,30 @@ def firmware_updates_available():
     return "Firmware is up to date"
 
 
+def register_providers():
+    register_provider("latest_update_date", latest_update_date)
+    register_provider(
+        "system_updates_available",
+        system_updates_available,
+        period=SYSTEM_UPDATES_PERIOD,
+        timeout=SYSTEM_UPDATES_TIMEOUT,
+    )
+    register_provider("firmware_updates_available", firmware_updates_available)
+
+
 class LastUpdatePage(InfoPage):
     def __init__(self, **kwargs):
+        register_providers()
         Row = partial(MarqueeText, font_size=10, vertical_align="center")
 
         super().__init__(
             **kwargs,
             title="System Updates",
             Rows=[
-                partial(Row, text="", get_text=latest_update_date),
-                partial(Row, text="Loading...", get_text=system_updates_available),
-                partial(Row, text="", get_text=firmware_updates_available),
+                partial(Row, text="", text_provider="latest_update_date"),
+                partial(
+                    Row, text="Loading...", text_provider="system_updates_available"
+                ),
+                partial(Row, text="", text_provider="firmware_updates_available"),
             ],
         )
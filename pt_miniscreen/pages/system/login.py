@@ -5,6 +5,7 @@ from pitop.common.pt_os import is_pi_using_default_password
 
 from pt_miniscreen.components.icon_text_row import IconTextRow, Row
 from pt_miniscreen.components.info_page import InfoPage
+from pt_miniscreen.core.providers import register_provider
 from pt_miniscreen.utils import get_image_file_path
 
 
@@ -17,24 +18,29 @@ def get_password():
     return "pi-top" if is_pi_using_default_password() is True else "********"
 
 
+def register_providers():
+    register_provider("login_user", get_user)
+    register_provider("login_password", get_password)
+
+
 class LoginDetailsPage(InfoPage):
     def __init__(self, **kwargs):
+        register_providers()
+
         super().__init__(
             **kwargs,
             title="Login Details",
             Rows=[
                 partial(
                     IconTextRow,
-                    text=get_user(),
-                    get_text=get_user,
+                    text_provider="login_user",
                     icon_path=get_image_file_path(
                         "sys_info/networking/person-small.png"
                     ),
                 ),
                 partial(
                     IconTextRow,
-                    text=get_password(),
-                    get_text=get_password,
+                    text_provider="login_password",
                     text_vertical_align="bottom",
                     icon_path=get_image_file_path(
                         "sys_info/networking/padlock-small.png"
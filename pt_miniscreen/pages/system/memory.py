@@ -1,6 +1,5 @@
-from typing import Callable
+from operator import attrgetter
 
-import psutil
 from pitop.common.formatting import bytes2human
 
 from pt_miniscreen.components.progress_bar import ProgressBar
@@ -8,6 +7,7 @@ from pt_miniscreen.core.component import Component
 from pt_miniscreen.core.components.marquee_text import MarqueeText
 from pt_miniscreen.core.components.text import Text
 from pt_miniscreen.core.utils import apply_layers, layer
+from pt_miniscreen.system_metrics import SYSTEM_METRICS, get_system_metrics_sampler
 
 X_MARGIN = 4
 SUB_TITLE_WIDTH = 40
@@ -18,49 +18,76 @@ MARGIN_Y = 5
 SPACING_Y = 3
 
 
+def get_usage_string(memory_object) -> str:
+    try:
+        return f"{bytes2human(memory_object.used)}/{bytes2human(memory_object.total)}"
+    except Exception:
+        return ""
+
+
+def get_usage_percentage(memory_object) -> float:
+    try:
+        return memory_object.percent
+    except Exception:
+        return 0.0
+
+
 class MemoryPage(Component):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-        def get_usage_string(func: Callable) -> str:
-            try:
-                memory_object = func()
-                return f"{bytes2human(memory_object.used)}/{bytes2human(memory_object.total)}"
-            except Exception:
-                return ""
-
-        def get_usage_percentage(func: Callable) -> float:
-            try:
-                return func().percent
-            except Exception:
-                return 0.0
+        # start from the last sample, the subscriptions deliver a new one
+        sample = get_system_metrics_sampler().last_sample
+        virtual_memory = sample.virtual_memory if sample is not None else None
+        swap_memory = sample.swap_memory if sample is not None else None
 
         self.ram_title = self.create_child(Text, text="RAM", font_size=TITLE_FONT_SIZE)
         self.ram_progress_bar = self.create_child(
             ProgressBar,
-            progress=lambda: get_usage_percentage(func=psutil.virtual_memory),
+            progress=get_usage_percentage(virtual_memory),
         )
         self.ram_text = self.create_child(
             MarqueeText,
             vertical_align="bottom",
             font_size=TEXT_FONT_SIZE,
-            text=get_usage_string(func=psutil.virtual_memory),
-            get_text=lambda: get_usage_string(func=psutil.virtual_memory),
+            text=get_usage_string(virtual_memory),
         )
 
         self.swap_title = self.create_child(
             Text, text="SWAP", font_size=TITLE_FONT_SIZE
         )
         self.swap_progress_bar = self.create_child(
-            ProgressBar, progress=lambda: get_usage_percentage(func=psutil.swap_memory)
+            ProgressBar, progress=get_usage_percentage(swap_memory)
         )
         self.swap_text = self.create_child(
             MarqueeText,
             vertical_align="bottom",
             font_size=TEXT_FONT_SIZE,
-            text=get_usage_string(func=psutil.swap_memory),
-            get_text=lambda: get_usage_string(func=psutil.swap_memory),
+            text=get_usage_string(swap_memory),
+        )
+
+        self.subscribe(
+            SYSTEM_METRICS,
+            self.update_ram,
+            select=attrgetter("virtual_memory"),
+        )
+        self.subscribe(
+            SYSTEM_METRICS,
+            self.update_swap,
+            select=attrgetter("swap_memory"),
+        )
+
+    def update_ram(self, virtual_memory):
+        self.ram_progress_bar.state.update(
+            {"progress": get_usage_percentage(virtual_memory)}
+        )
+        self.ram_text.state.update({"text": get_usage_string(virtual_memory)})
+
+    def update_swap(self, swap_memory):
+        self.swap_progress_bar.state.update(
+            {"progress": get_usage_percentage(swap_memory)}
         )
+        self.swap_text.state.update({"text": get_usage_string(swap_memory)})
 
     def render(self, image):
         return apply_layers(
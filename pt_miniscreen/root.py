@@ -229,7 +229,13 @@ class RootComponent(Component):
     def is_screensaver_running(self):
         return self.state["show_screensaver"]
 
+    def layout_key(self):
+        return isinstance(self.active_component, HasGutterIcons)
+
     def on_state_change(self, previous_state):
+        if "show_screensaver" not in previous_state:
+            return
+
         show_screensaver = self.state["show_screensaver"]
         prev_show_screensaver = previous_state["show_screensaver"]
 
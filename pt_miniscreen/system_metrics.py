@@ -0,0 +1,122 @@
+import logging
+import threading
+from collections import deque, namedtuple
+from time import monotonic
+
+import psutil
+from pitop.battery import Battery
+
+from pt_miniscreen.core.providers import get_provider_registry
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_METRICS = "system_metrics"
+BATTERY_STATE = "battery_state"
+
+# battery state is pushed by battery events, polling only catches missed events
+BATTERY_POLL_PERIOD = 60
+
+Sample = namedtuple(
+    "Sample", ["time", "cpu_percentages", "virtual_memory", "swap_memory"]
+)
+BatteryState = namedtuple("BatteryState", ["capacity", "is_charging", "is_full"])
+
+# battery lives to the end of the process so we must create it globally to avoid
+# memory leaks
+battery = Battery()
+
+
+def read(func, *args, **kwargs):
+    try:
+        return func(*args, **kwargs)
+    except Exception as e:
+        logger.error(f"Error reading system metric {func}: {e}")
+        return None
+
+
+class SystemMetricsSampler:
+    """Samples CPU, memory and battery usage for every page that shows them.
+
+    CPU and memory are sampled once per period while a subscribed page is
+    active and the last samples are kept so pages can show history. CPU usage
+    is measured since the previous sample so sampling never blocks, pages start
+    from the last sample rather than sampling when they are created since that
+    would shorten the period the next sample measures.
+    """
+
+    def __init__(self, battery, period=1, history_length=60, registry=None):
+        self.battery = battery
+        self.period = period
+        self._history = deque(maxlen=history_length)
+        self._lock = threading.Lock()
+
+        # the first non-blocking call has nothing to measure from and returns 0
+        read(psutil.cpu_percent, interval=None, percpu=True)
+
+        registry = registry or get_provider_registry()
+        self._provider = registry.register(SYSTEM_METRICS, self.sample, period=period)
+        self._battery_provider = registry.register(
+            BATTERY_STATE, self.get_battery_state, period=BATTERY_POLL_PERIOD
+        )
+
+        battery.on_capacity_change = lambda _: self.publish_battery_state()
+        battery.when_charging = self.publish_battery_state
+        battery.when_full = self.publish_battery_state
+        battery.when_discharging = self.publish_battery_state
+
+    @property
+    def history(self):
+        with self._lock:
+            return list(self._history)
+
+    def get_battery_state(self):
+        return BatteryState(
+            capacity=self.battery.capacity,
+            is_charging=self.battery.is_charging,
+            is_full=self.battery.is_full,
+        )
+
+    @property
+    def last_sample(self):
+        """Get the last sample without sampling, None until the first sample."""
+        with self._lock:
+            return self._history[-1] if len(self._history) else None
+
+    @property
+    def battery_state(self):
+        """Get the last battery state, the battery is only read until the first."""
+        battery_state = self._battery_provider.value
+        if battery_state is None:
+            return self.get_battery_state()
+
+        return battery_state
+
+    def sample(self):
+        sample = Sample(
+            time=monotonic(),
+            cpu_percentages=read(psutil.cpu_percent, interval=None, percpu=True),
+            virtual_memory=read(psutil.virtual_memory),
+            swap_memory=read(psutil.swap_memory),
+        )
+
+        with self._lock:
+            self._history.append(sample)
+
+        return sample
+
+    def publish_battery_state(self):
+        self._battery_provider.publish(self.get_battery_state())
+
+
+_system_metrics_sampler = None
+_system_metrics_sampler_lock = threading.Lock()
+
+
+def get_system_metrics_sampler():
+    global _system_metrics_sampler
+
+    with _system_metrics_sampler_lock:
+        if _system_metrics_sampler is None:
+            _system_metrics_sampler = SystemMetricsSampler(battery)
+
+        return _system_metrics_sampler
@@ -5,7 +5,7 @@ from enum import Enum, auto
 from os import path
 from pathlib import Path
 from functools import partial
-from pt_miniscreen.core.components.text import create_wrapped_text
+from pt_miniscreen.core.text_cache import create_wrapped_text
 
 from pt_miniscreen.core.utils import get_font
 
@@ -18,6 +18,10 @@ def get_project_root() -> Path:
     return Path(__file__).parent
 
 
+def get_images_directory() -> str:
+    return path.abspath(path.join(get_project_root(), "images"))
+
+
 def get_image_file_path(relative_file_name: str) -> str:
     return path.abspath(path.join(get_project_root(), "images", relative_file_name))
 
@@ -6,6 +6,7 @@ from pitop.system.pitop import Pitop
 from pt_miniscreen.utils import ButtonEvents
 
 from ..core import App as BaseApp
+from ..core.display import SSD1306DisplaySink
 from .root import WelcomeRootComponent
 
 logger = logging.getLogger(__name__)
@@ -13,6 +14,7 @@ logger = logging.getLogger(__name__)
 
 class WelcomeApp(BaseApp):
     DIMMING_TIMEOUT = 20
+    MAX_FPS = 30
 
     def __init__(self, miniscreen=None):
         self.miniscreen = miniscreen
@@ -59,6 +61,8 @@ class WelcomeApp(BaseApp):
         logger.debug("Initialising app...")
         super().__init__(
             display=self.miniscreen.device.display,
+            display_sink=SSD1306DisplaySink(self.miniscreen.device),
+            max_fps=self.MAX_FPS,
             Root=WelcomeRootComponent,
             size=self.miniscreen.size,
         )
@@ -69,6 +73,7 @@ class WelcomeApp(BaseApp):
         except RuntimeError as e:
             logger.error(f"Error resetting miniscreen: {e}")
 
+        self.invalidate_display()
         self.display()
 
     def create_button_handler(self, func):
@@ -16,8 +16,9 @@ def test_broken_pipe_error(mocker):
     # app displays correctly after being started
     assert app.miniscreen.device.display_image is not None
 
-    # raise BrokenPipeError
-    mocker.patch.object(app, "_display", side_effect=BrokenPipeError())
+    # raise BrokenPipeError, invalidating so the unchanged image is still sent
+    mocker.patch.object(app.miniscreen.device, "display", side_effect=BrokenPipeError())
+    app.invalidate_display()
     app.display()
 
     # app root and timers are None because app has been stopped so process can end
@@ -0,0 +1,57 @@
+"""Micro-benchmark for render cache image comparisons.
+
+Run from the project root with:
+
+    python -m tests.benchmarks.is_same_image
+"""
+
+from timeit import timeit
+
+from PIL import Image, ImageDraw
+
+from pt_miniscreen.core.component import RenderCache
+from pt_miniscreen.core.utils import is_same_image
+
+NUMBER = 2000
+
+
+def legacy_is_same_image(image_one, image_two) -> bool:
+    try:
+        return list(image_one.getdata()) == list(image_two.getdata())
+    except Exception:
+        return False
+
+
+def create_frame(text):
+    image = Image.new("1", (128, 64))
+    ImageDraw.Draw(image).text((10, 10), text, fill=1)
+    return image
+
+
+def report(name, function):
+    seconds = timeit(function, number=NUMBER)
+    print(f"{name:<40} {NUMBER / seconds:>12,.0f} compares/sec")
+
+
+def main():
+    frame = create_frame("frame")
+    same_frame = create_frame("frame")
+    other_frame = create_frame("other")
+
+    cache = RenderCache()
+    cache.output = frame
+
+    print("before:")
+    report("getdata, same image", lambda: legacy_is_same_image(frame, same_frame))
+    report("getdata, different image", lambda: legacy_is_same_image(frame, other_frame))
+
+    print("after:")
+    report("is_same_image, same object", lambda: is_same_image(frame, frame))
+    report("is_same_image, same image", lambda: is_same_image(frame, same_frame))
+    report("is_same_image, different image", lambda: is_same_image(frame, other_frame))
+    report("RenderCache.is_output, same image", lambda: cache.is_output(same_frame))
+    report("RenderCache.is_output, cached image", lambda: cache.is_output(cache.output))
+
+
+if __name__ == "__main__":
+    main()
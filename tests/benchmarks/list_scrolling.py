@@ -0,0 +1,114 @@
+"""Benchmark for scrolling through a list of 1,000 rows.
+
+Run from the project root with:
+
+    python -m tests.benchmarks.list_scrolling
+"""
+
+from functools import partial
+from os import path
+from time import perf_counter
+
+from PIL import Image, ImageFont
+
+from pt_miniscreen.core.components import List, SelectableList, Text
+
+NUM_ROWS = 1000
+NUM_VISIBLE_ROWS = 5
+NUMBER = 3
+
+# use the test font so the benchmark runs without the fonts installed on a pi-top
+FONT = ImageFont.truetype(
+    path.join(path.dirname(__file__), "..", "fonts", "roboto", "Roboto-Regular.ttf"),
+    size=10,
+)
+
+
+class Host:
+    # lists must be created with a method to call when they rerender
+    def on_rerender(self):
+        pass
+
+
+class NumberedRow(Text):
+    def __init__(self, text, **kwargs):
+        super().__init__(
+            **kwargs, text=text, font=FONT, align="center", vertical_align="center"
+        )
+
+    def bind(self, text):
+        self.state.update({"text": text})
+
+
+def create_rows(length):
+    return [partial(NumberedRow, text=str(i + 1)) for i in range(length)]
+
+
+def create_list(ListClass, host, **kwargs):
+    component = ListClass(
+        Rows=create_rows(NUM_ROWS),
+        num_visible_rows=NUM_VISIBLE_ROWS,
+        on_rerender=host.on_rerender,
+        **kwargs,
+    )
+    component.render(Image.new("1", (128, 64)))
+    return component
+
+
+def scroll_to_bottom(component, render):
+    steps = 0
+    while component.can_scroll_down():
+        component.scroll_down(animate=False)
+        if render:
+            component.render(Image.new("1", (128, 64)))
+        steps += 1
+
+    return steps
+
+
+def select_last_row(component, render):
+    steps = NUM_ROWS - 1
+    for _ in range(steps):
+        component.select_next_row(animate_scroll=False)
+        if render:
+            component.render(Image.new("1", (128, 64)))
+
+    return steps
+
+
+def report(name, ListClass, step, render, **kwargs):
+    # lists are created outside of the timed section, which only scrolls
+    seconds = 0
+    steps = 0
+    for _ in range(NUMBER):
+        host = Host()
+        component = create_list(ListClass, host, **kwargs)
+        start_time = perf_counter()
+        steps += step(component, render)
+        seconds += perf_counter() - start_time
+
+    print(f"{name:<40} {steps / seconds:>12,.0f} steps/sec")
+
+
+def main():
+    print(f"scrolling through {NUM_ROWS} rows, {NUM_VISIBLE_ROWS} visible:")
+    for virtual in (False, True):
+        mode = "virtual" if virtual else "non-virtual"
+        report(f"{mode} scroll", List, scroll_to_bottom, False, virtual=virtual)
+        report(
+            f"{mode} scroll and render", List, scroll_to_bottom, True, virtual=virtual
+        )
+        report(
+            f"{mode} select", SelectableList, select_last_row, False, virtual=virtual
+        )
+        report(
+            f"{mode} select and render",
+            SelectableList,
+            select_last_row,
+            True,
+            virtual=virtual,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import threading
+from time import perf_counter, sleep
+
+import pytest
+
+
+@pytest.mark.parametrize("easing", ["linear", "ease_in", "ease_out", "ease_in_out"])
+def test_easings(easing):
+    from pt_miniscreen.core.animation import EASINGS
+
+    ease = EASINGS[easing]
+
+    # easings start at 0, end at 1 and never move backwards
+    assert ease(0) == 0
+    assert ease(1) == 1
+    progress = [ease(step / 100) for step in range(101)]
+    assert progress == sorted(progress)
+
+
+def test_transition_finishes_on_time():
+    from pt_miniscreen.core.animation import AnimationClock
+
+    clock = AnimationClock(frame_interval=0.01)
+
+    start_time = perf_counter()
+    steps = list(clock.transition(100, 0.2, easing="ease_in_out"))
+    elapsed_time = perf_counter() - start_time
+
+    # steps add up to the distance and finish close to the duration
+    assert sum(steps) == 100
+    assert all(step > 0 for step in steps)
+    assert 0.2 <= elapsed_time < 0.25
+
+    # achieved frame rate is recorded for every transition
+    [stats] = clock.transition_stats
+    assert stats.distance == 100
+    assert stats.easing == "ease_in_out"
+    assert stats.frames == len(steps)
+    assert stats.fps == pytest.approx(len(steps) / stats.elapsed)
+
+
+def test_transition_drops_frames_when_slow():
+    from pt_miniscreen.core.animation import AnimationClock
+
+    clock = AnimationClock(frame_interval=0.01)
+
+    steps = []
+    for step in clock.transition(100, 0.2):
+        steps.append(step)
+        sleep(0.05)
+
+    # slow frames are skipped by taking larger steps
+    assert sum(steps) == 100
+    assert len(steps) <= 6
+    assert clock.transition_stats[-1].dropped_frames >= 14
+
+
+def test_transition_steps_on_ticks():
+    from pt_miniscreen.core.animation import AnimationClock
+
+    clock = AnimationClock()
+    clock.attach(1)
+    stop_ticking = threading.Event()
+
+    def tick():
+        while not stop_ticking.is_set():
+            sleep(0.05)
+            clock.tick()
+
+    threading.Thread(target=tick, daemon=True).start()
+
+    # one step is taken each tick even though the frame interval is longer
+    try:
+        steps = list(clock.transition(100, 0.2))
+    finally:
+        stop_ticking.set()
+        clock.detach(1)
+
+    assert sum(steps) == 100
+    assert 3 <= len(steps) <= 5
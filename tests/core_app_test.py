@@ -1,5 +1,6 @@
 import gc
 import logging
+import threading
 from time import sleep
 from unittest.mock import MagicMock
 from weakref import ref
@@ -126,3 +127,114 @@ def test_stop(app):
     sleep(1.1)
     assert root_interval() is None
     assert child_interval() is None
+
+
+def test_renders_root_once_for_sibling_updates(mocker):
+    from PIL import ImageDraw
+
+    from pt_miniscreen.core import App, Component
+    from pt_miniscreen.core.utils import apply_layers, layer
+
+    class Spot(Component):
+        default_state = {"spot": 0}
+
+        def render(self, image):
+            ImageDraw.Draw(image).point((self.state["spot"], 0), fill=1)
+            return image
+
+    class Root(Component):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.spots = [self.create_child(Spot) for _ in range(3)]
+
+        def render(self, image):
+            return apply_layers(
+                image,
+                [
+                    layer(spot.render, size=(10, 10), pos=(index * 10, 0))
+                    for index, spot in enumerate(self.spots)
+                ],
+            )
+
+    root_render = mocker.spy(Root, "render")
+    spot_render = mocker.spy(Spot, "render")
+
+    display = MagicMock()
+    app = App(display=display, Root=Root, max_fps=10)
+    app.start()
+    assert root_render.call_count == 1
+    assert spot_render.call_count == 3
+
+    # siblings updating at once only mark the path to the root as dirty
+    threads = [
+        threading.Thread(target=spot.state.update, args=({"spot": 1},))
+        for spot in app.root.spots
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # root is rendered once in the next frame, reusing each sibling's output
+    sleep(0.15)
+    assert app.render_stats["frames_rendered"] == 1
+    assert root_render.call_count == 2
+    assert spot_render.call_count == 6
+    assert display.call_count == 2
+
+    app.stop()
+
+
+def test_displays_state_updated_during_first_render():
+    from PIL import ImageDraw
+
+    from pt_miniscreen.core import App, Component
+    from pt_miniscreen.core.utils import apply_layers, layer
+
+    rendering = threading.Event()
+    finish_render = threading.Event()
+
+    class Spot(Component):
+        default_state = {"spot": 0}
+
+        def render(self, image):
+            spot = self.state["spot"]
+
+            # block the first render until state has been updated
+            rendering.set()
+            finish_render.wait(1)
+
+            ImageDraw.Draw(image).point((spot, 0), fill=1)
+            return image
+
+    class Root(Component):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.spot = self.create_child(Spot)
+
+        def render(self, image):
+            return apply_layers(image, [layer(self.spot.render, size=(10, 10))])
+
+    display = MagicMock()
+    app = App(display=display, Root=Root, max_fps=10)
+    start_thread = threading.Thread(target=app.start)
+    start_thread.start()
+
+    # update state on another thread while the spot is rendered for the first time
+    rendering.wait(1)
+    update_thread = threading.Thread(
+        target=app.root.spot.state.update, args=({"spot": 1},)
+    )
+    update_thread.start()
+    sleep(0.05)
+    finish_render.set()
+    start_thread.join()
+    update_thread.join()
+
+    # the update is displayed once the first render has finished
+    sleep(0.25)
+    displayed_image = display.call_args[0][0]
+    assert displayed_image.getpixel((1, 0))
+    assert not displayed_image.getpixel((0, 0))
+
+    app.stop()
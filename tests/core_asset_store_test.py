@@ -0,0 +1,40 @@
+from os import path
+
+images_dir = f"{path.dirname(path.realpath(__file__))}/images"
+
+
+def test_asset_store():
+    from pt_miniscreen.core.asset_store import AssetStore
+
+    asset_store = AssetStore(images_dir)
+
+    # images are indexed but not loaded
+    assert "test.gif" in asset_store.names
+    assert "menu/settings.gif" in asset_store.names
+    assert f"{images_dir}/test-1.png" in asset_store
+    assert asset_store.stats["entries"] == 0
+
+    # images are loaded once and then shared
+    image_frames = asset_store.get(f"{images_dir}/test-1.png")
+    assert asset_store.get(f"{images_dir}/test-1.png") is image_frames
+    assert asset_store.stats["entries"] == 1
+    assert asset_store.stats["hits"] == 1
+    assert asset_store.stats["misses"] == 1
+
+
+def test_get_image_frames_uses_asset_stores():
+    from pt_miniscreen.core.asset_store import (
+        AssetStore,
+        _asset_stores,
+        add_asset_store,
+        get_image_frames,
+    )
+
+    asset_store = AssetStore(images_dir)
+    add_asset_store(asset_store)
+
+    try:
+        image_frames = get_image_frames(f"{images_dir}/test.gif")
+        assert asset_store.get(f"{images_dir}/test.gif") is image_frames
+    finally:
+        _asset_stores.pop(asset_store.directory)
@@ -2,7 +2,7 @@ import gc
 import logging
 from multiprocessing import Event
 from threading import Thread
-from time import sleep
+from time import monotonic, sleep
 from unittest.mock import patch
 from weakref import ref
 
@@ -100,24 +100,24 @@ def test_updates_during_creation(parent, SpotComponent):
     parent.create_child(Spots)
 
 
-def test_render(parent, SpotComponent):
+def test_render(parent, SpotComponent, same_image):
     component = parent.create_child(SpotComponent)
 
     # returns expected output
     expected_output = create_spot_image((0, 0))
     render_output = component.render(Image.new("1", (128, 64)))
-    assert render_output == expected_output
+    assert same_image(render_output, expected_output)
 
     # returns cached image instead rendering when input is unchanged
     with patch.object(component, "_original_render", return_value=expected_output):
         render_output = component.render(Image.new("1", (128, 64)))
-        assert render_output == expected_output
+        assert same_image(render_output, expected_output)
         component._original_render.assert_not_called()
 
     # bypasses cache when when input image changes
     expected_output = create_spot_image((0, 0), size=(80, 40))
     render_output = component.render(Image.new("1", (80, 40)))
-    assert render_output == expected_output
+    assert same_image(render_output, expected_output)
 
 
 def test_state(parent):
@@ -171,9 +171,62 @@ def test_on_state_change(mocker, parent):
     component.on_state_change.assert_called_with({"foo": "bar"})
     component.on_state_change.reset_mock()
 
-    # calls on_state_change with previous state when update adds state
+    # previous state of keys added by the update is None
     component.state.update({"new": "state"})
-    component.on_state_change.assert_called_with({"foo": "BAR"})
+    component.on_state_change.assert_called_with({"new": None})
+    component.on_state_change.reset_mock()
+
+    # previous state only has the keys that changed
+    component.state.update({"foo": "baz", "new": "state"})
+    component.on_state_change.assert_called_once_with({"foo": "BAR"})
+
+
+def test_state_version(parent):
+    from pt_miniscreen.core import Component
+
+    component = parent.create_child(Component, initial_state={"foo": "bar"})
+    assert component.state.version == 0
+
+    # version is incremented by updates that change state
+    component.state.update({"foo": "bar"})
+    assert component.state.version == 0
+    component.state.update({"foo": "BAR", "new": "state"})
+    assert component.state.version == 1
+
+    # and when state is changed by assigning
+    component.state["foo"] = "bar"
+    assert component.state.version == 2
+
+
+def test_state_transaction(mocker, parent, SpotComponent):
+    component = parent.create_child(SpotComponent)
+    component.render(Image.new("1", (128, 64)))
+    mocker.patch.object(component, "on_state_change")
+    reconcile_spy = mocker.spy(component, "_reconcile")
+
+    # updates in a transaction cause a single state change and reconcile
+    with component.state.transaction():
+        component.state.update({"spot_pos": (1, 0)})
+        component.state.update({"spot_pos": (1, 1)})
+        component.state.update({"new": "state"})
+
+        # state is updated straight away
+        assert component.state["spot_pos"] == (1, 1)
+        component.on_state_change.assert_not_called()
+
+    component.on_state_change.assert_called_once_with({"spot_pos": (0, 0), "new": None})
+    reconcile_spy.assert_called_once()
+    assert component.state.version == 3
+
+    # nested transactions notify when the outermost transaction ends
+    component.on_state_change.reset_mock()
+    with component.state.transaction():
+        with component.state.transaction():
+            component.state.update({"spot_pos": (2, 2)})
+
+        component.on_state_change.assert_not_called()
+
+    component.on_state_change.assert_called_once_with({"spot_pos": (1, 1)})
 
 
 def test_rerendering(parent, SpotComponent):
@@ -234,7 +287,117 @@ def test_concurrent_reconciliation(parent, SpotComponent):
     parent.on_rerender_spy.assert_called_once()
 
 
-def test_intervals(parent, SpotComponent, render):
+def test_pure_render(mocker, parent, SpotComponent, same_image):
+    from pt_miniscreen.core.component import RenderCache
+
+    class PureSpot(SpotComponent):
+        pure_render = True
+
+    component = parent.create_child(PureSpot)
+    original_render = mocker.spy(component, "_original_render")
+    is_input = mocker.spy(RenderCache, "is_input")
+
+    # renders given a blank image are cached without comparing the image
+    assert same_image(
+        component.render(Image.new("1", (128, 64))), create_spot_image((0, 0))
+    )
+    assert same_image(
+        component.render(Image.new("1", (128, 64))), create_spot_image((0, 0))
+    )
+    assert original_render.call_count == 1
+    is_input.assert_not_called()
+
+    # a state update renders once and the next render reuses the output
+    component.move_spot_right()
+    assert original_render.call_count == 2
+    assert same_image(
+        component.render(Image.new("1", (128, 64))), create_spot_image((1, 0))
+    )
+    assert original_render.call_count == 2
+
+    # images that have been drawn on are compared with the last input
+    image = create_spot_image((5, 5))
+    expected_output = create_spot_image((5, 5))
+    expected_output.putpixel((1, 0), 1)
+    assert same_image(component.render(image), expected_output)
+    assert same_image(component.render(create_spot_image((5, 5))), expected_output)
+    assert original_render.call_count == 3
+    is_input.assert_called()
+
+    # a different size renders again
+    assert same_image(
+        component.render(Image.new("1", (10, 10))), create_spot_image((1, 0), (10, 10))
+    )
+    assert original_render.call_count == 4
+
+
+def test_compositing_rerendered_children(mocker, parent, SpotComponent, same_image):
+    from pt_miniscreen.core import Component
+    from pt_miniscreen.core.utils import apply_layers, layer
+
+    class Spots(Component):
+        default_state = {"overlap": False}
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.spot_one = self.create_child(SpotComponent)
+            self.spot_two = self.create_child(SpotComponent)
+            self.key = "layout"
+
+        def layout_key(self):
+            return self.key
+
+        def render(self, image):
+            spot_two_pos = (5, 0) if self.state["overlap"] else (10, 0)
+            return apply_layers(
+                image,
+                [
+                    layer(self.spot_one.render, size=(10, 10)),
+                    layer(self.spot_two.render, size=(10, 10), pos=spot_two_pos),
+                ],
+            )
+
+    spots = parent.create_child(Spots)
+    spots.render(Image.new("1", (128, 64)))
+    original_render = mocker.spy(spots, "_original_render")
+
+    # only the rerendered child is composited when layers don't overlap
+    spots.spot_two.move_spot_down()
+    expected_output = create_spot_image((0, 0))
+    expected_output.putpixel((10, 1), 1)
+    assert same_image(spots.render(Image.new("1", (128, 64))), expected_output)
+    original_render.assert_not_called()
+
+    # state changes cause a full render
+    spots.state.update({"overlap": True})
+    original_render.assert_called_once()
+    original_render.reset_mock()
+
+    # rerendered children that overlap another layer cause a full render
+    spots.spot_one.move_spot_right()
+    expected_output = create_spot_image((1, 0))
+    expected_output.putpixel((5, 1), 1)
+    assert same_image(spots.render(Image.new("1", (128, 64))), expected_output)
+    original_render.assert_called_once()
+    original_render.reset_mock()
+
+    # changes to the layout key cause a full render
+    spots.key = "new layout"
+    spots.spot_one.move_spot_down()
+    spots.render(Image.new("1", (128, 64)))
+    original_render.assert_called_once()
+    original_render.reset_mock()
+
+    # components without a layout key always render
+    spots.key = None
+    spots.state.update({"overlap": False})
+    original_render.reset_mock()
+    spots.spot_two.move_spot_right()
+    spots.render(Image.new("1", (128, 64)))
+    original_render.assert_called_once()
+
+
+def test_intervals(parent, SpotComponent, render, same_image):
     from pt_miniscreen.core.component import Interval
 
     component = parent.create_child(SpotComponent)
@@ -248,23 +411,23 @@ def test_intervals(parent, SpotComponent, render):
 
     # does not call method when interval is created
     output = component.render(Image.new("1", (128, 64)))
-    assert output != create_spot_image((1, 0))
+    assert not same_image(output, create_spot_image((1, 0)))
 
     # calls method after a second by default
     sleep(1.05)
     output = component.render(Image.new("1", (128, 64)))
-    assert output == create_spot_image((1, 0))
+    assert same_image(output, create_spot_image((1, 0)))
 
     # can use custom interval time
     move_down_interval = component.create_interval(component.move_spot_down, 0.5)
     sleep(0.55)
     output = component.render(Image.new("1", (128, 64)))
-    assert output == create_spot_image((1, 1))
+    assert same_image(output, create_spot_image((1, 1)))
 
     # both intervals are active at once
     sleep(0.55)
     output = component.render(Image.new("1", (128, 64)))
-    assert output == create_spot_image((2, 2))
+    assert same_image(output, create_spot_image((2, 2)))
 
     # cancelling intervals stops them calling their method again
     move_down_interval.cancel()
@@ -272,7 +435,7 @@ def test_intervals(parent, SpotComponent, render):
     # after a second only move_spot_down should have been called
     sleep(1.05)
     output = component.render(Image.new("1", (128, 64)))
-    assert output == create_spot_image((3, 2))
+    assert same_image(output, create_spot_image((3, 2)))
 
     # calling `remove_interval` also stops the interval
     component.remove_interval(move_right_interval)
@@ -280,10 +443,103 @@ def test_intervals(parent, SpotComponent, render):
     # after a second spot should not have moved
     sleep(1.05)
     output = component.render(Image.new("1", (128, 64)))
-    assert output == create_spot_image((3, 2))
+    assert same_image(output, create_spot_image((3, 2)))
+
+
+def test_intervals_share_threads(parent, SpotComponent):
+    import threading
+
+    components = [parent.create_child(SpotComponent) for _ in range(20)]
+    for component in components:
+        component._set_active(True)
+
+    # intervals are run by the shared timer wheel instead of a thread each
+    thread_count = threading.active_count()
+    for component in components:
+        component.create_interval(component.move_spot_right, 0.1)
+
+    assert threading.active_count() - thread_count <= 5
 
+    sleep(0.25)
+    for component in components:
+        assert component.state["spot_pos"][0] >= 1
 
-def test_pausing(parent, SpotComponent):
+
+def test_blocking_intervals_do_not_stall_other_intervals(parent, SpotComponent):
+    class BlockingSpot(SpotComponent):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.create_interval(self.block, 0.05, blocking=True)
+
+        def block(self):
+            sleep(1)
+
+    # more blocking intervals than there are workers in a timer wheel
+    blocking_components = [parent.create_child(BlockingSpot) for _ in range(8)]
+    for component in blocking_components:
+        component._set_active(True)
+
+    component = parent.create_child(SpotComponent)
+    component._set_active(True)
+    component.create_interval(component.move_spot_right, 0.1)
+
+    # other intervals keep running while the blocking intervals are
+    sleep(0.55)
+    assert component.state["spot_pos"][0] >= 3
+
+
+def test_interval_metrics(parent, SpotComponent):
+    class SlowSpot(SpotComponent):
+        def __init__(self, move_time, **kwargs):
+            super().__init__(**kwargs)
+            self.move_time = move_time
+            self.run_times = []
+            self.create_interval(self.move_spot_slowly, 0.2)
+
+        def move_spot_slowly(self):
+            self.run_times.append(monotonic())
+            self.move_spot_right()
+            sleep(self.move_time)
+
+    component = parent.create_child(SlowSpot, move_time=0.05)
+    lagging_component = parent.create_child(SlowSpot, move_time=0.3)
+    component._set_active(True)
+    lagging_component._set_active(True)
+
+    # the timer wheel is driven by the wall clock so allow a run either side
+    sleep(1.1)
+    runs = len(component.run_times)
+    assert 4 <= runs <= 6
+    assert component.state["spot_pos"] == (runs, 0)
+
+    # intervals don't drift by the time taken to run them, runs that drifted
+    # would be 0.25 seconds apart rather than 0.2
+    run_times = component.run_times
+    assert run_times[-1] - run_times[0] <= 0.2 * (runs - 1) + 0.05
+
+    # metrics for all intervals in the tree are available from the parent
+    metrics = parent.get_interval_metrics()
+    assert [interval_metrics["component"] for interval_metrics in metrics] == [
+        component,
+        lagging_component,
+    ]
+    assert metrics[0]["name"].endswith("SlowSpot.move_spot_slowly")
+    assert metrics[0]["interval"] == 0.2
+    assert runs - 1 <= metrics[0]["runs"] <= runs
+    assert 0.05 <= metrics[0]["last_run_duration"] < 0.1
+    assert metrics[0]["max_lag"] < 0.1
+    assert metrics[0]["missed_deadlines"] <= 1
+
+    # intervals that take longer than their interval skip missed deadlines
+    # rather than running late, so they run less often than the others
+    lagging_runs = len(lagging_component.run_times)
+    assert 1 <= lagging_runs < runs
+    assert 1 <= metrics[1]["runs"] <= lagging_runs
+    assert metrics[1]["missed_deadlines"] >= 1
+    assert metrics[1]["max_lag"] < 0.2
+
+
+def test_pausing(parent, SpotComponent, same_image):
     from pt_miniscreen.core.component import Component
 
     class MovingRightSpot(SpotComponent):
@@ -316,9 +572,9 @@ def test_pausing(parent, SpotComponent):
     # when not active intervals should not run
     sleep(1.05)
     output = spots.moving_right_spot.render(Image.new("1", (128, 64)))
-    assert output == create_spot_image((0, 0))
+    assert same_image(output, create_spot_image((0, 0)))
     output = spots.moving_down_spot.render(Image.new("1", (128, 64)))
-    assert output == create_spot_image((0, 0))
+    assert same_image(output, create_spot_image((0, 0)))
 
     # when parent rendered only children that were rendered should be active
     parent.render(Image.new("1", (128, 64)))
@@ -328,9 +584,9 @@ def test_pausing(parent, SpotComponent):
     # only active children have their intervals run
     sleep(1.05)
     output = spots.moving_right_spot.render(Image.new("1", (128, 64)))
-    assert output == create_spot_image((1, 0))
+    assert same_image(output, create_spot_image((1, 0)))
     output = spots.moving_down_spot.render(Image.new("1", (128, 64)))
-    assert output == create_spot_image((0, 0))
+    assert same_image(output, create_spot_image((0, 0)))
 
     # when an update hides or shows a component their active state is updated
     spots.state.update({"spot_attribute": "moving_down_spot"})
@@ -340,18 +596,40 @@ def test_pausing(parent, SpotComponent):
     # when pausing a component the interval runs once more
     sleep(1.05)
     output = spots.moving_right_spot.render(Image.new("1", (128, 64)))
-    assert output == create_spot_image((2, 0))
+    assert same_image(output, create_spot_image((2, 0)))
 
     # newly active components also run their intervals
     output = spots.moving_down_spot.render(Image.new("1", (128, 64)))
-    assert output == create_spot_image((0, 1))
+    assert same_image(output, create_spot_image((0, 1)))
 
     # paused components don't run their interval another time
     sleep(1.05)
     output = spots.moving_right_spot.render(Image.new("1", (128, 64)))
-    assert output == create_spot_image((2, 0))
+    assert same_image(output, create_spot_image((2, 0)))
     output = spots.moving_down_spot.render(Image.new("1", (128, 64)))
-    assert output == create_spot_image((0, 2))
+    assert same_image(output, create_spot_image((0, 2)))
+
+
+def test_active_event_only_changes_with_active_state(mocker, parent, SpotComponent):
+    from pt_miniscreen.core.timer_wheel import ActiveEvent
+
+    component = parent.create_child(SpotComponent)
+    set_spy = mocker.spy(ActiveEvent, "set")
+    clear_spy = mocker.spy(ActiveEvent, "clear")
+
+    # event is set and cleared when the active state changes
+    component._set_active(True)
+    component._set_active(False)
+    assert set_spy.call_count == 1
+    assert clear_spy.call_count == 1
+
+    # event is left alone when the active state is unchanged
+    component._set_active(False)
+    assert clear_spy.call_count == 1
+    component._set_active(True)
+    component._set_active(True)
+    assert set_spy.call_count == 2
+    assert component.active_event.is_set()
 
 
 def test_render_exceptions(parent, SpotComponent, render):
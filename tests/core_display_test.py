@@ -0,0 +1,205 @@
+from sys import modules
+from unittest.mock import MagicMock, call
+
+import pytest
+from PIL import Image, ImageDraw
+
+
+class PartialDevice:
+    size = (128, 64)
+    rotate = 0
+
+    def __init__(self):
+        self._colstart = 0
+        self.display = MagicMock()
+        self.command = MagicMock()
+        self.data = MagicMock()
+
+
+@pytest.fixture
+def device(mocker):
+    # the sink only sends partial updates to luma ssd1306 devices
+    mocker.patch.dict(
+        modules,
+        {
+            "luma": MagicMock(),
+            "luma.oled": MagicMock(),
+            "luma.oled.device": MagicMock(ssd1306=PartialDevice),
+        },
+    )
+    return PartialDevice()
+
+
+def frame(image):
+    from pt_miniscreen.core.frame import Frame
+
+    return Frame.from_image(image)
+
+
+def test_get_changed_regions():
+    from pt_miniscreen.core.display import get_changed_regions
+
+    image = Image.new("1", (128, 64))
+    changed_image = image.copy()
+    ImageDraw.Draw(changed_image).rectangle((10, 3, 20, 4), fill=1)
+
+    # frames that can't be compared need a full update
+    assert get_changed_regions(None, frame(image)) is None
+    assert get_changed_regions(frame(image), None) is None
+    assert get_changed_regions(frame(image), frame(image.convert("L"))) is None
+    assert get_changed_regions(frame(image), frame(image.resize((64, 32)))) is None
+
+    # identical frames have no changed regions
+    assert get_changed_regions(frame(image), frame(image.copy())) == []
+
+    # changed columns are found within the page that changed
+    assert get_changed_regions(frame(image), frame(changed_image)) == [(0, 0, 10, 20)]
+
+    # consecutive pages are merged and separate pages are not
+    ImageDraw.Draw(changed_image).point((127, 8), fill=1)
+    ImageDraw.Draw(changed_image).point((0, 63), fill=1)
+    assert get_changed_regions(frame(image), frame(changed_image)) == [
+        (0, 1, 10, 127),
+        (7, 7, 0, 0),
+    ]
+
+
+def test_full_frame_display_sink():
+    from pt_miniscreen.core.display import FullFrameDisplaySink
+
+    display = MagicMock()
+    image = Image.new("1", (128, 64))
+    FullFrameDisplaySink(display).display(image, [(0, 0, 0, 0)])
+    display.assert_called_once_with(image)
+
+
+def test_pack_pages():
+    from pt_miniscreen.core.display import pack_pages
+
+    image = Image.new("1", (3, 16))
+    image.putpixel((1, 0), 1)
+    image.putpixel((2, 9), 1)
+    image.putpixel((0, 15), 1)
+
+    # bytes are sent page by page with the top row in the least significant bit
+    assert list(pack_pages(image)) == [0, 1, 0, 1 << 7, 0, 1 << 1]
+
+
+def test_ssd1306_display_sink(device):
+    from pt_miniscreen.core.display import SSD1306DisplaySink
+
+    sink = SSD1306DisplaySink(device)
+    image = Image.new("1", (128, 64))
+    ImageDraw.Draw(image).point((3, 9), fill=1)
+    ImageDraw.Draw(image).point((4, 15), fill=1)
+
+    # sends the full image when regions are not known
+    sink.display(image)
+    device.display.assert_called_once_with(image)
+    device.command.assert_not_called()
+
+    # sends changed regions as column bytes with the least significant bit at
+    # the top of the page
+    device.display.reset_mock()
+    sink.display(image, [(1, 1, 2, 4)])
+    device.display.assert_not_called()
+    device.command.assert_called_once_with(0x21, 2, 4, 0x22, 1, 1)
+    device.data.assert_called_once_with([0, 1 << 1, 1 << 7])
+
+    # column addresses are offset by the column start of the device
+    device.command.reset_mock()
+    device.data.reset_mock()
+    device._colstart = 2
+    sink.display(image, [(0, 1, 3, 3)])
+    device.command.assert_called_once_with(0x21, 5, 5, 0x22, 0, 1)
+    device.data.assert_called_once_with([0, 1 << 1])
+
+    # falls back to full frames when the device transforms images
+    device.display.reset_mock()
+    device.rotate = 1
+    sink.display(image, [(1, 1, 2, 4)])
+    device.display.assert_called_once_with(image)
+
+    # falls back to full frames when most of the display changed
+    device.display.reset_mock()
+    device.command.reset_mock()
+    device.rotate = 0
+    sink.display(image, [(0, 4, 0, 127)])
+    device.display.assert_called_once_with(image)
+    device.command.assert_not_called()
+
+    # falls back to full frames when the column start of the device is unknown
+    device.display.reset_mock()
+    del device._colstart
+    sink.display(image, [(1, 1, 2, 4)])
+    device.display.assert_called_once_with(image)
+    device.command.assert_not_called()
+
+    # falls back to full frames when the device can't write data directly
+    device.display.reset_mock()
+    device._colstart = 0
+    del device.data
+    sink.display(image, [(1, 1, 2, 4)])
+    device.display.assert_called_once_with(image)
+
+
+def test_ssd1306_display_sink_needs_ssd1306_device(device, mocker):
+    from pt_miniscreen.core.display import SSD1306DisplaySink
+
+    image = Image.new("1", (128, 64))
+
+    # devices that are not luma ssd1306 devices are sent full frames
+    mocker.patch.dict(modules, {"luma.oled.device": MagicMock(ssd1306=MagicMock)})
+    SSD1306DisplaySink(device).display(image, [(1, 1, 2, 4)])
+    device.display.assert_called_once_with(image)
+    device.command.assert_not_called()
+
+    # as are all devices when luma is not installed
+    device.display.reset_mock()
+    mocker.patch.dict(modules, {"luma.oled.device": None})
+    SSD1306DisplaySink(device).display(image, [(1, 1, 2, 4)])
+    device.display.assert_called_once_with(image)
+    device.command.assert_not_called()
+
+
+def test_app_sends_changed_regions(device):
+    from pt_miniscreen.core import App, Component
+    from pt_miniscreen.core.display import SSD1306DisplaySink
+
+    class Root(Component):
+        default_state = {"spot": (0, 0)}
+
+        def render(self, image):
+            ImageDraw.Draw(image).point(self.state["spot"], fill=1)
+            return image
+
+    app = App(
+        display=device.display,
+        display_sink=SSD1306DisplaySink(device),
+        Root=Root,
+    )
+
+    # the first frame is sent in full
+    app.start()
+    device.display.assert_called_once()
+    device.command.assert_not_called()
+
+    # only the changed region is sent after that
+    app.root.state.update({"spot": (10, 20)})
+    device.display.assert_called_once()
+    assert device.command.call_args_list == [
+        call(0x21, 0, 0, 0x22, 0, 0),
+        call(0x21, 10, 10, 0x22, 2, 2),
+    ]
+
+    # nothing is sent when the displayed image is unchanged
+    device.command.reset_mock()
+    app.display()
+    device.command.assert_not_called()
+
+    # invalidating the display sends the next frame in full
+    app.invalidate_display()
+    app.display()
+    assert device.display.call_count == 2
+
+    app.stop()
@@ -0,0 +1,65 @@
+import pytest
+from PIL import Image, ImageDraw
+
+
+def create_spot_image(pos, size=(128, 64)):
+    image = Image.new("1", size)
+    image.putpixel(pos, 1)
+    return image
+
+
+def test_frame_is_immutable():
+    from pt_miniscreen.core.frame import Frame
+
+    frame = Frame.from_image(create_spot_image((0, 0)))
+
+    with pytest.raises(AttributeError):
+        frame.data = b""
+
+    with pytest.raises(AttributeError):
+        del frame.size
+
+
+def test_frame_equality():
+    from pt_miniscreen.core.frame import Frame
+
+    frame = Frame.from_image(create_spot_image((0, 0)))
+
+    # frames with the same pixels are equal and have the same hash
+    same_frame = Frame.from_image(create_spot_image((0, 0)))
+    assert frame == same_frame
+    assert hash(frame) == hash(same_frame)
+
+    # frames with different pixels are not equal
+    assert frame != Frame.from_image(create_spot_image((1, 1)))
+
+    # frames match images with the same pixels
+    assert frame.matches(create_spot_image((0, 0)))
+    assert not frame.matches(create_spot_image((1, 1)))
+    assert not frame.matches(None)
+
+
+def test_frame_image_is_shared(same_image):
+    from pt_miniscreen.core.frame import Frame
+
+    frame = Frame.from_image(create_spot_image((0, 0)))
+
+    # the same read-only image is returned every time
+    image = frame.image
+    assert image.readonly
+    assert frame.image is image
+    assert same_image(image, create_spot_image((0, 0)))
+    assert frame.matches(image)
+
+    # to_image returns a new image that can be drawn on
+    copy = frame.to_image()
+    assert copy is not image
+    assert not copy.readonly
+    ImageDraw.Draw(copy).point((1, 1), fill=1)
+    assert not frame.matches(copy)
+    assert same_image(frame.image, create_spot_image((0, 0)))
+
+    # drawing on the shared image without copying it doesn't change the frame
+    ImageDraw.Draw(image).point((1, 1), fill=1)
+    assert frame.image is not image
+    assert same_image(frame.image, create_spot_image((0, 0)))
@@ -0,0 +1,43 @@
+from os import path
+
+from PIL import Image
+
+images_dir = f"{path.dirname(path.realpath(__file__))}/images"
+
+
+def test_decode_frames():
+    from pt_miniscreen.core.image_cache import decode_frames
+
+    image_path = f"{images_dir}/test.gif"
+    image_frames = decode_frames(image_path, size=(16, 16))
+
+    # every frame is resized and converted the same way paste would
+    with Image.open(image_path) as source:
+        assert len(image_frames.frames) == source.n_frames
+        for index, frame in enumerate(image_frames.frames):
+            source.seek(index)
+            expected = source.resize((16, 16), Image.BICUBIC).convert("1")
+            assert frame.image.tobytes() == expected.tobytes()
+            assert image_frames.durations[index] == source.info["duration"]
+
+
+def test_cache_shares_frames_and_evicts():
+    from pt_miniscreen.core.image_cache import ImageFrameCache, get_frames_bytes
+
+    gif_path = f"{images_dir}/test.gif"
+    png_path = f"{images_dir}/test-1.png"
+
+    # frames are decoded once and shared while cached
+    cache = ImageFrameCache()
+    image_frames = cache.get(gif_path)
+    assert cache.get(gif_path) is image_frames
+    assert cache.get(gif_path, size=(10, 10)) is not image_frames
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 2
+
+    # least recently used frames are evicted to stay within budget
+    cache = ImageFrameCache(max_bytes=get_frames_bytes(image_frames))
+    cache.get(gif_path)
+    cache.get(png_path)
+    assert cache.stats["evictions"] == 1
+    assert cache.stats["bytes"] <= cache.max_bytes
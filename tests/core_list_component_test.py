@@ -59,6 +59,15 @@ def NumberedRow():
     return NumberedRow
 
 
+@pytest.fixture
+def BindableRow(NumberedRow):
+    class BindableRow(NumberedRow):
+        def bind(self, text):
+            self.state.update({"text": text})
+
+    return BindableRow
+
+
 @pytest.fixture
 def create_rows(ImageRow, CheckeredRow):
     def create_rows(length, row_types=[ImageRow, CheckeredRow]):
@@ -584,6 +593,38 @@ def test_virtual_list_scrolling_animation(
     snapshot.assert_match(render(component), "scroll-up-3.png")
 
 
+def test_scrolling_draws_rows_into_strip_once(
+    mocker, create_list, create_rows, render, get_test_image_path
+):
+    from pt_miniscreen.core.components import List
+
+    def slow_transition(distance, duration):
+        for _ in range(4):
+            yield ceil(distance / 4)
+
+    mocker.patch(
+        "pt_miniscreen.core.components.list.transition", side_effect=slow_transition
+    )
+    render_rows = mocker.spy(List, "_render_rows")
+
+    component = create_list(
+        Rows=create_rows(3), num_visible_rows=2, use_snapshot_when_scrolling=False
+    )
+    render(component)
+    assert render_rows.call_count == 1
+
+    # every step of the transition crops the strip drawn when it started, and
+    # the strip drawn once it ended
+    component.scroll_down()
+    sleep(0.1)
+    assert render_rows.call_count == 3
+
+    # strip is drawn again when a row rerenders
+    component.rows[2].state.update({"image_path": get_test_image_path("test-2.png")})
+    render(component)
+    assert render_rows.call_count == 4
+
+
 def test_scroll_with_distance_parameter(
     create_list,
     create_numbered_rows,
@@ -997,3 +1038,86 @@ def test_row_cleanup_after_scrolling(create_list, create_rows, get_test_image_pa
     # rows that are scrolled out of view are cleaned up at the next garbage collection
     gc.collect()
     assert row() is None
+
+
+def test_virtual_list_recycles_rows(mocker, create_list, BindableRow, render):
+    from pt_miniscreen.core.components import List
+
+    Rows = [partial(BindableRow, text=f"{i + 1}") for i in range(100)]
+    create_child = mocker.spy(List, "create_child")
+    component = create_list(Rows=Rows, num_visible_rows=3, virtual=True)
+    render(component)
+    assert create_child.call_count == 3
+
+    # rows scrolled out of view are rebound to the rows scrolled into view
+    for _ in range(10):
+        component.scroll_down(animate=False)
+
+    component.scroll_down(distance=2)
+    sleep(0.3)
+    component.scroll_up()
+    sleep(0.3)
+
+    assert [row.state["text"] for row in component.rows] == ["12", "13", "14"]
+    assert create_child.call_count == 5
+    assert len(component._children) == 5
+
+    # rows are rebound when the list's rows are updated
+    component.update_rows([partial(BindableRow, text=text) for text in "abcdef"])
+    assert [row.state["text"] for row in component.rows] == ["a", "b", "c"]
+    assert create_child.call_count == 5
+    assert len(component._children) == 3
+
+
+def test_virtual_list_scrolls_while_rendering(create_list, BindableRow):
+    import sys
+    from threading import Event, Thread
+
+    Rows = [partial(BindableRow, text=f"{i + 1}") for i in range(40)]
+    component = create_list(
+        Rows=Rows, num_visible_rows=8, virtual=True, transition_duration=0.01
+    )
+    component.render(Image.new("1", (128, 64)))
+
+    # rows read for a render are unaffected by rows being added and removed
+    rows = component._get_rows_needed_for_render()
+    for row in rows:
+        component.rows.append(component.rows.popleft())
+    assert len(rows) == 8
+
+    # render continuously while the transition thread adds and removes rows,
+    # switching threads often so rows change while a render reads them
+    stop_rendering = Event()
+    errors = []
+
+    # alternate the images rendered on so the list's cached output isn't used
+    images = [Image.new("1", (128, 64)), Image.new("1", (128, 64), 1)]
+
+    def render_until_stopped():
+        while not stop_rendering.is_set():
+            try:
+                images.reverse()
+                component.render(images[0].copy())
+            except Exception as e:
+                errors.append(e)
+                return
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        render_thread = Thread(target=render_until_stopped, daemon=True)
+        render_thread.start()
+
+        for _ in range(20):
+            component.scroll_down(distance=8)
+            sleep(0.03)
+            component.scroll_up(distance=8)
+            sleep(0.03)
+
+        stop_rendering.set()
+        render_thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert errors == []
+    assert len(component.rows) == 8
@@ -0,0 +1,149 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from PIL import Image
+
+
+@pytest.fixture
+def profiler():
+    from pt_miniscreen.core.profiler import (
+        disable_render_profiler,
+        enable_render_profiler,
+    )
+
+    yield enable_render_profiler()
+    disable_render_profiler()
+
+
+@pytest.fixture
+def Counter():
+    from PIL import ImageDraw
+
+    from pt_miniscreen.core import Component
+
+    class Counter(Component):
+        default_state = {"count": 0}
+
+        def render(self, image):
+            ImageDraw.Draw(image).point((self.state["count"], 0), fill=1)
+            return image
+
+    return Counter
+
+
+def test_records_renders(profiler, create_component, Counter):
+    component = create_component(Counter)
+
+    # renders and cache hits of the input are recorded
+    component.render(Image.new("1", (10, 10)))
+    component.render(Image.new("1", (10, 10)))
+    stats = profiler.get_stats(component)
+    assert stats["renders"] == 1
+    assert stats["cache_hits"] == 1
+    assert stats["cache_hit_ratio"] == 0.5
+    assert stats["max_time"] > 0
+
+    # reconciles and whether they changed the output are recorded
+    component.state.update({"count": 1})
+    component.state.update({"count": 1, "other": True})
+    stats = profiler.get_stats(component)
+    assert stats["renders"] == 3
+    assert stats["reconciles"] == 2
+    assert stats["unchanged_reconciles"] == 1
+
+    # stats are summed for each class
+    create_component(Counter).render(Image.new("1", (10, 10)))
+    assert profiler.class_stats["Counter"]["renders"] == 4
+
+
+def test_tree_and_export(profiler, create_component, Counter, tmp_path):
+    from pt_miniscreen.core import Component
+
+    class Parent(Component):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.counter = self.create_child(Counter)
+            self.hidden_counter = self.create_child(Counter)
+
+        def render(self, image):
+            return self.counter.render(image)
+
+    component = create_component(Parent)
+    component.render(Image.new("1", (10, 10)))
+
+    # tree shows the stats of each component below its parent
+    lines = profiler.format_tree(component).split("\n")
+    assert lines[0].startswith("Parent renders=1 ")
+    assert lines[1].startswith("  Counter renders=1 ")
+    assert lines[2] == "  Counter not rendered"
+
+    # summaries are appended to the file as json lines
+    file_path = tmp_path / "profile.jsonl"
+    profiler.export(file_path)
+    profiler.export(file_path)
+    summaries = [json.loads(line) for line in file_path.read_text().splitlines()]
+    assert len(summaries) == 2
+    assert summaries[0]["classes"]["Parent"]["renders"] == 1
+
+
+def test_app_profiling(monkeypatch, tmp_path, Counter, caplog):
+    from pt_miniscreen.core import App
+    from pt_miniscreen.core.profiler import (
+        disable_render_profiler,
+        get_render_profiler,
+    )
+
+    file_path = tmp_path / "profile.jsonl"
+    monkeypatch.setenv("PT_MINISCREEN_PROFILE", "1")
+    monkeypatch.setenv("PT_MINISCREEN_PROFILE_FILE", str(file_path))
+
+    try:
+        app = App(display=MagicMock(), Root=Counter)
+        app.start()
+        assert get_render_profiler() is not None
+
+        # profile tree is logged on demand
+        with caplog.at_level("INFO"):
+            app.log_render_profile()
+
+        assert "Counter renders=1" in caplog.text
+
+        # a summary is exported when the app stops
+        app.stop()
+        assert len(file_path.read_text().splitlines()) == 2
+    finally:
+        disable_render_profiler()
+
+
+def test_app_profiling_signal(monkeypatch, profiler, Counter, caplog):
+    import os
+    import signal
+    from time import sleep
+
+    from pt_miniscreen.core import App
+
+    monkeypatch.setenv("PT_MINISCREEN_PROFILE", "1")
+    previous_handler = signal.signal(signal.SIGUSR1, signal.SIG_IGN)
+
+    try:
+        app = App(display=MagicMock(), Root=Counter)
+        app.start()
+
+        # the profile is logged by another thread so a signal received while
+        # the profiler lock is held doesn't deadlock
+        with caplog.at_level("INFO"):
+            with profiler._lock:
+                os.kill(os.getpid(), signal.SIGUSR1)
+                sleep(0.1)
+                assert "Render profile" not in caplog.text
+
+            sleep(0.1)
+
+        assert "Counter renders=1" in caplog.text
+
+        # the previous handler is restored when the app stops
+        app.stop()
+        assert signal.getsignal(signal.SIGUSR1) == signal.SIG_IGN
+    finally:
+        signal.signal(signal.SIGUSR1, previous_handler)
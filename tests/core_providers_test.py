@@ -0,0 +1,271 @@
+from time import sleep
+from unittest.mock import Mock
+
+import pytest
+
+
+@pytest.fixture
+def registry():
+    from pt_miniscreen.core.providers import ProviderRegistry
+
+    return ProviderRegistry()
+
+
+@pytest.fixture
+def Subscriber():
+    from pt_miniscreen.core.timer_wheel import ActiveEvent
+
+    class Subscriber:
+        def __init__(self, active=True):
+            self.values = []
+            self.active_event = ActiveEvent()
+            if active:
+                self.active_event.set()
+
+        def on_value(self, value):
+            self.values.append(value)
+
+    return Subscriber
+
+
+def test_shares_fetches_between_subscribers(registry, Subscriber):
+    fetch = Mock(return_value="value")
+    registry.register("key", fetch, period=0.2)
+
+    subscribers = [Subscriber() for _ in range(5)]
+    for subscriber in subscribers:
+        registry.subscribe("key", subscriber.on_value, subscriber.active_event)
+
+    # fetches once per period for all subscribers
+    sleep(0.1)
+    assert fetch.call_count == 1
+    for subscriber in subscribers:
+        assert subscriber.values == ["value"]
+
+    # subscribers are only called when the value changes, the timer wheel is
+    # driven by the wall clock so allow an extra fetch
+    sleep(0.2)
+    assert 2 <= fetch.call_count <= 3
+    for subscriber in subscribers:
+        assert subscriber.values == ["value"]
+
+    fetch.return_value = "new value"
+    sleep(0.2)
+    for subscriber in subscribers:
+        assert subscriber.values == ["value", "new value"]
+
+
+def test_first_fetch_is_immediate(registry, Subscriber):
+    fetch = Mock(return_value="value")
+    registry.register("key", fetch, period=10)
+
+    # the first subscriber does not wait a period for a value
+    subscriber = Subscriber()
+    subscription = registry.subscribe(
+        "key", subscriber.on_value, subscriber.active_event
+    )
+    sleep(0.05)
+    fetch.assert_called_once()
+    assert subscriber.values == ["value"]
+
+    # subscribing again while the value is fresh does not fetch again
+    subscription.unsubscribe()
+    sleep(0.05)
+    resubscriber = Subscriber()
+    registry.subscribe("key", resubscriber.on_value, resubscriber.active_event)
+    sleep(0.05)
+    fetch.assert_called_once()
+    assert resubscriber.values == ["value"]
+
+
+def test_cached_value(registry, Subscriber):
+    fetch = Mock(return_value="value")
+    registry.register("key", fetch, period=0.2)
+
+    subscriber = Subscriber()
+    registry.subscribe("key", subscriber.on_value, subscriber.active_event)
+    sleep(0.1)
+
+    # new subscribers receive a fresh cached value without fetching
+    late_subscriber = Subscriber()
+    registry.subscribe("key", late_subscriber.on_value, late_subscriber.active_event)
+    assert late_subscriber.values == ["value"]
+    assert fetch.call_count == 1
+    assert registry.get("key").value == "value"
+
+
+def test_pauses_without_active_subscribers(registry, Subscriber):
+    fetch = Mock(return_value="value")
+    registry.register("key", fetch, period=0.2)
+
+    subscriber = Subscriber(active=False)
+    registry.subscribe("key", subscriber.on_value, subscriber.active_event)
+
+    # does not fetch while no subscriber is active
+    sleep(0.5)
+    fetch.assert_not_called()
+
+    # fetches as soon as a subscriber becomes active
+    subscriber.active_event.set()
+    sleep(0.1)
+    fetch.assert_called_once()
+    assert subscriber.values == ["value"]
+
+
+def test_unsubscribe(registry, Subscriber):
+    fetch = Mock(return_value="value")
+    registry.register("key", fetch, period=0.1)
+
+    subscriber = Subscriber()
+    subscription = registry.subscribe(
+        "key", subscriber.on_value, subscriber.active_event
+    )
+    sleep(0.15)
+    subscription.unsubscribe()
+    fetch.reset_mock()
+
+    # stops fetching when nothing is subscribed
+    sleep(0.3)
+    fetch.assert_not_called()
+
+    # subscriptions don't keep subscribers alive
+    registry.subscribe("key", Subscriber().on_value)
+    sleep(0.3)
+    assert registry.get("key").metrics["subscribers"] == 0
+
+
+def test_errors_and_timeouts(registry, Subscriber):
+    from pt_miniscreen.core.providers import UnknownProviderException
+
+    # raises when subscribing to unknown keys
+    with pytest.raises(UnknownProviderException):
+        registry.subscribe("unknown", Subscriber().on_value)
+
+    # errors keep the cached value
+    fetch = Mock(side_effect=Exception("failed"))
+    provider = registry.register("failing", fetch, period=0.1, initial_value="cached")
+    subscriber = Subscriber()
+    registry.subscribe("failing", subscriber.on_value, subscriber.active_event)
+    sleep(0.05)
+    assert provider.errors == 1
+    assert provider.value == "cached"
+    assert subscriber.values == []
+
+    # fetches that take longer than the timeout deliver their value late
+    def slow_fetch():
+        sleep(0.3)
+        return "slow value"
+
+    provider = registry.register("slow", slow_fetch, period=0.2, timeout=0.05)
+    registry.subscribe("slow", subscriber.on_value, subscriber.active_event)
+    sleep(0.1)
+    assert provider.timeouts == 1
+    assert provider.value is None
+    assert subscriber.values == []
+
+    # no other fetch is started while the slow fetch is running
+    sleep(0.25)
+    assert provider.fetches == 1
+    assert provider.value == "slow value"
+    assert subscriber.values == ["slow value"]
+
+
+def test_slow_fetches_do_not_block_workers(Subscriber):
+    from pt_miniscreen.core.providers import ProviderRegistry
+
+    registry = ProviderRegistry(workers=1)
+    subscriber = Subscriber()
+
+    # a fetch that blocks for longer than its timeout
+    registry.register("blocking", lambda: sleep(1), period=0.05, timeout=0.05)
+    registry.subscribe("blocking", subscriber.on_value, subscriber.active_event)
+
+    # other providers keep fetching on the only worker
+    fetch = Mock(return_value="value")
+    registry.register("fast", fetch, period=0.05)
+    registry.subscribe("fast", subscriber.on_value, subscriber.active_event)
+    sleep(0.5)
+    assert fetch.call_count >= 5
+    assert registry.get("blocking").timeouts == 1
+
+
+def test_text_provider(create_component, render):
+    from pt_miniscreen.core.components.text import Text
+    from pt_miniscreen.core.providers import register_provider
+
+    fetch = Mock(return_value="provided")
+    register_provider("test_text", fetch, period=0.2)
+
+    # components using the same provider share fetches
+    first_text = create_component(Text, text="initial", text_provider="test_text")
+    second_text = create_component(Text, text="initial", text_provider="test_text")
+    assert first_text.state["text"] == "initial"
+
+    sleep(0.1)
+    fetch.assert_called_once()
+    assert first_text.state["text"] == "provided"
+    assert second_text.state["text"] == "provided"
+
+    # cleaning up components unsubscribes them
+    first_text._cleanup()
+    second_text._cleanup()
+    sleep(0.1)
+    fetch.reset_mock()
+    sleep(0.3)
+    fetch.assert_not_called()
+
+
+def test_text_provider_select_text(create_component):
+    from pt_miniscreen.core.components.text import Text
+    from pt_miniscreen.core.providers import register_provider
+
+    fetch = Mock(return_value={"ssid": "network", "ip_address": "1.2.3.4"})
+    register_provider("test_status", fetch, period=0.2)
+
+    # each component shows the part of the value it selects
+    ssid_text = create_component(
+        Text, text_provider="test_status", select_text=lambda status: status["ssid"]
+    )
+    ip_text = create_component(
+        Text,
+        text_provider="test_status",
+        select_text=lambda status: status["ip_address"],
+    )
+
+    sleep(0.1)
+    fetch.assert_called_once()
+    assert ssid_text.state["text"] == "network"
+    assert ip_text.state["text"] == "1.2.3.4"
+
+    ssid_text._cleanup()
+    ip_text._cleanup()
+
+
+def test_select_and_publish(registry, Subscriber):
+    fetch = Mock(return_value={"first": 1, "second": 2})
+    provider = registry.register("key", fetch, period=10)
+
+    # subscribers are inactive so the provider does not fetch
+    first = Subscriber(active=False)
+    second = Subscriber(active=False)
+    registry.subscribe(
+        "key", first.on_value, first.active_event, select=lambda value: value["first"]
+    )
+    registry.subscribe(
+        "key",
+        second.on_value,
+        second.active_event,
+        select=lambda value: value["second"],
+    )
+
+    # published values are delivered without fetching
+    provider.publish({"first": 1, "second": 2})
+    assert first.values == [1]
+    assert second.values == [2]
+    assert provider.value == {"first": 1, "second": 2}
+
+    # subscribers are only called when the part they select changes
+    provider.publish({"first": 1, "second": 3})
+    assert first.values == [1]
+    assert second.values == [2, 3]
+    fetch.assert_not_called()
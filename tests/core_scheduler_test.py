@@ -0,0 +1,202 @@
+import threading
+from time import sleep
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def scheduler():
+    from pt_miniscreen.core.scheduler import RenderScheduler
+
+    scheduler = RenderScheduler(MagicMock(), max_fps=10)
+    yield scheduler
+    scheduler.stop()
+
+
+def test_renders_on_render_thread(scheduler):
+    render_threads = []
+    scheduler._render.side_effect = lambda: render_threads.append(
+        threading.current_thread()
+    )
+    scheduler.start()
+
+    # does not render until invalidated
+    sleep(0.2)
+    scheduler._render.assert_not_called()
+
+    # renders once per invalidation on the render thread
+    scheduler.invalidate()
+    sleep(0.05)
+    scheduler._render.assert_called_once()
+    assert render_threads == [scheduler._thread]
+    assert scheduler.stats == {
+        "frames_rendered": 1,
+        "invalidations_coalesced": 0,
+        "dropped_ticks": 0,
+    }
+
+
+def test_coalesces_invalidations(scheduler):
+    scheduler.start()
+    scheduler.invalidate()
+    sleep(0.12)
+
+    # invalidations before the next tick are rendered once
+    for _ in range(5):
+        scheduler.invalidate()
+
+    sleep(0.02)
+    scheduler._render.assert_called_once()
+    sleep(0.1)
+    assert scheduler._render.call_count == 2
+    assert scheduler.frames_rendered == 2
+    assert scheduler.invalidations_coalesced == 4
+
+
+def test_limits_frame_rate(scheduler):
+    scheduler.start()
+
+    for _ in range(20):
+        scheduler.invalidate()
+        sleep(0.01)
+
+    # 200ms at 10 fps is enough time for 2 or 3 frames
+    assert scheduler.frames_rendered <= 3
+
+
+def test_counts_dropped_ticks(scheduler):
+    scheduler._render.side_effect = lambda: sleep(0.25)
+    scheduler.start()
+    scheduler.invalidate()
+    sleep(0.4)
+
+    # two ticks passed while rendering
+    assert scheduler.dropped_ticks == 2
+
+
+def test_stop(scheduler):
+    scheduler.start()
+    scheduler.invalidate()
+    sleep(0.15)
+    scheduler._render.assert_called_once()
+
+    # renders a pending invalidation before stopping
+    scheduler.invalidate()
+    scheduler.stop()
+    assert scheduler._render.call_count == 2
+    assert not scheduler.is_running
+
+    # does not render after being stopped
+    scheduler.invalidate()
+    sleep(0.05)
+    assert scheduler._render.call_count == 2
+
+    # stopping again does not render the invalidation
+    scheduler.stop()
+    assert scheduler._render.call_count == 2
+
+
+def test_passes_render_errors_to_on_error():
+    from pt_miniscreen.core.scheduler import RenderScheduler
+
+    error = BrokenPipeError()
+    on_error = MagicMock(side_effect=lambda e: scheduler.stop())
+    scheduler = RenderScheduler(
+        MagicMock(side_effect=error), max_fps=10, on_error=on_error
+    )
+    scheduler.start()
+
+    # errors raised on the render thread are passed to on_error, which can stop
+    # the scheduler from the render thread
+    scheduler.invalidate()
+    sleep(0.15)
+    on_error.assert_called_once_with(error)
+    assert not scheduler.is_running
+
+    # errors rendering the last frame when stopping are also passed on
+    scheduler.start()
+    scheduler.invalidate()
+    scheduler.stop()
+    assert on_error.call_count == 2
+
+
+def test_ticks_animation_clock():
+    from pt_miniscreen.core.animation import AnimationClock
+    from pt_miniscreen.core.scheduler import RenderScheduler
+
+    clock = AnimationClock()
+    scheduler = RenderScheduler(MagicMock(), max_fps=10, animation_clock=clock)
+    tick = MagicMock(wraps=clock.tick)
+    clock.tick = tick
+
+    # clock follows the scheduler's frame rate while it runs
+    scheduler.start()
+    assert clock.is_driven
+    assert clock.frame_interval == scheduler.frame_interval
+
+    # clock is ticked once each frame
+    scheduler.invalidate()
+    sleep(0.15)
+    tick.assert_called_once()
+
+    scheduler.stop()
+    assert not clock.is_driven
+
+
+def test_app_with_max_fps():
+    from PIL import ImageDraw
+
+    from pt_miniscreen.core import App, Component
+
+    class Root(Component):
+        default_state = {"spot": 0}
+
+        def render(self, image):
+            ImageDraw.Draw(image).point((self.state["spot"], 0), fill=1)
+            return image
+
+    display = MagicMock()
+    app = App(display=display, Root=Root, max_fps=10)
+    app.start()
+    display.assert_called_once()
+
+    # rerenders are coalesced and displayed on the render thread
+    for spot in range(1, 5):
+        app.root.state.update({"spot": spot})
+
+    assert display.call_count == 1
+    sleep(0.15)
+    assert display.call_count == 2
+    assert app.render_stats["frames_rendered"] == 1
+    assert app.render_stats["invalidations_coalesced"] == 3
+
+    app.stop()
+
+
+def test_app_stops_when_render_fails():
+    from PIL import ImageDraw
+
+    from pt_miniscreen.core import App, Component
+
+    class Root(Component):
+        default_state = {"spot": 0}
+
+        def render(self, image):
+            ImageDraw.Draw(image).point((self.state["spot"], 0), fill=1)
+            return image
+
+    error = BrokenPipeError()
+    display = MagicMock()
+    app = App(display=display, Root=Root, max_fps=10)
+    app.start()
+
+    # errors displaying scheduled frames stop the app with the error
+    display.side_effect = error
+    app.root.state.update({"spot": 1})
+    sleep(0.15)
+    with pytest.raises(BrokenPipeError):
+        app.wait_for_stop()
+
+    assert app.root is None
+    assert not app._render_scheduler.is_running
@@ -1,5 +1,6 @@
 import gc
 from functools import partial
+from threading import Thread
 from time import sleep
 from weakref import ref
 
@@ -421,6 +422,51 @@ def test_virtual_selectable_lists_select_next_and_previous_without_animation(
     assert_select_previous_row_selects_row(component, 1, animate_scroll=False)
 
 
+def test_virtual_selectable_lists_render_while_removing_rows(
+    create_selectable_list, create_numbered_rows, render
+):
+    component = create_selectable_list(
+        Rows=create_numbered_rows(10), num_visible_rows=3, virtual=True
+    )
+
+    # render component so transitions are run
+    render(component)
+
+    # render from another thread straight after rows are removed at the end of
+    # the transition, before the transition state would have been reset. The
+    # input image is new so the cached output isn't used
+    renders = []
+    errors = []
+
+    def render_rows():
+        try:
+            renders.append(render(component, Image.new("1", (128, 64), 1)))
+        except Exception as e:
+            errors.append(e)
+
+    render_threads = []
+    remove_invisible_rows = component._remove_invisible_rows
+
+    def remove_invisible_rows_then_render():
+        remove_invisible_rows()
+        render_thread = Thread(target=render_rows)
+        render_thread.start()
+        render_thread.join(0.1)
+        render_threads.append(render_thread)
+
+    component._remove_invisible_rows = remove_invisible_rows_then_render
+    component.select_row(3)
+
+    sleep(0.5)
+    assert component.state["active_transition"] is None
+    for render_thread in render_threads:
+        render_thread.join()
+
+    # render waited until the rows and state were updated together
+    assert errors == []
+    assert renders == [render(component, Image.new("1", (128, 64), 1))]
+
+
 def test_select_before_render(
     create_selectable_list, create_numbered_rows, render, snapshot
 ):
@@ -473,3 +519,32 @@ def test_cleanup(parent, create_numbered_rows, render):
 
     # rows should be cleaned up
     assert row() is None
+
+
+def test_selection_inverts_row_without_rendering_it(
+    create_selectable_list, CheckeredRow
+):
+    from pt_miniscreen.core.utils import invert
+
+    render_counts = []
+
+    class CountedRow(CheckeredRow):
+        def render(self, image):
+            render_counts.append(self)
+            return super().render(image)
+
+    component = create_selectable_list(Rows=[CountedRow] * 3)
+    image = component.render(Image.new("1", (128, 64)))
+    initial_render_count = len(render_counts)
+
+    # moving the selection inverts the new row instead of rendering rows again
+    component.select_next_row(animate_scroll=False)
+    selected_image = component.render(Image.new("1", (128, 64)))
+    assert len(render_counts) == initial_render_count
+    assert selected_image.tobytes() != image.tobytes()
+
+    # selected row is the inverted output of the row
+    row = component.rows[1]
+    box = (0, row.height, row.width, row.height * 2)
+    row_image = row.render(Image.new("1", row.size))
+    assert selected_image.crop(box).tobytes() == invert(row_image).tobytes()
@@ -22,7 +22,7 @@ def Counter():
             )
 
         def on_state_change(self, previous_state):
-            if previous_state["count"] != self.state["count"]:
+            if "count" in previous_state:
                 self.count_text.state.update({"text": str(self.state["count"])})
 
         def render(self, image):
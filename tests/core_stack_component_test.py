@@ -248,6 +248,56 @@ def test_transition_animations(
     snapshot.assert_match(render(component), "pop-last-3.png")
 
 
+def test_transitions_reuse_cached_page_output(
+    mocker, create_stack, render, get_test_image_path
+):
+    from pt_miniscreen.core.components import Image as ImageComponent
+
+    def stepped_transition(distance, duration):
+        for _ in range(4):
+            sleep(0.05)
+            yield ceil(distance / 4)
+
+    mocker.patch(
+        "pt_miniscreen.core.components.stack.transition",
+        side_effect=stepped_transition,
+    )
+
+    render_counts = []
+
+    class CountedPage(ImageComponent):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs, image_path=get_test_image_path("test-1.png"))
+
+        def render(self, image):
+            render_counts.append(self)
+            return super().render(image)
+
+    component = create_stack(initial_stack=[CountedPage])
+    render(component)
+    assert len(render_counts) == 1
+
+    # pages are rendered once when the transition starts, every step of the
+    # transition pastes their cached output
+    update_state = mocker.spy(component.state, "update")
+    component.push(CountedPage)
+    sleep(0.3)
+    assert update_state.call_count > 4
+    assert len(render_counts) == 2
+
+    # pages that rerender during a transition are shown with their new output
+    component.push(CountedPage)
+    sleep(0.06)
+    page = component.stack[-1]
+    page.state.update({"image_path": get_test_image_path("test-2.png")})
+    sleep(0.06)
+    assert component.state["active_transition"] == "PUSH"
+    assert render_counts.count(page) == 2
+
+    sleep(0.2)
+    assert render(component) == render(page)
+
+
 def test_active_attributes(create_stack, ImagePage, CheckeredPage):
     # returns None when stack is empty
     component = create_stack()
@@ -0,0 +1,122 @@
+from itertools import product
+from os import path
+
+import pytest
+from PIL import Image, ImageDraw, ImageFont
+
+font_dir = f"{path.dirname(path.realpath(__file__))}/fonts"
+roboto_dir = f"{font_dir}/roboto"
+
+
+@pytest.fixture
+def font():
+    return ImageFont.truetype(f"{roboto_dir}/Roboto-Regular.ttf", size=14)
+
+
+def test_raster_matches_drawn_text(font):
+    from pt_miniscreen.core.text_cache import draw_text_raster, rasterise_text
+
+    for text, align, xy in product(
+        ["Text", "jagged", "multi-line\ntext"],
+        ["left", "center", "right"],
+        [(0, 0), (-7, 3), (20, -5)],
+    ):
+        anchor = "lt" if "\n" not in text else None
+
+        expected = Image.new("1", (64, 32))
+        ImageDraw.Draw(expected).text(
+            xy, text=text, font=font, fill=1, spacing=0, align=align, anchor=anchor
+        )
+
+        image = Image.new("1", (64, 32))
+        raster = rasterise_text(text, font, align=align, anchor=anchor)
+        draw_text_raster(image, raster, xy)
+
+        assert image.tobytes() == expected.tobytes()
+
+
+def test_cache_hits_and_evictions(font):
+    from pt_miniscreen.core.text_cache import TextRasterCache, get_mask_bytes
+
+    cache = TextRasterCache()
+
+    # rasters are reused while cached
+    raster = cache.get("Text", font)
+    assert cache.get("Text", font) is raster
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 1
+    assert cache.stats["bytes"] == get_mask_bytes(raster.mask)
+
+    # least recently used rasters are evicted to stay within budget
+    cache = TextRasterCache(max_bytes=get_mask_bytes(raster.mask) * 2)
+    first = cache.get("Text", font)
+    cache.get("Txet", font)
+    cache.get("Text", font)
+    cache.get("Tetx", font)
+    assert cache.stats["evictions"] == 1
+    assert cache.get("Text", font) is first
+    assert cache.stats["bytes"] <= cache.max_bytes
+
+    # rasters larger than the budget are not cached
+    cache = TextRasterCache(max_bytes=1)
+    cache.get("Text", font)
+    assert cache.stats["entries"] == 0
+
+
+def test_wrapped_text(font):
+    from pt_miniscreen.core.text_cache import TextMeasurementCache
+
+    cache = TextMeasurementCache()
+
+    def get_width(text):
+        return cache.get_text_size(text, font)[0]
+
+    def wrap_word_by_word(text, max_width):
+        lines = []
+        for word in text.split(" "):
+            if len(lines) and get_width(f"{lines[-1]} {word}") < max_width:
+                lines[-1] = f"{lines[-1]} {word}"
+            else:
+                lines.append(word)
+
+        return "\n".join(lines)
+
+    text = "Automatically wrapped text with a  double space,\nnewline and averylongword"
+    for max_width in [1, 30, 64, 100, 128, 1000]:
+        wrapped_text = cache.create_wrapped_text(text, font, max_width)
+        assert wrapped_text == wrap_word_by_word(text, max_width)
+
+    # wrapped text is cached
+    hits = cache.stats["hits"]
+    cache.create_wrapped_text(text, font, 64)
+    assert cache.stats["hits"] == hits + 1
+
+
+def test_measurement_cache_limits(font):
+    import gc
+    from weakref import ref
+
+    from pt_miniscreen.core.text_cache import TextMeasurementCache
+
+    cache = TextMeasurementCache(max_entries=2)
+
+    # measurements are shared and the number of entries is limited
+    size = cache.get_text_size("Text", font)
+    assert cache.get_text_size("Text", font) == size
+    cache.get_text_size("More", font)
+    cache.get_text_size("Even more", font)
+    assert cache.stats == {
+        "entries": 2,
+        "max_entries": 2,
+        "hits": 1,
+        "misses": 3,
+        "evictions": 1,
+    }
+
+    # fonts are not kept alive by the cache
+    other_font = ImageFont.truetype(f"{roboto_dir}/Roboto-Regular.ttf", size=20)
+    cache.get_text_size("Text", other_font)
+    font_ref = ref(other_font)
+    del other_font
+    gc.collect()
+    assert font_ref() is None
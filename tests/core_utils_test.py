@@ -16,3 +16,73 @@ from pt_miniscreen.core.utils import carousel
 def test_carousel_step(expected_iter, carousel_iter):
     for expected_value, output_value in zip(expected_iter, carousel_iter):
         assert expected_value == output_value
+
+
+def test_is_same_image():
+    from PIL import Image
+
+    from pt_miniscreen.core.utils import is_same_image
+
+    image = Image.new("1", (128, 64))
+
+    # images with the same content are the same
+    assert is_same_image(image, image)
+    assert is_same_image(image, Image.new("1", (128, 64)))
+
+    # images with different content are not the same
+    different_image = Image.new("1", (128, 64))
+    different_image.putpixel((10, 10), 1)
+    assert not is_same_image(image, different_image)
+
+    # images with the same raw data but a different size are not the same
+    assert not is_same_image(image, Image.new("1", (64, 128)))
+
+    # comparing with something that isn't an image is never the same
+    assert not is_same_image(image, None)
+    assert not is_same_image(None, None)
+
+
+def test_font_registry():
+    from os import path
+
+    from pt_miniscreen.core.utils import FontRegistry
+
+    font_path = path.join(
+        path.dirname(path.realpath(__file__)), "fonts/roboto/Roboto-Regular.ttf"
+    )
+    registry = FontRegistry()
+
+    # fonts are loaded once for each size and shared
+    font = registry.get(font_path, 12)
+    assert registry.get(font_path, 12) is font
+    assert registry.get(font_path, 14) is not font
+    assert registry.stats == {"fonts": 2, "hits": 1, "misses": 2}
+
+    # fonts that can't be loaded raise and are not stored
+    with pytest.raises(OSError):
+        registry.get("missing.ttf", 12)
+
+    assert registry.stats["fonts"] == 2
+
+
+def test_invert():
+    from PIL import Image, ImageDraw, ImageOps
+
+    from pt_miniscreen.core.utils import invert
+
+    image = Image.new("1", (30, 12))
+    ImageDraw.Draw(image).text((0, 0), "Text", fill=1)
+
+    # matches inverting through greyscale without leaving mode "1"
+    expected = ImageOps.invert(image.convert("L")).convert("1")
+    assert invert(image).mode == "1"
+    assert invert(image).tobytes() == expected.tobytes()
+
+    # only pixels in box are inverted and the original image is unchanged
+    original = image.tobytes()
+    inverted = invert(image, (3, 2, 20, 8))
+    assert image.tobytes() == original
+    for x in range(image.width):
+        for y in range(image.height):
+            inside = 3 <= x < 20 and 2 <= y < 8
+            assert (inverted.getpixel((x, y)) != image.getpixel((x, y))) == inside
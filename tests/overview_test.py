@@ -5,11 +5,12 @@ import pytest
 
 @pytest.fixture
 def battery():
-    from pt_miniscreen.pages.root.overview import battery
+    from pt_miniscreen.system_metrics import battery, get_system_metrics_sampler
 
     yield battery
 
     battery.reset()
+    get_system_metrics_sampler().publish_battery_state()
 
 
 @pytest.fixture
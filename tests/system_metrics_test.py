@@ -0,0 +1,93 @@
+import pytest
+
+
+@pytest.fixture
+def sampler(mocker):
+    from pt_miniscreen.core.providers import ProviderRegistry
+    from pt_miniscreen.system_metrics import SystemMetricsSampler
+    from tests.mocks.battery import Battery
+
+    cpu_percent = mocker.patch(
+        "pt_miniscreen.system_metrics.psutil.cpu_percent", return_value=[10, 20]
+    )
+    mocker.patch("pt_miniscreen.system_metrics.psutil.virtual_memory")
+    mocker.patch(
+        "pt_miniscreen.system_metrics.psutil.swap_memory",
+        side_effect=Exception("no swap"),
+    )
+
+    sampler = SystemMetricsSampler(
+        Battery(), period=0.1, history_length=3, registry=ProviderRegistry()
+    )
+    sampler.cpu_percent = cpu_percent
+    return sampler
+
+
+def test_primes_cpu_percent(sampler):
+    # cpu usage is measured from creation so the first sample isn't 0
+    sampler.cpu_percent.assert_called_once_with(interval=None, percpu=True)
+
+
+def test_samples_without_blocking(sampler):
+    sampler.cpu_percent.reset_mock()
+    sample = sampler.sample()
+
+    sampler.cpu_percent.assert_called_once_with(interval=None, percpu=True)
+    assert sample.cpu_percentages == [10, 20]
+
+    # metrics that can't be read are None
+    assert sample.swap_memory is None
+
+
+def test_last_sample_and_history(sampler):
+    # reading the last sample doesn't measure cpu usage
+    sampler.cpu_percent.reset_mock()
+    assert sampler.last_sample is None
+
+    sample = sampler.sample()
+    assert sampler.last_sample is sample
+    sampler.cpu_percent.assert_called_once()
+
+    # keeps a limited history of samples
+    for _ in range(5):
+        sampler.sample()
+
+    assert len(sampler.history) == 3
+
+
+def test_battery_state(sampler):
+    from pt_miniscreen.system_metrics import BatteryState
+
+    # the battery is read until a battery state has been published
+    assert sampler.battery_state == BatteryState(
+        capacity=73, is_charging=False, is_full=False
+    )
+
+    # then the published state is used without reading the battery
+    sampler.battery.is_charging = True
+    sampler.publish_battery_state()
+    sampler.battery.capacity = 50
+    assert sampler.battery_state == BatteryState(
+        capacity=73, is_charging=True, is_full=False
+    )
+
+
+def test_publishes_battery_state(sampler):
+    from pt_miniscreen.system_metrics import BatteryState
+
+    class Subscriber:
+        def __init__(self):
+            self.values = []
+
+        def on_battery_state(self, battery_state):
+            self.values.append(battery_state)
+
+    subscriber = Subscriber()
+    sampler._battery_provider.subscribe(subscriber.on_battery_state)
+
+    # battery events are delivered straight away
+    sampler.battery.is_charging = True
+    sampler.battery.when_charging()
+    assert subscriber.values == [
+        BatteryState(capacity=73, is_charging=True, is_full=False)
+    ]
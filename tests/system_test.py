@@ -18,18 +18,19 @@ def user(mocker):
 
 @pytest.fixture
 def battery():
-    from pt_miniscreen.pages.system.battery import battery
+    from pt_miniscreen.system_metrics import battery, get_system_metrics_sampler
 
     yield battery
 
     battery.reset()
+    get_system_metrics_sampler().publish_battery_state()
 
 
 @pytest.fixture
 def cpu_percent(mocker):
     def set_cpu_percent(cpu_percentages, interval=1):
         mocker.patch(
-            "pt_miniscreen.components.cpu_bars.cpu_percent",
+            "pt_miniscreen.system_metrics.psutil.cpu_percent",
             return_value=cpu_percentages,
         )
 
@@ -53,11 +54,11 @@ def memory(mocker):
 
     def set_memory(virtual, swap):
         mocker.patch(
-            "pt_miniscreen.pages.system.memory.psutil.virtual_memory",
+            "pt_miniscreen.system_metrics.psutil.virtual_memory",
             return_value=MockMemoryStats(total=999, used=virtual),
         )
         mocker.patch(
-            "pt_miniscreen.pages.system.memory.psutil.swap_memory",
+            "pt_miniscreen.system_metrics.psutil.swap_memory",
             return_value=MockMemoryStats(total=500, used=swap),
         )
 
@@ -254,6 +255,9 @@ def test_updates(miniscreen, snapshot, mocker):
         last_update_date_mock,
     )
 
+    # check for system updates every second instead of every 10 minutes
+    mocker.patch("pt_miniscreen.pages.system.last_update.SYSTEM_UPDATES_PERIOD", 1)
+
     # scroll to updates page
     miniscreen.down_button.release()
     sleep(1)